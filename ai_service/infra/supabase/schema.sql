@@ -45,6 +45,8 @@ CREATE TABLE IF NOT EXISTS issues (
 CREATE INDEX IF NOT EXISTS idx_feedback_items_status ON feedback_items(status);
 CREATE INDEX IF NOT EXISTS idx_feedback_items_source ON feedback_items(source);
 CREATE INDEX IF NOT EXISTS idx_issues_status ON issues(status);
+-- Draft list: filter by status, newest first, paginated
+CREATE INDEX IF NOT EXISTS idx_issues_status_created ON issues(status, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_issues_feedback_id ON issues(feedback_id);
 
 -- Enable Row Level Security (RLS)
@@ -3,19 +3,21 @@
 This agent takes classified feedback and writes a production-ready GitHub Issue spec.
 """
 
+import asyncio
+import json
 import logging
 from typing import Any, TypedDict
 from uuid import uuid4
 
 import structlog
-from langchain_core.messages import HumanMessage
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from langfuse import observe
 from langgraph.graph import END, StateGraph
-from openai import AsyncOpenAI
 
 from src.core.config import settings
+from src.services.llm_cache import get_llm_cache, make_cache_key
+from src.services.llm_client import get_llm_client, json_schema_response_format
+from src.services.llm_dispatcher import get_llm_dispatcher
+from src.services.spec_templates import get_spec_template_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -53,7 +55,7 @@ class SpecState(TypedDict):
 # ========================
 
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 
 class SpecResult(BaseModel):
@@ -91,21 +93,34 @@ class SpecResult(BaseModel):
     )
 
 
+class SpecDraftResult(BaseModel):
+    """Reduced output when the bucket template supplies the remaining fields."""
+
+    title: str = Field(
+        description="A concise, descriptive title for the GitHub Issue",
+        min_length=5,
+        max_length=100,
+    )
+    reproduction_steps: list[str] = Field(
+        description="Step-by-step instructions to reproduce the issue (for bugs)",
+        min_length=0,
+        max_length=10,
+    )
+
+
 # ========================
-# LLM Client Factory
+# LLM Dispatch
 # ========================
 
 
-def get_llm_client() -> AsyncOpenAI:
-    """Get configured OpenAI-compatible LLM client.
+# Attempts per request before falling back, re-prompting on invalid output
+LLM_MAX_ATTEMPTS = 3
 
-    Uses Ollama with qwen2.5-coder for local development.
-    """
-    return AsyncOpenAI(
-        base_url="http://localhost:11434/v1",
-        api_key="ollama",  # Dummy key for Ollama
-        model="qwen2.5-coder:3b",
-    )
+# Spec writing runs in the background and can wait for a batch to fill
+SPEC_LATENCY_BUDGET_MS = 10000
+
+# Output cap; a full spec with five criteria fits well within this
+SPEC_MAX_TOKENS = 800
 
 
 # ========================
@@ -113,31 +128,19 @@ def get_llm_client() -> AsyncOpenAI:
 # ========================
 
 
-SPEC_SYSTEM_PROMPT = """You are a Senior Product Manager and Technical Writer.
+SPEC_SYSTEM_PROMPT = """Turn classified user feedback into a GitHub Issue spec. Reply with JSON only.
 
-Your job is to transform categorized feedback into production-ready GitHub Issues.
-
-Guidelines:
-- **Title**: Be specific and actionable (e.g., "Fix login timeout on mobile Safari" not "Bug in login")
-- **Reproduction Steps**: For bugs, provide clear, numbered steps anyone can follow
-- **Components**: Identify affected code areas (auth, API, frontend, database, etc.)
-- **Acceptance Criteria**: Write measurable, testable criteria for resolution
-- **Labels**: Suggest GitHub labels based on type and severity
-
-For feature requests:
-- Focus on user stories and business value
-- Identify potential edge cases
-- Suggest implementation approach if helpful
-
-For questions:
-- Summarize what information is being asked
-- Suggest where to find the answer in documentation"""
+- title: specific and actionable ("Fix login timeout on mobile Safari", not "Bug in login")
+- reproduction_steps: numbered steps for bugs; empty for features and questions
+- affected_components: code areas such as auth, api, frontend, database
+- acceptance_criteria: measurable, testable conditions for resolution
+- suggested_labels: based on classification and severity
+- spec_confidence: 0.0-1.0"""
 
 
 SPEC_HUMAN_PROMPT = """Transform the following feedback into a GitHub Issue spec:
 
 ---
-Feedback ID: {feedback_id}
 Source: {source}
 Content: {content}
 ---
@@ -146,16 +149,182 @@ Classification: {classification} (confidence: {confidence:.2f})
 Severity: {severity}
 Reasoning: {reasoning}
 ---
+"""
+
 
-{format_instructions}
+SPEC_DRAFT_HUMAN_PROMPT = """Write only the title and reproduction steps for a GitHub Issue from the following feedback:
+
+---
+Source: {source}
+Content: {content}
+---
+
+Classification: {classification}
+Severity: {severity}
+---
 """
 
 
+# Response schemas are built once at import. They are enforced by the
+# server via response_format, so they stay out of the prompt.
+_SPEC_RESPONSE_FORMAT = json_schema_response_format(SpecResult)
+_SPEC_DRAFT_RESPONSE_FORMAT = json_schema_response_format(SpecDraftResult)
+
+
 # ========================
 # Agent Node
 # ========================
 
 
+async def _read_json_stream(stream: Any) -> str:
+    """Accumulate a streamed completion until its outer JSON object closes.
+
+    The stream is closed as soon as the closing brace arrives, so any
+    trailing tokens the model would still emit are never waited for.
+
+    Args:
+        stream: Async stream returned by chat.completions.create(stream=True)
+
+    Returns:
+        The completion text up to and including the outer closing brace
+    """
+    parts: list[str] = []
+    depth = 0
+    in_string = False
+    escaped = False
+
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+
+            for i, char in enumerate(delta):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    in_string = True
+                elif char == "{":
+                    depth += 1
+                elif char == "}":
+                    depth -= 1
+                    if depth == 0:
+                        parts.append(delta[: i + 1])
+                        return "".join(parts)
+
+            parts.append(delta)
+    finally:
+        await stream.close()
+
+    return "".join(parts)
+
+
+async def _generate(
+    human_prompt: str,
+    output_model: type[BaseModel],
+    response_format: dict[str, Any],
+    **fields: Any,
+) -> BaseModel:
+    """Run a spec prompt through the LLM cache and the LLM, then validate it.
+
+    Args:
+        human_prompt: User message template
+        output_model: Pydantic model the completion must match
+        response_format: Structured-output schema for output_model
+        **fields: Values for the prompt placeholders
+
+    Returns:
+        Parsed output model
+    """
+    # Format the prompt. The feedback ID is kept out of it so identical
+    # content produces identical cache keys.
+    user_content = human_prompt.format(**fields)
+
+    # Serve repeated prompts from the cache, skipping the LLM round-trip
+    cache = get_llm_cache()
+    cache_key = make_cache_key(
+        model="qwen2.5-coder:3b",
+        temperature=0.2,
+        messages=[SPEC_SYSTEM_PROMPT, user_content],
+    )
+    content = await cache.get(cache_key)
+    messages = [
+        {"role": "system", "content": SPEC_SYSTEM_PROMPT},
+        {"role": "user", "content": user_content},
+    ]
+    temperature = 0.2
+
+    # Re-prompt with the validation error when the output is malformed
+    for attempt in range(1, LLM_MAX_ATTEMPTS + 1):
+        if content is None:
+            # Initialize LLM client
+            llm = get_llm_client()
+
+            # Stream the structured output and stop at the closing brace. The
+            # dispatcher drains the stream so the concurrency slot covers
+            # the whole generation.
+            dispatcher = get_llm_dispatcher()
+            content = await dispatcher.submit(
+                llm,
+                latency_budget_ms=SPEC_LATENCY_BUDGET_MS,
+                consume=_read_json_stream,
+                messages=messages,
+                model="qwen2.5-coder:3b",
+                temperature=temperature,
+                max_tokens=SPEC_MAX_TOKENS,
+                response_format=response_format,
+                stream=True,
+            )
+
+        # Validate structured output
+        try:
+            result = output_model.model_validate_json(content)
+            break
+        except (ValidationError, json.JSONDecodeError) as e:
+            if attempt == LLM_MAX_ATTEMPTS:
+                raise
+            logger.warning(
+                "Invalid spec output, retrying",
+                attempt=attempt,
+                error=str(e),
+            )
+            messages = [
+                *messages,
+                {"role": "assistant", "content": content},
+                {
+                    "role": "user",
+                    "content": f"Your last response was invalid: {e}. Return only JSON matching the schema.",
+                },
+            ]
+            temperature = 0.0
+            content = None
+
+    # Only cache completions that parsed cleanly
+    await cache.set(cache_key, content)
+
+    return result
+
+
+# Title prefixes for the known classifications
+_CLASS_UPPER = {"bug": "BUG", "feature": "FEATURE", "question": "QUESTION"}
+
+
+def _title_prefix(classification: str) -> str:
+    """Return the bracketed title prefix for a classification."""
+    return _CLASS_UPPER.get(classification) or classification.upper()
+
+
+def _template_title(state: SpecState) -> str:
+    """Build an issue title directly from the feedback content."""
+    first_line = state["content"].strip().split("\n", 1)[0]
+    return f"[{_title_prefix(state['classification'])}] {first_line[:80]}"
+
+
 @observe(name="spec_writer.write")
 async def spec_writer_node(state: SpecState) -> dict[str, Any]:
     """Write a GitHub Issue spec from classified feedback.
@@ -172,39 +341,60 @@ async def spec_writer_node(state: SpecState) -> dict[str, Any]:
         classification=state["classification"],
     )
 
-    try:
-        # Initialize LLM client
-        llm = get_llm_client()
-
-        # Create prompt
-        parser = PydanticOutputParser(pydantic_object=SpecResult)
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", SPEC_SYSTEM_PROMPT),
-            ("human", SPEC_HUMAN_PROMPT),
-        ])
-
-        # Format the prompt
-        formatted_prompt = prompt.format_messages(
-            feedback_id=state["feedback_id"],
-            source=state["source"],
-            content=state["content"],
-            classification=state["classification"],
-            severity=state["severity"],
-            reasoning=state["reasoning"],
-            confidence=state["confidence"],
-            format_instructions=parser.get_format_instructions(),
-        )
+    classification = state["classification"]
+    severity = state["severity"]
 
-        # Call LLM with structured output
-        response = await llm.chat.completions.create(
-            messages=[HumanMessage(content=formatted_prompt[1].content)],
-            model="qwen2.5-coder:3b",
-            temperature=0.2,
-        )
-
-        # Parse structured output
-        result = parser.parse(response.choices[0].message.content)
+    try:
+        # Look up the structural template for this (classification, severity)
+        template_cache = get_spec_template_cache()
+        template = None
+        embedding = None
+        if template_cache is not None:
+            embedding = await template_cache.embed(state["content"])
+            template, similarity = template_cache.match(classification, severity, embedding)
+
+            # Near-identical feedback: reuse the template, re-slotting the title
+            if template is not None and similarity >= template_cache.similarity_threshold:
+                logger.info(
+                    "Spec template hit",
+                    feedback_id=state["feedback_id"],
+                    similarity=similarity,
+                )
+                return {**template, "title": _template_title(state)}
+
+        if template is not None:
+            # Only ask for the fields that vary; the rest come from the template
+            draft = await _generate(
+                SPEC_DRAFT_HUMAN_PROMPT,
+                SpecDraftResult,
+                _SPEC_DRAFT_RESPONSE_FORMAT,
+                source=state["source"],
+                content=state["content"],
+                classification=classification,
+                severity=severity,
+            )
+            result = SpecResult(
+                title=draft.title,
+                reproduction_steps=draft.reproduction_steps,
+                affected_components=template["affected_components"],
+                acceptance_criteria=template["acceptance_criteria"],
+                suggested_labels=template["suggested_labels"],
+                spec_confidence=template["spec_confidence"],
+            )
+        else:
+            result = await _generate(
+                SPEC_HUMAN_PROMPT,
+                SpecResult,
+                _SPEC_RESPONSE_FORMAT,
+                source=state["source"],
+                content=state["content"],
+                classification=classification,
+                severity=severity,
+                reasoning=state["reasoning"],
+                confidence=state["confidence"],
+            )
+            if template_cache is not None:
+                template_cache.update(classification, severity, embedding, result.model_dump())
 
         logger.info(
             "Spec written successfully",
@@ -230,7 +420,7 @@ async def spec_writer_node(state: SpecState) -> dict[str, Any]:
         )
         # Return safe defaults on error
         return {
-            "title": f"[{state['classification'].upper()}] {state['content'][:80]}",
+            "title": f"[{_title_prefix(state['classification'])}] {state['content'][:80]}",
             "reproduction_steps": [],
             "affected_components": ["unknown"],
             "acceptance_criteria": ["Verify the issue is resolved"],
@@ -314,7 +504,9 @@ async def write_spec(
         "spec_confidence": 0.0,
     }
 
-    result = await spec_graph.ainvoke(initial_state)
+    # The graph is a single node, so call it directly and skip LangGraph's
+    # per-invocation state handling; spec_graph remains for tooling and tests.
+    result = await spec_writer_node(initial_state)
 
     return SpecResult(
         title=result["title"],
@@ -324,3 +516,27 @@ async def write_spec(
         suggested_labels=result["suggested_labels"],
         spec_confidence=result["spec_confidence"],
     )
+
+
+async def batch_write_spec(
+    items: list[tuple[str, str, str, str, str, str, float]],
+    concurrency: int = 8,
+) -> list[SpecResult | BaseException]:
+    """Write specs for many classified feedback items concurrently.
+
+    Args:
+        items: Tuples of write_spec arguments
+            (feedback_id, content, source, classification, severity, reasoning, confidence)
+        concurrency: Maximum specs written at once
+
+    Returns:
+        One entry per item, in order; failures are returned as the exception
+        instead of aborting the batch
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(item: tuple[str, str, str, str, str, str, float]) -> SpecResult:
+        async with semaphore:
+            return await write_spec(*item)
+
+    return await asyncio.gather(*(_one(item) for item in items), return_exceptions=True)
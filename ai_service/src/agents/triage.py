@@ -6,19 +6,22 @@ This agent analyzes feedback and classifies it as:
 - question: A user inquiry that doesn't indicate a problem
 """
 
+import asyncio
+import json
 import logging
+import re
 from typing import Any, TypedDict
 from uuid import uuid4
 
 import structlog
-from langchain_core.messages import HumanMessage
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from langfuse import observe
 from langgraph.graph import END, StateGraph
-from openai import AsyncOpenAI
 
 from src.core.config import settings
+from src.services.llm_cache import get_llm_cache, make_cache_key
+from src.services.llm_client import get_llm_client, json_schema_response_format
+from src.services.llm_dispatcher import get_llm_dispatcher
+from src.services.semantic_cache import get_semantic_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -48,7 +51,7 @@ class TriageState(TypedDict):
 # ========================
 
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 
 class TriageResult(BaseModel):
@@ -74,20 +77,18 @@ class TriageResult(BaseModel):
 
 
 # ========================
-# LLM Client Factory
+# LLM Dispatch
 # ========================
 
 
-def get_llm_client() -> AsyncOpenAI:
-    """Get configured OpenAI-compatible LLM client.
+# Attempts per request before falling back, re-prompting on invalid output
+LLM_MAX_ATTEMPTS = 3
 
-    Uses Ollama with qwen2.5-coder for local development.
-    """
-    return AsyncOpenAI(
-        base_url="http://localhost:11434/v1",
-        api_key="ollama",  # Dummy key for Ollama
-        model="qwen2.5-coder:3b",
-    )
+# Triage sits on the webhook path, so it skips request batching
+TRIAGE_LATENCY_BUDGET_MS = 1000
+
+# Output cap; a triage result is four short fields
+TRIAGE_MAX_TOKENS = 400
 
 
 # ========================
@@ -95,36 +96,100 @@ def get_llm_client() -> AsyncOpenAI:
 # ========================
 
 
-TRIAGE_SYSTEM_PROMPT = """You are a Triage Agent for a software project.
+TRIAGE_SYSTEM_PROMPT = """Classify software user feedback. Reply with JSON only.
 
-Your job is to analyze incoming user feedback and classify it accurately.
+classification:
+- bug: something is broken, errors, or behaves unexpectedly
+- feature: asks for new functionality or an improvement
+- question: asks for help or information without reporting a problem
 
-Classification Rules:
-- **bug**: The feedback reports something that is broken, not working as expected, or producing errors.
-- **feature**: The feedback requests new functionality, improvements, or capabilities that don't exist.
-- **question**: The feedback is asking for help, clarification, or information without indicating a problem.
+severity:
+- critical: data loss, security hole, or total outage
+- high: major feature broken for many users, no workaround
+- medium: partially broken, workaround exists
+- low: minor or cosmetic
 
-Severity Guidelines:
-- **critical**: Data loss, security vulnerability, or complete system failure
-- **high**: Major feature broken, affects many users, workarounds unavailable
-- **medium**: Feature partially broken, affects some users, workaround exists
-- **low**: Minor issue, cosmetic, or easy to work around
-
-Output Requirements:
-Provide your classification with clear reasoning. Be confident but honest about uncertainty."""
+reasoning: one or two sentences. confidence: 0.0-1.0, lower when unsure."""
 
 TRIAGE_HUMAN_PROMPT = """Analyze the following feedback:
 
 ---
-Feedback ID: {feedback_id}
 Source: {source}
 Content: {content}
 ---
-
-{format_instructions}
 """
 
 
+# The response schema is built once at import. It is enforced by the
+# server via response_format, so it stays out of the prompt.
+_TRIAGE_RESPONSE_FORMAT = json_schema_response_format(TriageResult)
+
+
+# ========================
+# Rule-Based Pre-Classifier
+# ========================
+
+
+_FAST_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    "bug": [re.compile(r"\b(crash\w*|error\w*|broken|500|traceback|exception\w*|fail\w*)\b", re.IGNORECASE)],
+    "feature": [re.compile(r"\b(please add|feature request|would be nice|support for)\b", re.IGNORECASE)],
+    "question": [
+        re.compile(r"\?$", re.MULTILINE),
+        re.compile(r"\b(how do i|can i)\b", re.IGNORECASE),
+    ],
+}
+
+# Severity is only decided by rules at the extremes; everything in between
+# needs the cache or the LLM
+_SEVERITY_PATTERNS: dict[str, re.Pattern[str]] = {
+    "critical": re.compile(
+        r"\b(data loss|lost (all )?(my |our )?data|security|vulnerab\w*|outage|(site|app|service|production) (is )?down)\b",
+        re.IGNORECASE,
+    ),
+    "low": re.compile(r"\b(typos?|cosmetic|misaligned|minor)\b", re.IGNORECASE),
+}
+
+
+def _fast_classify(content: str) -> TriageResult | None:
+    """Classify obvious feedback from keywords alone.
+
+    Returns a result only when one class clearly dominates (it is the only
+    class with any matches, or it has more than three matches and more than
+    all other classes combined) and exactly one severity signal is present.
+
+    Args:
+        content: The feedback text
+
+    Returns:
+        A rule-based TriageResult, or None if the cache or LLM should decide
+    """
+    scores = {
+        label: sum(len(pattern.findall(content)) for pattern in patterns)
+        for label, patterns in _FAST_PATTERNS.items()
+    }
+    best = max(scores, key=scores.get)
+    best_score = scores[best]
+    others = sum(scores.values()) - best_score
+
+    if best_score == 0 or (others > 0 and (best_score <= 3 or best_score <= others)):
+        return None
+
+    severities = [level for level, pattern in _SEVERITY_PATTERNS.items() if pattern.search(content)]
+    if len(severities) != 1:
+        return None
+    # A question mark on an outage report ("Is the site down?") must not
+    # route it past dedup and spec writing as a question
+    if best == "question" and severities[0] == "critical":
+        return None
+
+    return TriageResult(
+        classification=best,
+        severity=severities[0],
+        reasoning=f"Rule-based: matched {best} and {severities[0]} severity keywords",
+        confidence=0.9,
+    )
+
+
 # ========================
 # Agent Node
 # ========================
@@ -146,35 +211,103 @@ async def triage_node(state: TriageState) -> dict[str, Any]:
         content_preview=state["content"][:100],
     )
 
-    try:
-        # Initialize LLM client
-        llm = get_llm_client()
-
-        # Create prompt
-        parser = PydanticOutputParser(pydantic_object=TriageResult)
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", TRIAGE_SYSTEM_PROMPT),
-            ("human", TRIAGE_HUMAN_PROMPT),
-        ])
-
-        # Format the prompt
-        formatted_prompt = prompt.format_messages(
+    # Obvious feedback skips the LLM entirely
+    fast_result = _fast_classify(state["content"])
+    if fast_result is not None:
+        logger.info(
+            "Triage served by keyword rules",
             feedback_id=state["feedback_id"],
+            classification=fast_result.classification,
+        )
+        return fast_result.model_dump()
+
+    try:
+        # Near-duplicate feedback reuses a previous classification
+        semantic_cache = get_semantic_cache()
+        embedding = None
+        if semantic_cache is not None:
+            embedding, cached_result = await semantic_cache.lookup(state["content"])
+            if cached_result is not None:
+                logger.info(
+                    "Triage served from semantic cache",
+                    feedback_id=state["feedback_id"],
+                    classification=cached_result.get("classification"),
+                )
+                return {
+                    "classification": cached_result["classification"],
+                    "severity": cached_result["severity"],
+                    "reasoning": cached_result["reasoning"],
+                    "confidence": cached_result["confidence"],
+                }
+
+        # Format the prompt. The feedback ID is kept out of it so identical
+        # content produces identical cache keys.
+        user_content = TRIAGE_HUMAN_PROMPT.format(
             source=state["source"],
             content=state["content"],
-            format_instructions=parser.get_format_instructions(),
         )
 
-        # Call LLM with structured output
-        response = await llm.chat.completions.create(
-            messages=[HumanMessage(content=formatted_prompt[1].content)],
+        # Serve repeated prompts from the cache, skipping the LLM round-trip
+        cache = get_llm_cache()
+        cache_key = make_cache_key(
             model="qwen2.5-coder:3b",
             temperature=0.1,
+            messages=[TRIAGE_SYSTEM_PROMPT, user_content],
         )
-
-        # Parse structured output
-        result = parser.parse(response.choices[0].message.content)
+        content = await cache.get(cache_key)
+        messages = [
+            {"role": "system", "content": TRIAGE_SYSTEM_PROMPT},
+            {"role": "user", "content": user_content},
+        ]
+        temperature = 0.1
+
+        # Re-prompt with the validation error when the output is malformed
+        for attempt in range(1, LLM_MAX_ATTEMPTS + 1):
+            if content is None:
+                # Initialize LLM client
+                llm = get_llm_client()
+
+                # Call LLM with structured output
+                dispatcher = get_llm_dispatcher()
+                response = await dispatcher.submit(
+                    llm,
+                    latency_budget_ms=TRIAGE_LATENCY_BUDGET_MS,
+                    messages=messages,
+                    model="qwen2.5-coder:3b",
+                    temperature=temperature,
+                    max_tokens=TRIAGE_MAX_TOKENS,
+                    response_format=_TRIAGE_RESPONSE_FORMAT,
+                )
+                content = response.choices[0].message.content
+
+            # Validate structured output
+            try:
+                result = TriageResult.model_validate_json(content)
+                break
+            except (ValidationError, json.JSONDecodeError) as e:
+                if attempt == LLM_MAX_ATTEMPTS:
+                    raise
+                logger.warning(
+                    "Invalid triage output, retrying",
+                    feedback_id=state["feedback_id"],
+                    attempt=attempt,
+                    error=str(e),
+                )
+                messages = [
+                    *messages,
+                    {"role": "assistant", "content": content},
+                    {
+                        "role": "user",
+                        "content": f"Your last response was invalid: {e}. Return only JSON matching the schema.",
+                    },
+                ]
+                temperature = 0.0
+                content = None
+
+        # Only cache completions that parsed cleanly
+        await cache.set(cache_key, content)
+        if embedding is not None:
+            await semantic_cache.store(embedding, result.model_dump())
 
         logger.info(
             "Triage complete",
@@ -267,7 +400,9 @@ async def classify_feedback(
         "confidence": 0.0,
     }
 
-    result = await triage_graph.ainvoke(initial_state)
+    # The graph is a single node, so call it directly and skip LangGraph's
+    # per-invocation state handling; triage_graph remains for tooling and tests.
+    result = await triage_node(initial_state)
 
     return TriageResult(
         classification=result["classification"],
@@ -275,3 +410,26 @@ async def classify_feedback(
         reasoning=result["reasoning"],
         confidence=result["confidence"],
     )
+
+
+async def batch_classify_feedback(
+    items: list[tuple[str, str, str]],
+    concurrency: int = 8,
+) -> list[TriageResult | BaseException]:
+    """Classify many feedback items concurrently.
+
+    Args:
+        items: (feedback_id, content, source) tuples
+        concurrency: Maximum items classified at once
+
+    Returns:
+        One entry per item, in order; failures are returned as the exception
+        instead of aborting the batch
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(item: tuple[str, str, str]) -> TriageResult:
+        async with semaphore:
+            return await classify_feedback(*item)
+
+    return await asyncio.gather(*(_one(item) for item in items), return_exceptions=True)
@@ -7,11 +7,14 @@ These endpoints allow the frontend to:
 - Reject issues
 """
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
 
 from src.services.github import get_github_service, GitHubService
 from src.services.supabase import get_supabase_service, SupabaseService
@@ -20,6 +23,87 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/issues", tags=["issues"])
 
+# The frontend polls the draft badge; serve it from memory for a few seconds
+_DRAFT_COUNT_TTL_SECONDS = 5.0
+_DRAFT_COUNT_CACHE: dict[str, Any] = {"value": None, "expires": 0.0}
+
+
+def _invalidate_draft_count() -> None:
+    """Force the next draft count to hit Supabase."""
+    _DRAFT_COUNT_CACHE["expires"] = 0.0
+
+
+# Issue detail views are re-read far more often than issues change
+_ISSUE_CACHE_TTL_SECONDS = 30.0
+_ISSUE_CACHE_MAX_ENTRIES = 1024
+_ISSUE_CACHE: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+
+def _cache_issue(issue_id: str, body: bytes) -> None:
+    """Cache an issue response, evicting expired and then the oldest entries."""
+    now = time.monotonic()
+    _ISSUE_CACHE[issue_id] = (now + _ISSUE_CACHE_TTL_SECONDS, body)
+    _ISSUE_CACHE.move_to_end(issue_id)
+    # Every entry shares one TTL, so the oldest entries expire first
+    while _ISSUE_CACHE and next(iter(_ISSUE_CACHE.values()))[0] <= now:
+        _ISSUE_CACHE.popitem(last=False)
+    while len(_ISSUE_CACHE) > _ISSUE_CACHE_MAX_ENTRIES:
+        _ISSUE_CACHE.popitem(last=False)
+
+
+def _invalidate_issue(issue_id: str) -> None:
+    """Drop a cached issue after it is mutated."""
+    _ISSUE_CACHE.pop(issue_id, None)
+
+
+# Retry policy for the post-response Supabase status update
+_PUBLISH_RETRY_ATTEMPTS = 3
+_PUBLISH_RETRY_BASE_DELAY_SECONDS = 0.5
+
+
+async def _record_published(
+    supabase: SupabaseService,
+    issue_id: str,
+    github_url: str,
+) -> None:
+    """Mark an issue as published in Supabase, retrying transient failures.
+
+    Runs as a background task after the approve response has been sent.
+    If every attempt fails the update is dead-lettered to the error log
+    with the GitHub URL so the row can be reconciled by hand.
+
+    Args:
+        supabase: Supabase service instance
+        issue_id: UUID of the issue
+        github_url: URL of the created GitHub issue
+    """
+    for attempt in range(1, _PUBLISH_RETRY_ATTEMPTS + 1):
+        try:
+            await supabase.publish_issue(
+                issue_id=issue_id,
+                github_url=github_url,
+            )
+            _invalidate_draft_count()
+            _invalidate_issue(issue_id)
+            return
+        except Exception as e:
+            if attempt == _PUBLISH_RETRY_ATTEMPTS:
+                logger.error(
+                    "Dead-lettered issue status update",
+                    issue_id=issue_id,
+                    github_url=github_url,
+                    attempts=attempt,
+                    error=str(e),
+                )
+                return
+            logger.warning(
+                "Retrying issue status update",
+                issue_id=issue_id,
+                attempt=attempt,
+                error=str(e),
+            )
+            await asyncio.sleep(_PUBLISH_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+
 
 # ========================
 # Pydantic Models
@@ -83,44 +167,64 @@ class ErrorResponse(BaseModel):
 # ========================
 
 
+def _model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Encode a response model with pydantic-core directly.
+
+    Routes declare their model under `responses` for the OpenAPI schema but
+    set response_model=None, so FastAPI does not revalidate the model we
+    just built or walk it through jsonable_encoder.
+
+    Args:
+        model: Response model to send
+        status_code: HTTP status code
+
+    Returns:
+        Pre-encoded JSON response
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @router.get(
     "",
-    response_model=IssueListResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": IssueListResponse}},
     summary="List Issues",
-    description="Returns all issues with their current status.",
+    description="Returns a page of issues with their current status.",
 )
 async def list_issues(
     status_filter: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
     supabase: SupabaseService = Depends(get_supabase_service),
-) -> IssueListResponse:
-    """List all issues or filter by status.
+) -> Response:
+    """List a page of issues with a given status.
 
     Args:
         status_filter: Optional status filter (draft, approved, rejected, published)
+        limit: Maximum number of issues to return
+        offset: Number of issues to skip
         supabase: Supabase service instance
 
     Returns:
-        List of issues with count
+        Page of issues with the total count for the status
     """
+    status_value = status_filter or "draft"
     try:
-        if status_filter and status_filter != "draft":
-            # Filter by specific status
-            client = await supabase._get_client()
-            result = (
-                await client.table("issues")
-                .select("*, feedback_items(source, raw_content, classification, severity)")
-                .eq("status", status_filter)
-                .order("created_at", desc=True)
-                .execute()
-            )
-            issues = result.data or []
+        if status_value == "draft":
+            page = supabase.get_drafts(limit=limit, offset=offset)
         else:
-            # Default: return drafts
-            issues = await supabase.get_drafts()
+            page = supabase.get_issues(status_value, limit=limit, offset=offset)
+        issues, total = await asyncio.gather(page, supabase.count_issues(status_value))
 
-        return IssueListResponse(
-            issues=issues,
-            total=len(issues),
+        return _model_response(
+            IssueListResponse(
+                issues=issues,
+                total=total,
+            )
         )
 
     except Exception as e:
@@ -136,14 +240,15 @@ async def list_issues(
 
 @router.get(
     "/{issue_id}",
-    response_model=IssueDetailResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": IssueDetailResponse}},
     summary="Get Issue Details",
     description="Returns detailed information about a specific issue.",
 )
 async def get_issue(
     issue_id: str,
     supabase: SupabaseService = Depends(get_supabase_service),
-) -> IssueDetailResponse:
+) -> Response:
     """Get details for a specific issue.
 
     Args:
@@ -153,6 +258,10 @@ async def get_issue(
     Returns:
         Issue details with feedback info
     """
+    cached = _ISSUE_CACHE.get(issue_id)
+    if cached is not None and time.monotonic() < cached[0]:
+        return Response(content=cached[1], media_type="application/json")
+
     try:
         issue = await supabase.get_issue_by_id(issue_id)
 
@@ -165,10 +274,14 @@ async def get_issue(
         # Extract feedback info if available
         feedback = issue.pop("feedback_items", None)
 
-        return IssueDetailResponse(
-            issue=issue,
-            feedback=feedback,
+        response = _model_response(
+            IssueDetailResponse(
+                issue=issue,
+                feedback=feedback,
+            )
         )
+        _cache_issue(issue_id, response.body)
+        return response
 
     except HTTPException:
         raise
@@ -186,25 +299,28 @@ async def get_issue(
 
 @router.post(
     "/{issue_id}/approve",
-    response_model=ApproveResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": ApproveResponse}},
     summary="Approve and Publish Issue",
     description="Approves an issue draft and publishes it to GitHub.",
 )
 async def approve_issue(
     issue_id: str,
+    background_tasks: BackgroundTasks,
     request: ApproveRequest | None = None,
     supabase: SupabaseService = Depends(get_supabase_service),
     github: GitHubService = Depends(get_github_service),
-) -> ApproveResponse:
+) -> Response:
     """Approve a draft issue and create it on GitHub.
 
     This endpoint:
-    1. Fetches the issue details from Supabase
+    1. Fetches the issue details from Supabase and checks the GitHub repo concurrently
     2. Creates the issue on GitHub
-    3. Updates the issue status to 'published' in Supabase
+    3. Schedules the Supabase status update to 'published' after the response
 
     Args:
         issue_id: UUID of the issue to approve
+        background_tasks: FastAPI background task queue
         request: Optional customization (title, labels)
         supabase: Supabase service instance
         github: GitHub service instance
@@ -215,8 +331,11 @@ async def approve_issue(
     request = request or ApproveRequest()
 
     try:
-        # Step 1: Get issue from Supabase
-        issue = await supabase.get_issue_by_id(issue_id)
+        # Step 1: Get issue from Supabase while confirming the GitHub repo
+        issue, repo_exists = await asyncio.gather(
+            supabase.get_issue_by_id(issue_id),
+            github.check_repo_exists(),
+        )
 
         if not issue:
             raise HTTPException(
@@ -224,6 +343,12 @@ async def approve_issue(
                 detail=f"Issue not found: {issue_id}",
             )
 
+        if not repo_exists:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="GitHub repository not found",
+            )
+
         # Check if already published
         if issue["status"] == "published":
             raise HTTPException(
@@ -254,11 +379,10 @@ async def approve_issue(
             labels=labels if labels else None,
         )
 
-        # Step 3: Update Supabase
-        await supabase.publish_issue(
-            issue_id=issue_id,
-            github_url=github_url,
-        )
+        # Step 3: Update Supabase once the response is on its way; the
+        # GitHub issue already exists, so the client need not wait for it
+        background_tasks.add_task(_record_published, supabase, issue_id, github_url)
+        _invalidate_issue(issue_id)
 
         logger.info(
             "Issue approved and published",
@@ -266,10 +390,12 @@ async def approve_issue(
             github_url=github_url,
         )
 
-        return ApproveResponse(
-            status="published",
-            url=github_url,
-            issue_id=issue_id,
+        return _model_response(
+            ApproveResponse(
+                status="published",
+                url=github_url,
+                issue_id=issue_id,
+            )
         )
 
     except HTTPException:
@@ -288,7 +414,8 @@ async def approve_issue(
 
 @router.post(
     "/{issue_id}/reject",
-    response_model=RejectResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": RejectResponse}},
     summary="Reject Issue",
     description="Rejects a draft issue.",
 )
@@ -296,7 +423,7 @@ async def reject_issue(
     issue_id: str,
     request: RejectRequest | None = None,
     supabase: SupabaseService = Depends(get_supabase_service),
-) -> RejectResponse:
+) -> Response:
     """Reject a draft issue.
 
     This endpoint marks the issue as rejected in Supabase.
@@ -333,6 +460,8 @@ async def reject_issue(
             issue_id=issue_id,
             reason=request.reason,
         )
+        _invalidate_draft_count()
+        _invalidate_issue(issue_id)
 
         logger.info(
             "Issue rejected",
@@ -340,9 +469,11 @@ async def reject_issue(
             reason=request.reason,
         )
 
-        return RejectResponse(
-            status="rejected",
-            issue_id=issue_id,
+        return _model_response(
+            RejectResponse(
+                status="rejected",
+                issue_id=issue_id,
+            )
         )
 
     except HTTPException:
@@ -361,6 +492,7 @@ async def reject_issue(
 
 @router.get(
     "/drafts/count",
+    response_model=None,
     summary="Count Draft Issues",
     description="Returns the count of draft issues.",
 )
@@ -375,9 +507,14 @@ async def count_drafts(
     Returns:
         Count of draft issues
     """
+    if time.monotonic() < _DRAFT_COUNT_CACHE["expires"]:
+        return {"count": _DRAFT_COUNT_CACHE["value"]}
+
     try:
-        drafts = await supabase.get_drafts()
-        return {"count": len(drafts)}
+        count = await supabase.count_issues("draft")
+        _DRAFT_COUNT_CACHE["value"] = count
+        _DRAFT_COUNT_CACHE["expires"] = time.monotonic() + _DRAFT_COUNT_TTL_SECONDS
+        return {"count": count}
     except Exception as e:
         logger.error(
             "Failed to count drafts",
@@ -4,9 +4,18 @@ These endpoints receive feedback from external sources and publish
 to Kafka for downstream processing.
 """
 
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Annotated, TypeVar
+from uuid import UUID
+
+import orjson
 import structlog
-from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 
 from src.schemas.ingestion import (
     DiscordWebhookPayload,
@@ -21,33 +30,211 @@ logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
 
+# ========================
+# Payload Parsing
+# ========================
+
+
+PayloadT = TypeVar("PayloadT", bound=BaseModel)
+
+
+def _decode_payload(model: type[PayloadT], body: bytes) -> PayloadT:
+    """Parse and validate a raw JSON body in a single pass.
+
+    pydantic-core parses the bytes straight into the model, skipping the
+    intermediate dict FastAPI builds for a body parameter.
+
+    Args:
+        model: Payload model to validate against
+        body: Raw request body
+
+    Returns:
+        The validated payload
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON for the model (422)
+    """
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        ) from e
+
+
+# Keys that can carry feedback text. A body containing none of them is
+# rejected with a substring scan, before parsing or any other dependency.
+_DISCORD_CONTENT_KEYS = (b'"content"', b'"embeds"')
+_SLACK_CONTENT_KEYS = (b'"text"', b'"blocks"', b'"attachments"')
+
+
+def _reject_without_content_keys(body: bytes, keys: tuple[bytes, ...], source: str) -> None:
+    """Reject bodies that cannot contain feedback text (bots, presence updates).
+
+    Args:
+        body: Raw request body
+        keys: Quoted JSON keys that may carry feedback text
+        source: Webhook source, for logging
+
+    Raises:
+        HTTPException: If none of the keys appear in the body (400)
+    """
+    if not any(key in body for key in keys):
+        logger.warning("Webhook received with no content fields", source=source)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No extractable content in webhook payload",
+        )
+
+
+async def parse_discord_payload(request: Request) -> DiscordWebhookPayload:
+    """Dependency that decodes a Discord webhook body."""
+    body = await request.body()
+    _reject_without_content_keys(body, _DISCORD_CONTENT_KEYS, "discord")
+    return _decode_payload(DiscordWebhookPayload, body)
+
+
+async def parse_slack_payload(request: Request) -> SlackWebhookPayload:
+    """Dependency that decodes a Slack webhook body."""
+    body = await request.body()
+    _reject_without_content_keys(body, _SLACK_CONTENT_KEYS, "slack")
+    return _decode_payload(SlackWebhookPayload, body)
+
+
+def _queued_response(feedback_id: UUID, topic: str) -> Response:
+    """Build the 202 body without response-model validation or jsonable_encoder.
+
+    Args:
+        feedback_id: ID assigned to the feedback
+        topic: Kafka topic the feedback is queued for
+
+    Returns:
+        Pre-encoded response matching QueuedResponse
+    """
+    return Response(
+        content=orjson.dumps(
+            {
+                "status": "queued",
+                "id": feedback_id,
+                "topic": topic,
+                "timestamp": datetime.now(timezone.utc),
+            },
+            option=orjson.OPT_UTC_Z,
+        ),
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/json",
+    )
+
+
+# ========================
+# Redelivery Dedup
+# ========================
+
+
+# Discord and Slack retry deliveries they consider unacknowledged. An
+# identical body seen within the window is acknowledged with the original
+# feedback ID instead of being published again.
+_DEDUP_TTL_SECONDS = 300.0
+_DEDUP_MAX_ENTRIES = 10_000
+_RECENT_DELIVERIES: OrderedDict[str, tuple[float, UUID]] = OrderedDict()
+
+
+def _fingerprint(body: bytes) -> str:
+    """Hash a raw webhook body for dedup."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _recent_delivery(dedup_hash: str) -> UUID | None:
+    """Return the feedback ID a body was accepted under, if seen recently."""
+    entry = _RECENT_DELIVERIES.get(dedup_hash)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def _remember_delivery(dedup_hash: str, feedback_id: UUID) -> None:
+    """Record an accepted body, evicting the oldest entries past the cap."""
+    _RECENT_DELIVERIES[dedup_hash] = (time.monotonic() + _DEDUP_TTL_SECONDS, feedback_id)
+    _RECENT_DELIVERIES.move_to_end(dedup_hash)
+    while len(_RECENT_DELIVERIES) > _DEDUP_MAX_ENTRIES:
+        _RECENT_DELIVERIES.popitem(last=False)
+
+
+def _forget_delivery(dedup_hash: str) -> None:
+    """Let a redelivery through again, e.g. after a failed publish."""
+    _RECENT_DELIVERIES.pop(dedup_hash, None)
+
+
+async def _publish_feedback(kafka: KafkaService, feedback: FeedbackItem) -> None:
+    """Publish a feedback item to Kafka after the webhook has been acknowledged.
+
+    The sender already has its 202, so a failure cannot be reported back;
+    the full message is dead-lettered to the error log for replay instead.
+
+    Args:
+        kafka: Kafka service
+        feedback: The feedback item to publish
+    """
+    encoded = feedback.encoded_message()
+    published = False
+    try:
+        await kafka.publish(
+            topic="feedback.raw",
+            data=orjson.Fragment(encoded),
+            message_id=str(feedback.id),
+        )
+        published = True
+    except Exception as e:
+        # Nothing upstream sees a background failure, so every error is
+        # dead-lettered
+        logger.error(
+            "Dead-lettered feedback publish",
+            feedback_id=str(feedback.id),
+            source=feedback.source.value,
+            error=e.message if isinstance(e, KafkaServiceError) else str(e),
+            message=encoded.decode(),
+        )
+    finally:
+        # A retry from the sender should be published rather than deduped,
+        # including when this task was cancelled mid-publish
+        if not published:
+            _forget_delivery(feedback.dedup_hash)
+
+
 @router.post(
     "/discord",
-    response_model=QueuedResponse,
+    response_model=None,
+    responses={status.HTTP_202_ACCEPTED: {"model": QueuedResponse}},
     status_code=status.HTTP_202_ACCEPTED,
     summary="Receive Discord webhook",
     description="Receives feedback from Discord webhooks and queues for processing.",
 )
 async def discord_webhook(
     request: Request,
-    payload: DiscordWebhookPayload,
+    payload: Annotated[DiscordWebhookPayload, Depends(parse_discord_payload)],
+    background_tasks: BackgroundTasks,
     kafka: Annotated[KafkaService, Depends(get_kafka_service)],
-) -> QueuedResponse:
+) -> Response:
     """Handle incoming Discord webhook.
 
-    Validates the payload, creates a FeedbackItem, and publishes to Kafka.
+    Validates the payload, creates a FeedbackItem, and queues it for
+    publishing to Kafka once the response has been sent.
 
     Args:
-        request: The raw HTTP request (for logging headers if needed)
+        request: The raw HTTP request (its cached body is forwarded to Kafka)
         payload: Parsed Discord webhook payload
+        background_tasks: FastAPI background task queue
         kafka: Injected Kafka service
 
     Returns:
-        QueuedResponse with the feedback ID
+        202 response with a QueuedResponse body carrying the feedback ID
 
     Raises:
-        HTTPException: If Kafka publishing fails
+        HTTPException: If the payload has no extractable content
     """
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(source="discord")
+
     # Extract feedback text
     feedback_text = payload.extract_feedback_text()
 
@@ -62,67 +249,66 @@ async def discord_webhook(
             detail="No extractable content in webhook payload",
         )
 
+    # Acknowledge a retried delivery without publishing it twice
+    raw_body = await request.body()
+    dedup_hash = _fingerprint(raw_body)
+    existing_id = _recent_delivery(dedup_hash)
+    if existing_id is not None:
+        structlog.contextvars.bind_contextvars(feedback_id=str(existing_id))
+        logger.info("Duplicate Discord delivery acknowledged")
+        return _queued_response(existing_id, "feedback.raw")
+
     # Create feedback item
-    feedback = FeedbackItem.from_discord(payload)
+    feedback = FeedbackItem.from_discord(payload, raw_body=raw_body, dedup_hash=dedup_hash)
+    structlog.contextvars.bind_contextvars(feedback_id=str(feedback.id))
+    _remember_delivery(dedup_hash, feedback.id)
 
-    # Publish to Kafka
-    try:
-        await kafka.publish(
-            topic="feedback.raw",
-            data=feedback.to_kafka_message(),
-            message_id=str(feedback.id),
-        )
-    except KafkaServiceError as e:
-        logger.error(
-            "Failed to publish Discord feedback to Kafka",
-            feedback_id=str(feedback.id),
-            error=str(e),
-        )
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Failed to queue feedback: {e.message}",
-        )
+    # Publish to Kafka after the response is sent
+    background_tasks.add_task(_publish_feedback, kafka, feedback)
 
     logger.info(
         "Discord feedback queued",
-        feedback_id=str(feedback.id),
         discord_channel_id=payload.channel_id,
         content_preview=feedback_text[:100],
     )
 
-    return QueuedResponse(
-        id=feedback.id,
-        topic="feedback.raw",
-    )
+    return _queued_response(feedback.id, "feedback.raw")
 
 
 @router.post(
     "/slack",
-    response_model=QueuedResponse,
+    response_model=None,
+    responses={status.HTTP_202_ACCEPTED: {"model": QueuedResponse}},
     status_code=status.HTTP_202_ACCEPTED,
     summary="Receive Slack webhook",
     description="Receives feedback from Slack webhooks and queues for processing.",
 )
 async def slack_webhook(
     request: Request,
-    payload: SlackWebhookPayload,
+    payload: Annotated[SlackWebhookPayload, Depends(parse_slack_payload)],
+    background_tasks: BackgroundTasks,
     kafka: Annotated[KafkaService, Depends(get_kafka_service)],
-) -> QueuedResponse:
+) -> Response:
     """Handle incoming Slack webhook.
 
-    Validates the payload, creates a FeedbackItem, and publishes to Kafka.
+    Validates the payload, creates a FeedbackItem, and queues it for
+    publishing to Kafka once the response has been sent.
 
     Args:
-        request: The raw HTTP request
+        request: The raw HTTP request (its cached body is forwarded to Kafka)
         payload: Parsed Slack webhook payload
+        background_tasks: FastAPI background task queue
         kafka: Injected Kafka service
 
     Returns:
-        QueuedResponse with the feedback ID
+        202 response with a QueuedResponse body carrying the feedback ID
 
     Raises:
-        HTTPException: If Kafka publishing fails
+        HTTPException: If the payload has no extractable content
     """
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(source="slack")
+
     # Extract feedback text
     feedback_text = payload.extract_feedback_text()
 
@@ -137,38 +323,33 @@ async def slack_webhook(
             detail="No extractable content in webhook payload",
         )
 
+    # Acknowledge a retried delivery without publishing it twice
+    raw_body = await request.body()
+    dedup_hash = _fingerprint(raw_body)
+    existing_id = _recent_delivery(dedup_hash)
+    if existing_id is not None:
+        structlog.contextvars.bind_contextvars(feedback_id=str(existing_id))
+        logger.info("Duplicate Slack delivery acknowledged")
+        return _queued_response(existing_id, "feedback.raw")
+
     # Create feedback item
-    feedback = FeedbackItem.from_slack(payload)
+    feedback = FeedbackItem.from_slack(payload, raw_body=raw_body, dedup_hash=dedup_hash)
+    structlog.contextvars.bind_contextvars(feedback_id=str(feedback.id))
+    _remember_delivery(dedup_hash, feedback.id)
 
-    # Publish to Kafka
-    try:
-        await kafka.publish(
-            topic="feedback.raw",
-            data=feedback.to_kafka_message(),
-            message_id=str(feedback.id),
-        )
-    except KafkaServiceError as e:
-        logger.error(
-            "Failed to publish Slack feedback to Kafka",
-            feedback_id=str(feedback.id),
-            error=str(e),
-        )
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Failed to queue feedback: {e.message}",
-        )
+    # Publish to Kafka after the response is sent
+    background_tasks.add_task(_publish_feedback, kafka, feedback)
 
     logger.info(
         "Slack feedback queued",
-        feedback_id=str(feedback.id),
         slack_channel=payload.channel,
         content_preview=feedback_text[:100],
     )
 
-    return QueuedResponse(
-        id=feedback.id,
-        topic="feedback.raw",
-    )
+    return _queued_response(feedback.id, "feedback.raw")
+
+
+_HEALTH_BODY = orjson.dumps({"status": "webhookshealthy"})
 
 
 @router.get(
@@ -176,6 +357,6 @@ async def slack_webhook(
     summary="Webhook health check",
     description="Quick health check for the webhook endpoints.",
 )
-async def webhook_health() -> dict[str, str]:
+async def webhook_health() -> Response:
     """Health check for webhook endpoints."""
-    return {"status": "webhookshealthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
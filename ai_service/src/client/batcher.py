@@ -0,0 +1,121 @@
+"""Micro-batching for outbound calls.
+
+Callers submit one item at a time and await its own result, while a
+background worker coalesces items that arrive within a short window into a
+single call to a batch handler.
+"""
+
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncBatcher(Generic[T, R]):
+    """Coalesces individually submitted items into batched calls."""
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[T]], Awaitable[list[R]]],
+        max_batch: int = 32,
+        max_delay_ms: int = 50,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            process_batch: Handles a batch, returning one result per item in order
+            max_batch: Items that trigger an immediate flush
+            max_delay_ms: Maximum time an item waits for a batch to fill
+        """
+        self._process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_delay_ms = max_delay_ms
+        self._queue: asyncio.Queue[tuple[T, asyncio.Future]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        # Items the worker has taken off the queue but not yet dispatched
+        self._collecting: list[tuple[T, asyncio.Future]] = []
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for its result.
+
+        Args:
+            item: Item to include in the next batch
+
+        Returns:
+            The result the batch handler produced for this item
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            # The worker outlives this caller, so it must not inherit the
+            # caller's bound log context (feedback_id etc.)
+            self._worker = loop.create_task(self._run(), context=contextvars.Context())
+
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect batches and hand each one off without blocking the next."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._collecting = batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay_ms / 1000
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            self._collecting = []
+            task = loop.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        """Run the batch handler and resolve each item's future."""
+        logger.debug("Dispatching batch", size=len(batch))
+        try:
+            results = await self._process_batch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the worker, flushing queued items and waiting for in-flight batches."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        # A cancelled worker may have been part-way through collecting a batch
+        remaining, self._collecting = self._collecting, []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        for start in range(0, len(remaining), self.max_batch):
+            await self._dispatch(remaining[start : start + self.max_batch])
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
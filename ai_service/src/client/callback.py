@@ -1,16 +1,24 @@
 """Callback client for AI Service to send results back to Web App."""
 
+import asyncio
+import gzip
 import logging
 from typing import Any
 
 import httpx
+import orjson
 import structlog
 
+from src.client.batcher import AsyncBatcher
 from src.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
 
+# Bulk bodies below this size are sent uncompressed
+GZIP_MIN_BYTES = 1024
+
+
 class CallbackClient:
     """Client for calling back to the Web App's internal API."""
 
@@ -21,23 +29,53 @@ class CallbackClient:
             base_url: Base URL of the web app (defaults to settings)
         """
         self._base_url = base_url or settings.web_app_url
+        self._save_issues_url = f"{self._base_url}/api/internal/save-issues"
         self._api_key = settings.internal_api_key.get_secret_value() if settings.internal_api_key else None
+        self._headers = {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+        }
+        self._gzip_headers = {**self._headers, "Content-Encoding": "gzip"}
         self._client: httpx.AsyncClient | None = None
+        self._client_lock = asyncio.Lock()
+        self._save_batcher: AsyncBatcher[dict[str, Any], bool] = AsyncBatcher(
+            self._save_issues,
+            max_batch=32,
+            max_delay_ms=50,
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create httpx client."""
+        """Get or create httpx client.
+
+        The client and its connection pool are shared by every call. The
+        lock stops concurrent first calls from each building a client.
+        """
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                http2=True,
-            )
+            async with self._client_lock:
+                if self._client is None:
+                    # Pool limits and HTTP/2 belong to the transport; httpx
+                    # ignores the client-level arguments once one is given.
+                    self._client = httpx.AsyncClient(
+                        timeout=httpx.Timeout(30.0, connect=2.0),
+                        transport=httpx.AsyncHTTPTransport(
+                            http2=True,
+                            retries=2,
+                            limits=httpx.Limits(
+                                max_connections=256,
+                                max_keepalive_connections=64,
+                                keepalive_expiry=60.0,
+                            ),
+                        ),
+                    )
         return self._client
 
     async def close(self) -> None:
-        """Close the httpx client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Flush pending saves and close the httpx client."""
+        await self._save_batcher.close()
+        async with self._client_lock:
+            if self._client is not None:
+                await self._client.aclose()
+                self._client = None
 
     async def save_issue(
         self,
@@ -56,6 +94,9 @@ class CallbackClient:
     ) -> bool:
         """Save issue to web app via internal API.
 
+        Saves arriving within a short window are sent together in one
+        bulk request; each caller still gets its own result.
+
         Args:
             feedback_id: UUID of the feedback item
             content: Original feedback content
@@ -73,9 +114,6 @@ class CallbackClient:
         Returns:
             True if successful
         """
-        client = await self._get_client()
-        url = f"{self._base_url}/api/internal/save-issue"
-
         payload = {
             "feedbackId": feedback_id,
             "content": content,
@@ -90,48 +128,72 @@ class CallbackClient:
             "acceptanceCriteria": acceptance_criteria,
             "labels": suggested_labels,
         }
+        return await self._save_batcher.submit(payload)
+
+    async def _save_issues(self, payloads: list[dict[str, Any]]) -> list[bool]:
+        """Save a batch of issues via the bulk internal API.
+
+        Args:
+            payloads: Issue payloads in save-issue format
+
+        Returns:
+            One success flag per payload, in order
+        """
+        client = await self._get_client()
+        feedback_ids = [p["feedbackId"] for p in payloads]
+
+        content = orjson.dumps({"issues": payloads})
+        headers = self._headers
+        if len(content) > GZIP_MIN_BYTES:
+            content = gzip.compress(content)
+            headers = self._gzip_headers
 
         try:
-            response = await client.post(
-                url,
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
+            response = await client.post(self._save_issues_url, content=content, headers=headers)
 
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(
-                    "Issue saved successfully",
-                    feedback_id=feedback_id,
-                    issue_id=result.get("issueId"),
-                )
-                return True
-            else:
+            if response.status_code != 200:
                 logger.error(
-                    "Failed to save issue",
-                    feedback_id=feedback_id,
+                    "Failed to save issues",
+                    feedback_ids=feedback_ids,
                     status_code=response.status_code,
                     response=response.text[:500],
                 )
-                return False
+                return [False] * len(payloads)
+
+            results = response.json().get("results", [])
+            saved = []
+            for index, feedback_id in enumerate(feedback_ids):
+                result = results[index] if index < len(results) else {}
+                if result.get("success"):
+                    logger.info(
+                        "Issue saved successfully",
+                        feedback_id=feedback_id,
+                        issue_id=result.get("issueId"),
+                    )
+                    saved.append(True)
+                else:
+                    logger.error(
+                        "Failed to save issue",
+                        feedback_id=feedback_id,
+                        error=result.get("error"),
+                    )
+                    saved.append(False)
+            return saved
 
         except httpx.RequestError as e:
             logger.error(
                 "Callback request failed",
-                feedback_id=feedback_id,
+                feedback_ids=feedback_ids,
                 error=str(e),
             )
-            return False
+            return [False] * len(payloads)
         except Exception as e:
             logger.error(
                 "Unexpected error in callback",
-                feedback_id=feedback_id,
+                feedback_ids=feedback_ids,
                 error=str(e),
             )
-            return False
+            return [False] * len(payloads)
 
     async def __aenter__(self) -> "CallbackClient":
         return self
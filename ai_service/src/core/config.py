@@ -4,8 +4,9 @@ This module provides centralized configuration management for the IterateSwarm A
 All environment variables are validated at startup with fail-fast semantics.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,7 +29,9 @@ class Settings(BaseSettings):
     app_name: str = "iterate-swarm"
     app_host: str = "0.0.0.0"
     app_port: int = 8000
+    app_workers: int = Field(default=1, description="Uvicorn worker processes (in-memory caches are per worker)")
     debug: bool = False
+    cors_allow_origins: list[str] = Field(default=["*"], description="Origins allowed to call the browser-facing API")
 
     # Web App (for callbacks)
     web_app_url: str = Field(
@@ -40,16 +43,37 @@ class Settings(BaseSettings):
         description="API key for internal API authentication",
     )
 
+    # Supabase (Persistence)
+    supabase_url: str = Field(default="", description="Supabase project URL")
+    supabase_key: SecretStr = Field(default=SecretStr(""), description="Supabase service role key")
+
     # Qdrant (Vector Database)
     qdrant_url: str = Field(default="http://localhost:6333", description="Qdrant server URL")
     qdrant_api_key: SecretStr | None = Field(default=None, description="Qdrant API key if required")
+    qdrant_prefer_grpc: bool = Field(default=False, description="Talk to Qdrant over gRPC instead of REST")
+    qdrant_grpc_port: int = Field(default=6334, description="Qdrant gRPC port")
+    embedding_backend: Literal["ollama", "tei"] = Field(
+        default="ollama", description="Embedding server: Ollama or Hugging Face text-embeddings-inference"
+    )
+    tei_url: str = Field(default="http://localhost:8080", description="text-embeddings-inference base URL")
+    dedup_faiss_enabled: bool = Field(
+        default=False, description="Check recent vectors in an in-process FAISS index before Qdrant (requires faiss-cpu)"
+    )
+    dedup_faiss_max_entries: int = Field(default=100_000, description="Recent vectors kept in the FAISS index")
 
     # Kafka (Event Bus) - using Aiven or local Kafka
     kafka_brokers: str = Field(default="localhost:9092", description="Kafka brokers comma-separated")
+    kafka_rest_url: str = Field(default="localhost:9092", description="Upstash Kafka REST URL, or broker address for local Kafka")
+    kafka_rest_user: str = Field(default="", description="Upstash Kafka REST username (empty selects local Kafka)")
+    kafka_rest_password: SecretStr = Field(default=SecretStr(""), description="Upstash Kafka REST password")
     kafka_topic_feedback: str = "feedback-received"
     kafka_ssl: bool = Field(default=False, description="Enable SSL for Kafka")
     kafka_username: str = Field(default="", description="Kafka username for SASL")
     kafka_password: SecretStr | None = Field(default=None, description="Kafka password for SASL")
+    kafka_linger_ms: int = Field(default=50, description="Producer linger before sending a batch (ms)")
+    kafka_max_batch_size: int = Field(default=131072, description="Max producer batch size per partition (bytes)")
+    kafka_compression_type: str | None = Field(default="gzip", description="Producer compression (gzip, lz4, snappy, zstd or none)")
+    kafka_acks: int | str = Field(default=1, description="Producer acks (0, 1 or 'all')")
 
     # OpenAI (LLM Provider)
     openai_api_key: SecretStr = Field(default=None, description="OpenAI API key (optional if using local LLM)")
@@ -60,15 +84,34 @@ class Settings(BaseSettings):
     local_llm_url: str = Field(default="http://localhost:11434/v1", description="Local LLM base URL")
     local_llm_model: str = Field(default="qwen2.5-coder:3b", description="Local LLM model name")
 
+    # LLM Response Cache
+    redis_url: str | None = Field(default=None, description="Redis URL for shared LLM cache (in-memory if unset)")
+    llm_cache_ttl: int = Field(default=86400, description="LLM cache entry lifetime in seconds")
+    llm_cache_max_entries: int = Field(default=1024, description="Max entries for the in-memory LLM cache")
+    triage_semantic_cache_enabled: bool = Field(default=True, description="Reuse triage results for near-duplicate feedback")
+    triage_semantic_cache_threshold: float = Field(default=0.92, description="Cosine similarity required for a semantic cache hit")
+    spec_template_cache_enabled: bool = Field(default=True, description="Reuse spec skeletons per (classification, severity) bucket")
+    spec_template_similarity_threshold: float = Field(default=0.95, description="Similarity to the exemplar feedback above which a spec template is reused as-is")
+
+    # LLM Request Batching
+    llm_batch_size: int = Field(default=8, description="Pending LLM requests that trigger an immediate batch flush")
+    llm_batch_window_ms: int = Field(default=50, description="Max time an LLM request waits for a batch to fill")
+    llm_max_concurrency: int = Field(default=4, description="Max LLM requests in flight (match OLLAMA_NUM_PARALLEL)")
+
     # Langfuse (Observability)
     langfuse_public_key: str | None = Field(default=None, description="Langfuse public key")
     langfuse_secret_key: SecretStr | None = Field(default=None, description="Langfuse secret key")
     langfuse_host: str = Field(default="https://cloud.langfuse.com", description="Langfuse host")
+    langfuse_enabled: bool = Field(default=True, description="Record @observe spans (needs both Langfuse keys)")
+    langfuse_flush_at: int = Field(default=100, description="Spans buffered before a background export")
+    langfuse_flush_interval: float = Field(default=1.0, description="Max seconds between background span exports")
 
     # Inngest (Workflow Orchestration)
     inngest_app_id: str = "iterate-swarm"
     inngest_api_key: SecretStr | None = Field(default=None, description="Inngest API key")
     inngest_api_url: str = "https://api.inngest.com"
+    inngest_linger_ms: int = Field(default=20, description="Time events wait to be sent together in one request")
+    inngest_max_batch: int = Field(default=100, description="Buffered events that trigger an immediate send")
 
     # GitHub Integration
     github_token: SecretStr = Field(default=None, description="GitHub PAT or app token")
@@ -78,5 +121,30 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", description="Logging level")
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the cached settings instance.
+
+    Tests that change the environment can call get_settings.cache_clear().
+
+    Returns:
+        Singleton Settings instance
+    """
+    return Settings()
+
+
+settings = get_settings()
 """Global settings instance. Validated at import time."""
+
+
+# ========================
+# Resolved Constants
+# ========================
+
+
+# Hot-path values resolved once, so callers skip attribute lookups and
+# SecretStr unwrapping on every use.
+WEB_APP_URL = settings.web_app_url
+INTERNAL_API_KEY = settings.internal_api_key.get_secret_value() if settings.internal_api_key else None
+INNGEST_EVENT_KEY = settings.inngest_api_key.get_secret_value() if settings.inngest_api_key else None
+INNGEST_API_URL = settings.inngest_api_url or "https://api.inngest.com"
@@ -0,0 +1,30 @@
+"""Shared ASGI middleware."""
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class BrowserCORSMiddleware(CORSMiddleware):
+    """CORS limited to routes a browser can call.
+
+    Webhooks, Inngest callbacks and health probes come from other servers,
+    so requests under the given prefixes go straight to the app without
+    any Origin or preflight handling.
+    """
+
+    def __init__(self, app: ASGIApp, skip_prefixes: tuple[str, ...] = (), **kwargs) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI app
+            skip_prefixes: Path prefixes served without CORS
+            **kwargs: Passed through to CORSMiddleware
+        """
+        super().__init__(app, **kwargs)
+        self.skip_prefixes = skip_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,17 @@
+"""Shared HTTP response classes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class AppJSONResponse(ORJSONResponse):
+    """Default JSON response, serialized with orjson.
+
+    UTC datetimes render with a "Z" suffix, and dicts with non-string keys
+    (e.g. UUIDs or enums) serialize instead of raising.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,31 @@
+"""Langfuse tracing configuration.
+
+@observe decorators across the agents and vector service report to the
+Langfuse client configured here. Spans are buffered and exported by the
+SDK's background worker, never flushed on the request path.
+"""
+
+from langfuse import Langfuse
+
+from src.core.config import settings
+
+
+def configure_tracing() -> Langfuse:
+    """Create the process-wide Langfuse client from settings.
+
+    Must run before the first @observe call; the decorators use the first
+    client created. Tracing is disabled when LANGFUSE_ENABLED is false or
+    either key is missing, which makes every span a no-op.
+
+    Returns:
+        The configured Langfuse client
+    """
+    secret_key = settings.langfuse_secret_key.get_secret_value() if settings.langfuse_secret_key else None
+    return Langfuse(
+        public_key=settings.langfuse_public_key,
+        secret_key=secret_key,
+        host=settings.langfuse_host,
+        tracing_enabled=settings.langfuse_enabled and bool(settings.langfuse_public_key and secret_key),
+        flush_at=settings.langfuse_flush_at,
+        flush_interval=settings.langfuse_flush_interval,
+    )
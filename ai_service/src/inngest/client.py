@@ -1,12 +1,14 @@
 """Inngest client and event types for workflow orchestration."""
 
+import asyncio
+import contextvars
 import logging
 from typing import Any
 
 import structlog
 from inngest import Event, Inngest
 
-from src.core.config import settings
+from src.core.config import INNGEST_API_URL, INNGEST_EVENT_KEY, settings
 
 logger = structlog.get_logger(__name__)
 
@@ -26,8 +28,8 @@ def get_inngest_client() -> Inngest:
         _inngest_client = Inngest(
             app_id=settings.inngest_app_id,
             # v4 SDK: use event_key for sending events
-            event_key=settings.inngest_api_key.get_secret_value() if settings.inngest_api_key else None,
-            api_base_url=settings.inngest_api_url or "https://api.inngest.com",
+            event_key=INNGEST_EVENT_KEY,
+            api_base_url=INNGEST_API_URL,
             # Set is_production based on debug setting
             is_production=not settings.debug,
         )
@@ -87,6 +89,85 @@ class FeedbackProcessedEvent(Event):
     }
 
 
+# ========================
+# Event Buffering
+# ========================
+
+
+# Events sent within the linger window go to Inngest in one request. Every
+# event is appended to the same buffer, so order per feedback is preserved.
+_event_buffer: list[Event] = []
+_buffer_sent: asyncio.Future | None = None
+_linger_task: asyncio.Task | None = None
+_send_tasks: set[asyncio.Task] = set()
+
+
+async def _send_buffered(event: Event) -> None:
+    """Buffer an event and wait until the batch containing it is sent.
+
+    Args:
+        event: Event to send
+
+    Raises:
+        Exception: Whatever the Inngest client raised for the batch
+    """
+    global _buffer_sent, _linger_task
+
+    loop = asyncio.get_running_loop()
+    if _buffer_sent is None:
+        _buffer_sent = loop.create_future()
+    sent = _buffer_sent
+    _event_buffer.append(event)
+
+    if len(_event_buffer) >= settings.inngest_max_batch:
+        if _linger_task is not None:
+            _linger_task.cancel()
+            _linger_task = None
+        _start_send(loop)
+    elif _linger_task is None:
+        # Sends cover other callers' events too, so start from an empty log context
+        _linger_task = loop.create_task(_send_after_linger(), context=contextvars.Context())
+
+    # Shielded so one cancelled caller cannot fail the batch for the others
+    await asyncio.shield(sent)
+
+
+async def _send_after_linger() -> None:
+    """Send the buffer once the linger window elapses."""
+    global _linger_task
+    await asyncio.sleep(settings.inngest_linger_ms / 1000)
+    _linger_task = None
+    _start_send(asyncio.get_running_loop())
+
+
+def _start_send(loop: asyncio.AbstractEventLoop) -> None:
+    """Swap out the buffer and send it in the background."""
+    global _event_buffer, _buffer_sent
+    events, _event_buffer = _event_buffer, []
+    sent, _buffer_sent = _buffer_sent, None
+    if not events or sent is None:
+        return
+
+    task = loop.create_task(_send_events(events, sent), context=contextvars.Context())
+    _send_tasks.add(task)
+    task.add_done_callback(_send_tasks.discard)
+
+
+async def _send_events(events: list[Event], sent: asyncio.Future) -> None:
+    """Send a batch of events and report the outcome to its waiters."""
+    try:
+        await get_inngest_client().send(events)
+    except Exception as e:
+        logger.error("Failed to send Inngest events", count=len(events), error=str(e))
+        sent.set_exception(e)
+        # Waiters re-raise it; mark it retrieved in case none remain
+        sent.exception()
+        return
+
+    logger.debug("Sent Inngest events", count=len(events))
+    sent.set_result(None)
+
+
 # ========================
 # Event Sending Helpers
 # ========================
@@ -100,8 +181,7 @@ async def send_feedback_received(feedback_id: str, content: str, source: str) ->
         content: The feedback text
         source: Where the feedback came from
     """
-    client = get_inngest_client()
-    await client.send(
+    await _send_buffered(
         FeedbackReceivedEvent(
             data={
                 "feedback_id": feedback_id,
@@ -136,8 +216,7 @@ async def send_feedback_processed(
         spec_written: Whether a spec was written
         github_issue_url: URL to created GitHub issue
     """
-    client = get_inngest_client()
-    await client.send(
+    await _send_buffered(
         FeedbackProcessedEvent(
             data={
                 "feedback_id": feedback_id,
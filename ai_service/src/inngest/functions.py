@@ -106,11 +106,11 @@ def create_process_feedback_workflow():
         source = input.get("source", "unknown")
         timestamp = input.get("timestamp", "")
 
-        logger.info(
-            "Processing feedback workflow started",
-            feedback_id=feedback_id,
-            source=source,
-        )
+        # Every log line below carries these without passing them per call
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(feedback_id=feedback_id, source=source)
+
+        logger.info("Processing feedback workflow started")
 
         # Step 1: Triage classification (stateless - no DB)
         triage_state: TriageState = {
@@ -135,12 +135,8 @@ def create_process_feedback_workflow():
         triage_reasoning = triage_result["reasoning"]
         triage_confidence = triage_result["confidence"]
 
-        logger.info(
-            "Triage complete",
-            feedback_id=feedback_id,
-            classification=classification,
-            severity=severity,
-        )
+        structlog.contextvars.bind_contextvars(classification=classification, severity=severity)
+        logger.info("Triage complete")
 
         # Step 2: Check for duplicates (skip questions from deduplication)
         is_duplicate = False
@@ -155,11 +151,7 @@ def create_process_feedback_workflow():
             )
 
             if is_duplicate:
-                logger.info(
-                    "Duplicate detected",
-                    feedback_id=feedback_id,
-                    duplicate_of=duplicate_of,
-                )
+                logger.info("Duplicate detected", duplicate_of=duplicate_of)
 
                 # Send completion event (web app handles duplicate marking)
                 await send_feedback_processed(
@@ -222,11 +214,7 @@ def create_process_feedback_workflow():
             suggested_labels = spec_result["suggested_labels"]
             spec_confidence = spec_result["spec_confidence"]
 
-            logger.info(
-                "Spec written",
-                feedback_id=feedback_id,
-                title=spec_title,
-            )
+            logger.info("Spec written", title=spec_title)
 
             # Step 4: Callback to web app to save draft issue
             github_service = get_github_service()
@@ -241,48 +229,42 @@ def create_process_feedback_workflow():
 
             labels = suggested_labels + [classification, severity]
 
-            await Step.run(
-                ctx,
-                "save_issue_to_webapp",
-                _save_issue_wrapper,
-                {
-                    "feedback_id": feedback_id,
-                    "content": content,
-                    "title": spec_title,
-                    "body": body,
+            # Steps 4 and 5 touch different systems (web app vs Qdrant) and
+            # share no data, so they run as an Inngest parallel group. Each
+            # step interrupts the handler when it first runs, so plain
+            # asyncio.gather would not work here.
+            save_issue_data = {
+                "feedback_id": feedback_id,
+                "content": content,
+                "title": spec_title,
+                "body": body,
+                "classification": classification,
+                "severity": severity,
+                "reasoning": triage_reasoning,
+                "confidence": triage_confidence,
+                "reproduction_steps": reproduction_steps,
+                "affected_components": affected_components,
+                "acceptance_criteria": acceptance_criteria,
+                "suggested_labels": labels,
+            }
+            # Step 5: Index in vector store for future duplicate detection
+            index_data = {
+                "id": feedback_id,
+                "text": content,
+                "metadata": {
                     "classification": classification,
                     "severity": severity,
-                    "reasoning": triage_reasoning,
-                    "confidence": triage_confidence,
-                    "reproduction_steps": reproduction_steps,
-                    "affected_components": affected_components,
-                    "acceptance_criteria": acceptance_criteria,
-                    "suggested_labels": labels,
+                    "source": source,
                 },
+            }
+            await ctx.group.parallel(
+                (
+                    lambda: Step.run(ctx, "save_issue_to_webapp", _save_issue_wrapper, save_issue_data),
+                    lambda: Step.run(ctx, "index_feedback", _index_feedback_wrapper, index_data),
+                )
             )
 
-            logger.info(
-                "Saved issue draft to web app",
-                feedback_id=feedback_id,
-                title=spec_title,
-            )
-
-            # Step 5: Index in vector store for future duplicate detection
-            vector_service = await get_vector_service()
-            await Step.run(
-                ctx,
-                "index_feedback",
-                _index_feedback_wrapper,
-                {
-                    "id": feedback_id,
-                    "text": content,
-                    "metadata": {
-                        "classification": classification,
-                        "severity": severity,
-                        "source": source,
-                    },
-                },
-            )
+            logger.info("Saved issue draft to web app", title=spec_title)
 
         # Step 6: Send completion event
         await send_feedback_processed(
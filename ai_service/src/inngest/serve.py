@@ -3,9 +3,11 @@
 import logging
 from typing import Any
 
+import orjson
 import structlog
 from fastapi import APIRouter, Request, Response
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from src.core.config import settings
 from src.inngest.client import get_inngest_client
@@ -38,6 +40,14 @@ class InngestResponse(BaseModel):
 # ========================
 
 
+# Last path segment -> Inngest client handler
+_INNGEST_HANDLERS = {
+    "events": "_send_events",
+    "fn": "_get_function",
+    "runs": "_get_runs",
+}
+
+
 @inngest_router.post("/inngest/api/{path:path}")
 async def handle_inngest_request(request: Request, path: str) -> Response:
     """Handle all Inngest API requests.
@@ -52,64 +62,27 @@ async def handle_inngest_request(request: Request, path: str) -> Response:
         # Read request body
         body = await request.body()
 
-        # Route based on path
-        if path == "events" or path.endswith("/events"):
-            # Handle event sending
-            from inngest.communication import SendEventsResponse
-
-            inngest_response = await client._send_events(
-                body=body,
-                url=request.url,
-                method=request.method,
-                headers=dict(request.headers),
-            )
-
+        # Route on the last path segment
+        handler_name = _INNGEST_HANDLERS.get(path.rsplit("/", 1)[-1])
+        if handler_name is None:
             return Response(
-                content=inngest_response.model_dump_json(),
-                status_code=inngest_response.status,
-                media_type="application/json",
-            )
-
-        elif path == "fn" or path.endswith("/fn"):
-            # Handle function info
-            from inngest.communication import GetFunctionResponse
-
-            inngest_response = await client._get_function(
-                body=body,
-                url=request.url,
-                method=request.method,
-                headers=dict(request.headers),
-            )
-
-            return Response(
-                content=inngest_response.model_dump_json(),
-                status_code=inngest_response.status,
+                content=orjson.dumps({"error": "Not found"}),
+                status_code=404,
                 media_type="application/json",
             )
 
-        elif path == "runs" or path.endswith("/runs"):
-            # Handle runs
-            from inngest.communication import GetRunsResponse
-
-            inngest_response = await client._get_runs(
-                body=body,
-                url=request.url,
-                method=request.method,
-                headers=dict(request.headers),
-            )
-
-            return Response(
-                content=inngest_response.model_dump_json(),
-                status_code=inngest_response.status,
-                media_type="application/json",
-            )
+        inngest_response = await getattr(client, handler_name)(
+            body=body,
+            url=request.url,
+            method=request.method,
+            headers=dict(request.headers),
+        )
 
-        else:
-            return Response(
-                content='{"error": "Not found"}',
-                status_code=404,
-                media_type="application/json",
-            )
+        return Response(
+            content=to_json(inngest_response),
+            status_code=inngest_response.status,
+            media_type="application/json",
+        )
 
     except Exception as e:
         logger.error(
@@ -118,13 +91,16 @@ async def handle_inngest_request(request: Request, path: str) -> Response:
             error=str(e),
         )
         return Response(
-            content=f'{{"error": "{str(e)}"}}',
+            content=orjson.dumps({"error": str(e)}),
             status_code=500,
             media_type="application/json",
         )
 
 
-@inngest_router.get("/health")
-async def health_check() -> dict[str, str]:
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "iterate-swarm-ai"})
+
+
+@inngest_router.get("/health", response_model=None)
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "iterate-swarm-ai"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -7,66 +7,38 @@ This FastAPI application handles:
 - LLM-powered agent processing
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+import orjson
 import structlog
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, Response
+
+from src.core.logging import configure_logging
+from src.core.tracing import configure_tracing
+
+# Configure structured logging before any module-level loggers are used
+configure_logging()
+langfuse = configure_tracing()
 
 from src.api.webhooks import router as webhooks_router
 from src.api.issues import router as issues_router
 from src.core.config import settings
+from src.core.middleware import BrowserCORSMiddleware
+from src.core.responses import AppJSONResponse
 from src.inngest.serve import inngest_router
 from src.inngest.functions import create_process_feedback_workflow
-from src.services.kafka import get_kafka_service
-
-# Configure structured logging
-structlog.configure(
-    wrapper_class=structlog.make_filtering_bound_logger(
-        getattr(settings, "log_level", "INFO")
-    ),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.dev.ConsoleRenderer(),
-    ],
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+from src.services.kafka import UpstashKafkaService, get_kafka_service
+from src.services.qdrant import get_vector_service
+from src.services.supabase import get_supabase_service
 
 logger = structlog.get_logger(__name__)
 
-app = FastAPI(
-    title=settings.app_name,
-    version="0.1.0",
-    description="IterateSwarm - AI Agent Swarm for Feedback Processing",
-    debug=settings.debug,
-)
-
-# Include routers
-app.include_router(webhooks_router)
-app.include_router(issues_router)
-app.include_router(inngest_router, prefix="")
-
-# CORS Configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Validate configuration and register workflows."""
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm shared clients and register workflows, then clean up on shutdown."""
     logger.info(
         "Starting IterateSwarm AI Service",
         host=settings.app_host,
@@ -74,6 +46,28 @@ async def startup_event() -> None:
         debug=settings.debug,
     )
 
+    # Build the shared Kafka service before the first webhook arrives
+    try:
+        kafka = await get_kafka_service()
+        if isinstance(kafka, UpstashKafkaService):
+            await kafka._get_client()
+    except Exception as e:
+        logger.warning("Failed to initialize Kafka service", error=str(e))
+
+    # Open Qdrant, Ollama and Supabase connections off the request path
+    try:
+        vector_service = await get_vector_service()
+        await vector_service.warmup()
+    except Exception as e:
+        logger.warning("Failed to warm up vector service", error=str(e))
+
+    if settings.supabase_url:
+        try:
+            supabase = await get_supabase_service()
+            await supabase.warmup()
+        except Exception as e:
+            logger.warning("Failed to warm up Supabase service", error=str(e))
+
     # Register Inngest workflows
     try:
         process_feedback = create_process_feedback_workflow()
@@ -87,24 +81,84 @@ async def startup_event() -> None:
             error=str(e),
         )
 
+    yield
 
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Cleanup on shutdown."""
     logger.info("Shutting down IterateSwarm AI Service")
-    # Close Kafka client
+    # Close each client independently so one failure doesn't leak the rest
     from src.services.kafka import _kafka_service
     if _kafka_service is not None:
-        await _kafka_service.close()
+        try:
+            await _kafka_service.close()
+        except Exception as e:
+            logger.warning("Failed to close Kafka service", error=str(e))
+    # Close the shared LLM client's connection pool
+    from src.services.llm_client import close_llm_client
+    try:
+        await close_llm_client()
+    except Exception as e:
+        logger.warning("Failed to close LLM client", error=str(e))
+    # Close the callback client's connection pool
+    from src.client.callback import _callback_client
+    if _callback_client is not None:
+        try:
+            await _callback_client.close()
+        except Exception as e:
+            logger.warning("Failed to close callback client", error=str(e))
+    # Close the vector and Supabase connection pools
+    from src.services.qdrant import _vector_service
+    if _vector_service is not None:
+        try:
+            await _vector_service.close()
+        except Exception as e:
+            logger.warning("Failed to close vector service", error=str(e))
+    from src.services.supabase import _supabase_service
+    if _supabase_service is not None:
+        try:
+            await _supabase_service.close()
+        except Exception as e:
+            logger.warning("Failed to close Supabase service", error=str(e))
+    # Export any buffered spans
+    langfuse.shutdown()
+
+
+app = FastAPI(
+    title=settings.app_name,
+    version="0.1.0",
+    description="IterateSwarm - AI Agent Swarm for Feedback Processing",
+    debug=settings.debug,
+    default_response_class=AppJSONResponse,
+    # Skip OpenAPI schema generation and the docs UIs outside debug
+    openapi_url="/openapi.json" if settings.debug else None,
+    lifespan=lifespan,
+)
+
+# Include routers
+app.include_router(webhooks_router)
+app.include_router(issues_router)
+app.include_router(inngest_router, prefix="")
+
+# CORS Configuration
+app.add_middleware(
+    BrowserCORSMiddleware,
+    skip_prefixes=("/webhooks", "/inngest", "/health"),
+    allow_origins=settings.cors_allow_origins,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+# Health probes hit this constantly; the body never changes, so encode it once
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": settings.app_name})
 
 
-@app.get("/health")
-async def health_check() -> dict[str, str]:
+@app.get("/health", response_model=None)
+async def health_check() -> Response:
     """Health check endpoint for load balancers and monitoring."""
-    return {"status": "healthy", "service": settings.app_name}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.get("/")
+@app.get("/", response_model=None)
 async def root() -> dict[str, Any]:
     """Root endpoint with service information."""
     return {
@@ -112,3 +166,20 @@ async def root() -> dict[str, Any]:
         "version": "0.1.0",
         "status": "running",
     }
+
+
+if __name__ == "__main__":
+    import sys
+
+    import uvicorn
+
+    # uvloop and httptools replace the default asyncio loop and HTTP parser;
+    # uvloop is unavailable on Windows.
+    uvicorn.run(
+        "src.main:app",
+        host=settings.app_host,
+        port=settings.app_port,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=settings.app_workers,
+    )
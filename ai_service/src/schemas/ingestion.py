@@ -4,11 +4,13 @@ Defines strict validation models for Discord and Slack webhook payloads,
 plus the unified FeedbackItem structure for Kafka.
 """
 
+import itertools
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -91,7 +93,7 @@ class DiscordWebhookPayload(BaseModel):
     embeds: list[DiscordEmbed] | None = None
     reactions: list[dict[str, Any]] | None = None
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "frozen": True}
 
     @field_validator("content")
     @classmethod
@@ -106,17 +108,13 @@ class DiscordWebhookPayload(BaseModel):
 
         Returns the content or first embed description as the feedback.
         """
-        if self.content and self.content.strip():
-            return self.content.strip()
-
-        if self.embeds and len(self.embeds) > 0:
-            first_embed = self.embeds[0]
-            if first_embed.description and first_embed.description.strip():
-                return first_embed.description.strip()
-            if first_embed.title and first_embed.title.strip():
-                return first_embed.title.strip()
-
-        return None
+        first_embed = self.embeds[0] if self.embeds else None
+        candidates = (
+            self.content,
+            first_embed and first_embed.description,
+            first_embed and first_embed.title,
+        )
+        return next((stripped for text in candidates if text and (stripped := text.strip())), None)
 
 
 # ========================
@@ -204,7 +202,7 @@ class SlackWebhookPayload(BaseModel):
     subtype: str | None = None
     ts: str | None = None
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "frozen": True}
 
     @field_validator("text")
     @classmethod
@@ -222,25 +220,13 @@ class SlackWebhookPayload(BaseModel):
         2. Attachment text
         3. Main text field
         """
-        # Check blocks first
-        if self.blocks:
-            for block in self.blocks:
-                if block.text:
-                    text_val = block.text.get("text", "")
-                    if text_val.strip():
-                        return text_val.strip()
-
-        # Check attachments
-        if self.attachments:
-            for attachment in self.attachments:
-                if attachment.text and attachment.text.strip():
-                    return attachment.text.strip()
-
-        # Fall back to main text
-        if self.text and self.text.strip():
-            return self.text.strip()
-
-        return None
+        # Lazily chained, so sources after the first hit are never touched
+        candidates = itertools.chain(
+            (block.text.get("text", "") for block in self.blocks or () if block.text),
+            (attachment.text for attachment in self.attachments or ()),
+            (self.text,),
+        )
+        return next((stripped for text in candidates if text and (stripped := text.strip())), None)
 
 
 # ========================
@@ -270,21 +256,46 @@ class FeedbackItem(BaseModel):
         default_factory=dict,
         description="Additional context (channel, user, etc.)",
     )
+    raw_body: bytes | None = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+        description="Original webhook body, published verbatim in place of raw_payload",
+    )
+    dedup_hash: str = Field(
+        default="",
+        description="Fingerprint of the raw webhook body, for idempotent redelivery",
+    )
 
     @classmethod
     def from_discord(
         cls,
         payload: DiscordWebhookPayload,
         feedback_id: UUID | None = None,
+        raw_body: bytes | None = None,
+        dedup_hash: str = "",
     ) -> "FeedbackItem":
-        """Create a FeedbackItem from a Discord webhook payload."""
+        """Create a FeedbackItem from a Discord webhook payload.
+
+        Args:
+            payload: Validated webhook payload
+            feedback_id: ID to assign (generated if omitted)
+            raw_body: Raw request body the payload was parsed from; when
+                given it is kept as-is instead of re-dumping the payload
+            dedup_hash: Fingerprint of raw_body
+        """
         content = payload.extract_feedback_text() or ""
 
-        return cls(
+        # Every field comes from an already-validated payload, so skip
+        # revalidation
+        return cls.model_construct(
             id=feedback_id or uuid4(),
             source=FeedbackSource.DISCORD,
             raw_content=content,
-            raw_payload=payload.model_dump(exclude_none=True),
+            timestamp=datetime.now(timezone.utc),
+            raw_payload={} if raw_body is not None else payload.model_dump(exclude_none=True),
+            raw_body=raw_body,
+            dedup_hash=dedup_hash,
             metadata={
                 "message_id": payload.id,
                 "guild_id": payload.guild_id,
@@ -307,15 +318,30 @@ class FeedbackItem(BaseModel):
         cls,
         payload: SlackWebhookPayload,
         feedback_id: UUID | None = None,
+        raw_body: bytes | None = None,
+        dedup_hash: str = "",
     ) -> "FeedbackItem":
-        """Create a FeedbackItem from a Slack webhook payload."""
+        """Create a FeedbackItem from a Slack webhook payload.
+
+        Args:
+            payload: Validated webhook payload
+            feedback_id: ID to assign (generated if omitted)
+            raw_body: Raw request body the payload was parsed from; when
+                given it is kept as-is instead of re-dumping the payload
+            dedup_hash: Fingerprint of raw_body
+        """
         content = payload.extract_feedback_text() or ""
 
-        return cls(
+        # Every field comes from an already-validated payload, so skip
+        # revalidation
+        return cls.model_construct(
             id=feedback_id or uuid4(),
             source=FeedbackSource.SLACK,
             raw_content=content,
-            raw_payload=payload.model_dump(exclude_none=True),
+            timestamp=datetime.now(timezone.utc),
+            raw_payload={} if raw_body is not None else payload.model_dump(exclude_none=True),
+            raw_body=raw_body,
+            dedup_hash=dedup_hash,
             metadata={
                 "channel": payload.channel,
                 "user_id": payload.user,
@@ -326,15 +352,46 @@ class FeedbackItem(BaseModel):
             },
         )
 
+    def get_raw_payload(self) -> dict[str, Any]:
+        """Return the original webhook payload for audit/debugging.
+
+        Payloads kept as raw bytes are only decoded here, on demand.
+        """
+        if self.raw_body is not None:
+            return orjson.loads(self.raw_body)
+        return self.raw_payload
+
     def to_kafka_message(self) -> dict[str, Any]:
-        """Convert to Kafka message format."""
-        return {
-            "id": str(self.id),
-            "source": self.source.value,
+        """Convert to Kafka message format.
+
+        When the raw webhook body is available it is embedded as an
+        orjson.Fragment, so the serializer copies the original bytes into
+        the message instead of re-encoding the payload.
+
+        The ID, source enum and timestamp are left as objects: both Kafka
+        producers serialize with orjson, which writes them as the same
+        strings str(), .value and isoformat() would, without the Python calls.
+        """
+        message = {
+            "id": self.id,
+            "source": self.source,
             "raw_content": self.raw_content,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp,
             "metadata": self.metadata,
         }
+        if self.raw_body is not None:
+            message["raw_payload"] = orjson.Fragment(self.raw_body)
+        if self.dedup_hash:
+            message["dedup_hash"] = self.dedup_hash
+        return message
+
+    def encoded_message(self) -> bytes:
+        """Return the Kafka message encoded as JSON.
+
+        Not memoized, since the model is mutable and copies would carry
+        stale bytes; callers that need the bytes twice keep them.
+        """
+        return orjson.dumps(self.to_kafka_message())
 
 
 class QueuedResponse(BaseModel):
@@ -52,12 +52,54 @@ class GitHubService:
             )
 
         self._api_url = f"https://api.github.com/repos/{self._owner}/{self._repo_name}"
+        self._repo_verified = False
 
     @property
     def repo_url(self) -> str:
         """Get the repository URL."""
         return f"https://github.com/{self._owner}/{self._repo_name}"
 
+    async def check_repo_exists(self) -> bool:
+        """Check that the configured repository is reachable with our token.
+
+        A positive result is remembered for the lifetime of the service,
+        so only the first call costs a request.
+
+        Returns:
+            True if the repository exists and is visible
+        """
+        if self._repo_verified:
+            return True
+
+        try:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                response = await client.get(
+                    self._api_url,
+                    headers={
+                        "Authorization": f"Bearer {self._token}",
+                        "Accept": "application/vnd.github.v3+json",
+                        "X-GitHub-Api-Version": "2022-11-28",
+                    },
+                )
+
+                if response.status_code == 200:
+                    self._repo_verified = True
+                    return True
+                elif response.status_code == 404:
+                    logger.error("GitHub repo not found", repo=self._repo)
+                    return False
+                else:
+                    response.raise_for_status()
+                    return False
+
+        except httpx.RequestError as e:
+            logger.error(
+                "Failed to check GitHub repo",
+                repo=self._repo,
+                error=str(e),
+            )
+            raise GitHubServiceError(f"Failed to check repository: {e}") from e
+
     async def create_issue(
         self,
         title: str,
@@ -4,12 +4,14 @@ For production with Upstash: Uses HTTP REST API (serverless-friendly)
 For local testing: Uses standard Kafka protocol with aiokafka
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any, Generator
+from typing import Any, TypedDict
 from uuid import uuid4
 
 import httpx
+import orjson
 import structlog
 from aiokafka import AIOKafkaProducer
 from aiokafka.errors import KafkaError
@@ -28,6 +30,25 @@ class KafkaServiceError(Exception):
         super().__init__(self.message)
 
 
+class KafkaEnvelope(TypedDict):
+    """Wrapper every published message is sent in."""
+
+    id: str
+    timestamp: datetime
+    data: dict[str, Any] | orjson.Fragment
+
+
+def _envelope(key: str, data: dict[str, Any] | orjson.Fragment | None) -> KafkaEnvelope:
+    """Wrap message data for publishing.
+
+    The timestamp stays a datetime; orjson writes it in ISO 8601 form when
+    the message is serialized, so no isoformat() call is needed here. Data
+    that is already encoded can be passed as an orjson.Fragment and is
+    copied into the envelope as-is.
+    """
+    return {"id": key, "timestamp": datetime.now(timezone.utc), "data": data}
+
+
 class UpstashKafkaService:
     """Kafka producer using Upstash HTTP REST API.
 
@@ -44,11 +65,22 @@ class UpstashKafkaService:
         self._auth = (self._user, self._password) if self._user else None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get or create the HTTP client.
+
+        HTTP/2 lets concurrent publishes multiplex over a few pooled
+        connections instead of queueing behind one another.
+        """
         if self._client is None:
             self._client = httpx.AsyncClient(
+                http2=True,
                 timeout=10.0,
-                limits=httpx.Limits(keepalive_expiry=5.0),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30.0,
+                ),
+                headers={"Content-Type": "application/json"},
+                auth=self._auth,
             )
         return self._client
 
@@ -78,11 +110,13 @@ class UpstashKafkaService:
             response = await client.request(
                 method=method,
                 url=url,
-                json=json_data,
-                auth=self._auth,
+                content=orjson.dumps(json_data) if json_data is not None else None,
             )
             response.raise_for_status()
             return response.json()
+        except ValueError as e:
+            logger.error("Upstash Kafka returned a non-JSON response", endpoint=endpoint)
+            raise KafkaServiceError(f"Invalid Kafka API response: {e}") from e
         except httpx.HTTPStatusError as e:
             logger.error(
                 "Upstash Kafka HTTP error",
@@ -100,17 +134,11 @@ class UpstashKafkaService:
     async def publish(
         self,
         topic: str,
-        data: dict[str, Any],
+        data: dict[str, Any] | orjson.Fragment,
         message_id: str | None = None,
     ) -> dict[str, Any]:
         """Publish a message to Upstash Kafka."""
-        payload = {
-            "id": message_id or str(uuid4()),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "data": data,
-        }
-
-        body = {"value": payload}
+        body = {"value": _envelope(message_id or str(uuid4()), data)}
         if message_id:
             body["key"] = message_id
 
@@ -121,6 +149,42 @@ class UpstashKafkaService:
         )
 
 
+def _parse_bootstrap(raw_server: str) -> str:
+    """Normalize a broker URL to the host:port form aiokafka expects.
+
+    Args:
+        raw_server: Broker address, optionally with scheme, path or port
+
+    Returns:
+        "host:port", defaulting the port to 9092
+    """
+    # Remove http:// or https:// prefix if present
+    if "://" in raw_server:
+        server = raw_server.split("://", 1)[1]
+    else:
+        server = raw_server
+
+    # Remove trailing path if any
+    if "/" in server:
+        server = server.split("/")[0]
+
+    # Parse host:port
+    if ":" in server:
+        host, port_str = server.rsplit(":", 1)
+        try:
+            return f"{host}:{int(port_str)}"
+        except ValueError:
+            # Port is not numeric, treat entire thing as host
+            return f"{server}:9092"
+
+    # No port specified, add default Kafka port
+    return f"{server}:9092"
+
+
+# Broker address from KAFKA_REST_URL, parsed once per process
+_BOOTSTRAP_SERVER = _parse_bootstrap(settings.kafka_rest_url)
+
+
 class StandardKafkaService:
     """Kafka producer using standard Kafka protocol (aiokafka).
 
@@ -134,46 +198,35 @@ class StandardKafkaService:
             bootstrap_server: Kafka broker address. If None, uses KAFKA_REST_URL:9092
         """
         self._producer: AIOKafkaProducer | None = None
-        # Parse bootstrap server from KAFKA_REST_URL
-        raw_server = bootstrap_server or settings.kafka_rest_url
-
-        # Remove http:// or https:// prefix if present
-        if "://" in raw_server:
-            server = raw_server.split("://", 1)[1]
-        else:
-            server = raw_server
-
-        # Remove trailing path if any
-        if "/" in server:
-            server = server.split("/")[0]
-
-        # Parse host:port
-        if ":" in server:
-            host, port_str = server.rsplit(":", 1)
-            try:
-                port = int(port_str)
-                self._bootstrap_server = f"{host}:{port}"
-            except ValueError:
-                # Port is not numeric, treat entire thing as host
-                self._bootstrap_server = f"{server}:9092"
-        else:
-            # No port specified, add default Kafka port
-            self._bootstrap_server = f"{server}:9092"
-
+        self._bootstrap_server = _parse_bootstrap(bootstrap_server) if bootstrap_server else _BOOTSTRAP_SERVER
         self._default_topic = settings.kafka_topic_feedback
 
     async def start(self) -> None:
         """Start the Kafka producer."""
         if self._producer is None:
+            # Lingering lets the producer's accumulator coalesce publishes
+            # from concurrent requests into one compressed broker request
+            # per partition, rather than one request per webhook.
             self._producer = AIOKafkaProducer(
                 bootstrap_servers=self._bootstrap_server,
-                value_serializer=lambda v: str(v).encode("utf-8"),
+                value_serializer=orjson.dumps,
                 key_serializer=lambda k: k.encode("utf-8") if k else None,
+                linger_ms=settings.kafka_linger_ms,
+                max_batch_size=settings.kafka_max_batch_size,
+                compression_type=settings.kafka_compression_type,
+                acks=settings.kafka_acks,
             )
-            await self._producer.start()
+            try:
+                await self._producer.start()
+            except Exception:
+                # Leave the next publish to retry the connection
+                self._producer = None
+                raise
             logger.info(
                 "Standard Kafka producer started",
                 bootstrap_server=self._bootstrap_server,
+                linger_ms=settings.kafka_linger_ms,
+                compression_type=settings.kafka_compression_type,
             )
 
     async def close(self) -> None:
@@ -192,27 +245,19 @@ class StandardKafkaService:
     async def publish(
         self,
         topic: str | None = None,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | orjson.Fragment | None = None,
         message_id: str | None = None,
     ) -> dict[str, Any]:
         """Publish a message to Kafka."""
-        if self._producer is None:
-            await self.start()
-
         topic = topic or self._default_topic
         key = message_id or str(uuid4())
 
-        # Wrap data in envelope
-        payload = {
-            "id": key,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "data": data,
-        }
-
         try:
+            if self._producer is None:
+                await self.start()
             result = await self._producer.send_and_wait(
                 topic=topic,
-                value=payload,
+                value=_envelope(key, data),
                 key=key,
             )
             logger.info(
@@ -230,33 +275,89 @@ class StandardKafkaService:
             logger.error("Kafka publish error", error=str(e))
             raise KafkaServiceError(f"Kafka error: {e}") from e
 
+    async def publish_many(
+        self,
+        messages: list[tuple[dict[str, Any] | orjson.Fragment, str | None]],
+        topic: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Publish several messages, waiting for their acks together.
+
+        Every message is appended to the producer's batch accumulator before
+        any ack is awaited, so they share broker requests instead of each
+        paying a round-trip.
+
+        Args:
+            messages: (data, message_id) pairs; data may be pre-encoded as an orjson.Fragment
+            topic: Topic to publish to (defaults to the feedback topic)
+
+        Returns:
+            One {topic, partition, offset} dict per message, in order
+
+        Raises:
+            KafkaServiceError: If any message could not be delivered
+        """
+        topic = topic or self._default_topic
+
+        try:
+            if self._producer is None:
+                await self.start()
+            futures = []
+            for data, message_id in messages:
+                key = message_id or str(uuid4())
+                futures.append(
+                    await self._producer.send(
+                        topic=topic,
+                        value=_envelope(key, data),
+                        key=key,
+                    )
+                )
+            results = await asyncio.gather(*futures)
+        except KafkaError as e:
+            logger.error("Kafka batch publish error", error=str(e), count=len(messages))
+            raise KafkaServiceError(f"Kafka error: {e}") from e
+
+        logger.info("Messages sent to Kafka", topic=topic, count=len(results))
+        return [
+            {"topic": topic, "partition": result.partition, "offset": result.offset}
+            for result in results
+        ]
+
 
 # ========================
 # Factory for Kafka Service
 # ========================
 
 
-async def get_kafka_service() -> Generator[
-    UpstashKafkaService | StandardKafkaService, None, None
-]:
-    """Factory for getting the appropriate Kafka service.
+# Singleton for dependency injection
+_kafka_service: UpstashKafkaService | StandardKafkaService | None = None
 
-    Detects whether to use Upstash HTTP or standard Kafka based on:
-    - KAFKA_REST_USER presence (Upstash requires auth)
-    - Connection testing
 
-    Yields:
-        Appropriate Kafka service instance
+def _create_kafka_service() -> UpstashKafkaService | StandardKafkaService:
+    """Pick the Kafka service for the configured environment.
+
+    Upstash is used when KAFKA_REST_USER and KAFKA_REST_PASSWORD are set
+    (Upstash requires auth); otherwise the standard Kafka protocol.
     """
-    # Check if using Upstash (has credentials) or local Kafka
     if settings.kafka_rest_user and settings.kafka_rest_password.get_secret_value():
-        # Upstash - use HTTP service
-        service = UpstashKafkaService()
-    else:
-        # Local Kafka - use standard protocol
-        service = StandardKafkaService()
+        return UpstashKafkaService()
+    return StandardKafkaService()
+
 
-    yield service
+async def get_kafka_service() -> UpstashKafkaService | StandardKafkaService:
+    """Get the shared Kafka service.
+
+    A plain function rather than a generator dependency, so FastAPI does
+    not set up and tear down an exit stack for it on every request. The
+    service is shared across requests so that one producer (and its batch
+    accumulator) serves every webhook; it is closed on app shutdown.
+
+    Returns:
+        Singleton Kafka service instance
+    """
+    global _kafka_service
+    if _kafka_service is None:
+        _kafka_service = _create_kafka_service()
+    return _kafka_service
 
 
 # Alias for backward compatibility
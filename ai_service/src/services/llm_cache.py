@@ -0,0 +1,198 @@
+"""Exact-match cache for LLM completions.
+
+Both agents run at low temperature, so identical prompts produce
+(near-)identical completions. This service caches the raw completion text
+keyed on a hash of the request so repeated feedback skips the LLM round-trip.
+
+Backends:
+- In-memory LRU (default, per-process)
+- Redis (shared across workers, enabled via REDIS_URL)
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+import structlog
+
+from src.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached LLM completions."""
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached value or None if missing/expired."""
+        ...
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Store a value with an optional TTL in seconds."""
+        ...
+
+    async def clear(self) -> None:
+        """Remove all cached values."""
+        ...
+
+
+class InMemoryLRUBackend:
+    """Process-local LRU cache with per-entry expiry."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize the LRU backend.
+
+        Args:
+            maxsize: Maximum number of entries before evicting the oldest
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached value, evicting it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
+
+
+class RedisBackend:
+    """Redis-backed cache shared across worker processes."""
+
+    def __init__(self, url: str, prefix: str = "llm-cache:") -> None:
+        """Initialize the Redis backend.
+
+        Args:
+            url: Redis connection URL
+            prefix: Key prefix to namespace cache entries
+        """
+        # Optional dependency - only required when REDIS_URL is configured
+        from redis.asyncio import Redis
+
+        self._redis = Redis.from_url(url, decode_responses=True)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached value or None if missing."""
+        return await self._redis.get(f"{self._prefix}{key}")
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Store a value with Redis-native expiry."""
+        await self._redis.set(f"{self._prefix}{key}", value, ex=ttl)
+
+    async def clear(self) -> None:
+        """Remove all entries under this backend's prefix."""
+        async for key in self._redis.scan_iter(match=f"{self._prefix}*"):
+            await self._redis.delete(key)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
+
+
+def make_cache_key(model: str, temperature: float, messages: list[str]) -> str:
+    """Build a deterministic cache key for an LLM request.
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        messages: Message contents in order
+
+    Returns:
+        Hex-encoded SHA-256 digest of the request
+    """
+    raw = json.dumps(
+        {"model": model, "temperature": temperature, "messages": messages},
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Cache for raw LLM completion text with hit/miss tracking."""
+
+    def __init__(self, backend: CacheBackend, ttl: int = 86400) -> None:
+        """Initialize the LLM cache.
+
+        Args:
+            backend: Storage backend
+            ttl: Entry lifetime in seconds
+        """
+        self._backend = backend
+        self._ttl = ttl
+        self.stats: dict[str, int] = {"hits": 0, "misses": 0}
+
+    async def get(self, key: str) -> str | None:
+        """Look up a cached completion.
+
+        Backend errors are treated as misses so the cache never blocks
+        the agent from calling the LLM.
+        """
+        try:
+            value = await self._backend.get(key)
+        except Exception as e:
+            logger.warning("LLM cache lookup failed", error=str(e))
+            value = None
+
+        if value is None:
+            self.stats["misses"] += 1
+        else:
+            self.stats["hits"] += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a completion, ignoring backend errors."""
+        try:
+            await self._backend.set(key, value, ttl=self._ttl)
+        except Exception as e:
+            logger.warning("LLM cache store failed", error=str(e))
+
+    async def clear(self) -> None:
+        """Remove all cached completions and reset stats."""
+        await self._backend.clear()
+        self.stats = {"hits": 0, "misses": 0}
+
+
+# Singleton for dependency injection
+_llm_cache: LLMCache | None = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Get or create the LLM cache.
+
+    Uses Redis when REDIS_URL is configured, otherwise an in-memory LRU.
+
+    Returns:
+        Singleton LLMCache instance
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        backend: CacheBackend
+        if settings.redis_url:
+            backend = RedisBackend(settings.redis_url)
+        else:
+            backend = InMemoryLRUBackend(maxsize=settings.llm_cache_max_entries)
+        _llm_cache = LLMCache(backend, ttl=settings.llm_cache_ttl)
+    return _llm_cache
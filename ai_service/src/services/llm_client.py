@@ -0,0 +1,88 @@
+"""Shared OpenAI-compatible LLM client.
+
+Both agents talk to the same Ollama endpoint. Building a fresh AsyncOpenAI
+per call also builds a fresh httpx connection pool, so every request paid
+for a new TCP connection. This module keeps one client (and one pool) for
+the lifetime of the process.
+"""
+
+from typing import Any
+
+import httpx
+import structlog
+from openai import AsyncOpenAI
+from pydantic import BaseModel
+
+logger = structlog.get_logger(__name__)
+
+
+# Singleton for dependency injection
+_llm_client: AsyncOpenAI | None = None
+
+
+def _http2_available() -> bool:
+    """Return True if the optional h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_llm_client() -> AsyncOpenAI:
+    """Get configured OpenAI-compatible LLM client.
+
+    Uses Ollama with qwen2.5-coder for local development. HTTP/2 is
+    negotiated when h2 is installed and the endpoint is served over TLS;
+    plain-HTTP endpoints such as a local Ollama stay on HTTP/1.1.
+
+    Returns:
+        Singleton AsyncOpenAI instance
+    """
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = AsyncOpenAI(
+            base_url="http://localhost:11434/v1",
+            api_key="ollama",  # Dummy key for Ollama
+            http_client=httpx.AsyncClient(
+                http2=_http2_available(),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=256,
+                    max_keepalive_connections=64,
+                    keepalive_expiry=60,
+                ),
+            ),
+        )
+    return _llm_client
+
+
+async def close_llm_client() -> None:
+    """Close the shared client and its connection pool."""
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.close()
+        _llm_client = None
+        logger.info("LLM client closed")
+
+
+def json_schema_response_format(model: type[BaseModel]) -> dict[str, Any]:
+    """Build a structured-output response_format for a Pydantic model.
+
+    The server constrains generation to the schema, so completions can be
+    validated directly with model_validate_json().
+
+    Args:
+        model: Pydantic model describing the expected output
+
+    Returns:
+        Value for the chat.completions.create response_format argument
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "schema": model.model_json_schema(),
+            "strict": True,
+        },
+    }
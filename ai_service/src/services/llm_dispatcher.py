@@ -0,0 +1,158 @@
+"""Batching dispatcher for LLM completion requests.
+
+Concurrent agent invocations each issue their own request to Ollama. This
+service pools submissions that arrive within a short window and releases
+them together so the server can decode them in parallel
+(OLLAMA_NUM_PARALLEL) instead of trickling them in one at a time.
+
+Callers with a tight latency budget bypass the pool and go straight to
+the client. Independently of batching, every request holds a concurrency
+slot while it is in flight (for streams, until the caller's consumer has
+read them) so a burst of feedback cannot queue more work
+on the inference server than it decodes in parallel.
+"""
+
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+from openai import AsyncOpenAI
+
+from src.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Reads a raw completion (e.g. drains a stream) before the slot is released
+Consumer = Callable[[Any], Awaitable[Any]]
+
+# client, create() kwargs, consumer, caller's future
+_Pending = tuple[AsyncOpenAI, dict[str, Any], Consumer | None, asyncio.Future]
+
+
+class LLMDispatcher:
+    """Pools concurrent chat completion requests into batches."""
+
+    def __init__(
+        self,
+        batch_size: int = 8,
+        batch_window_ms: int = 50,
+        sync_budget_ms: int = 1000,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            batch_size: Pending requests that trigger an immediate flush
+            batch_window_ms: Maximum time a request waits for a batch to fill
+            sync_budget_ms: Latency budgets at or below this skip batching
+            max_concurrency: Requests allowed in flight at once (match OLLAMA_NUM_PARALLEL)
+        """
+        self.batch_size = batch_size
+        self.batch_window_ms = batch_window_ms
+        self.sync_budget_ms = sync_budget_ms
+        self._pending: list[_Pending] = []
+        self._window_task: asyncio.Task | None = None
+        # The loop only holds weak references to tasks, so keep full batches alive
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._concurrency_limit = asyncio.Semaphore(max_concurrency)
+
+    async def submit(
+        self,
+        client: AsyncOpenAI,
+        latency_budget_ms: int | None = None,
+        consume: Consumer | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Submit a chat completion request.
+
+        Args:
+            client: Client to issue the request with
+            latency_budget_ms: Caller's latency budget; None means no deadline
+            consume: Reads the response while the concurrency slot is still
+                held; required for streams, whose create() returns before
+                generation finishes
+            **kwargs: Arguments for chat.completions.create
+
+        Returns:
+            The chat completion response, or what `consume` returned for it
+        """
+        if latency_budget_ms is not None and latency_budget_ms <= self.sync_budget_ms:
+            return await self._create(client, kwargs, consume)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((client, kwargs, consume, future))
+
+        # Batch tasks serve many callers; run them outside this caller's log context
+        if len(self._pending) >= self.batch_size:
+            if self._window_task is not None:
+                self._window_task.cancel()
+                self._window_task = None
+            task = loop.create_task(self._run_batch(self._drain()), context=contextvars.Context())
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+        elif self._window_task is None:
+            self._window_task = loop.create_task(self._flush_after_window(), context=contextvars.Context())
+
+        return await future
+
+    async def _create(self, client: AsyncOpenAI, kwargs: dict[str, Any], consume: Consumer | None) -> Any:
+        """Issue one request, and consume its response, while holding a concurrency slot."""
+        async with self._concurrency_limit:
+            response = await client.chat.completions.create(**kwargs)
+            return await consume(response) if consume is not None else response
+
+    def _drain(self) -> list[_Pending]:
+        """Take all pending requests off the queue."""
+        batch, self._pending = self._pending, []
+        return batch
+
+    async def _flush_after_window(self) -> None:
+        """Flush whatever has accumulated once the batch window elapses."""
+        await asyncio.sleep(self.batch_window_ms / 1000)
+        self._window_task = None
+        await self._run_batch(self._drain())
+
+    async def _run_batch(
+        self,
+        batch: list[_Pending],
+    ) -> None:
+        """Issue a batch of requests concurrently and resolve their futures."""
+        if not batch:
+            return
+
+        logger.debug("Dispatching LLM batch", size=len(batch))
+        results = await asyncio.gather(
+            *(self._create(client, kwargs, consume) for client, kwargs, consume, _ in batch),
+            return_exceptions=True,
+        )
+
+        for (*_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+# Singleton for dependency injection
+_llm_dispatcher: LLMDispatcher | None = None
+
+
+def get_llm_dispatcher() -> LLMDispatcher:
+    """Get or create the LLM dispatcher.
+
+    Returns:
+        Singleton LLMDispatcher instance
+    """
+    global _llm_dispatcher
+    if _llm_dispatcher is None:
+        _llm_dispatcher = LLMDispatcher(
+            batch_size=settings.llm_batch_size,
+            batch_window_ms=settings.llm_batch_window_ms,
+            max_concurrency=settings.llm_max_concurrency,
+        )
+    return _llm_dispatcher
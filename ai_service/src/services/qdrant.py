@@ -6,23 +6,107 @@ This service handles:
 - Indexing new feedback items
 """
 
-import logging
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+import httpx
+import numpy as np
+import orjson
 import structlog
 from langfuse import observe
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import Distance, VectorParams
-
+from qdrant_client.models import (
+    Datatype,
+    Direction,
+    Distance,
+    OptimizersConfigDiff,
+    OrderBy,
+    PayloadSchemaType,
+    PointStruct,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
+
+from src.client.batcher import AsyncBatcher
 from src.core.config import settings
 
+if TYPE_CHECKING:
+    from src.schemas.ingestion import FeedbackItem
+    from src.services.vector_index import RecentVectorIndex
+
 logger = structlog.get_logger(__name__)
 
 # Vector size for OpenAI text-embedding-3-small
 EMBEDDING_SIZE = 1536
 
+# Vectors are stored as float16 with an int8 quantized copy kept in RAM;
+# searches oversample the quantized index and rescore with the stored vectors
+# so recall matches full precision.
+_SEARCH_PARAMS = SearchParams(quantization=QuantizationSearchParams(rescore=True, oversampling=2.0))
+
+# Ollama embedding backend
+OLLAMA_URL = "http://localhost:11434"
+EMBEDDING_MODEL = "nomic-embed-text:latest"
+
+# Recent embeddings keyed by content digest. Shared by every VectorService so
+# the triage cache, duplicate check and indexing of one feedback item embed
+# its text once.
+EMBEDDING_CACHE_MAX_ENTRIES = 2048
+_embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+
+
+def _embedding_key(text: str) -> bytes:
+    """Digest used to key the embedding cache."""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+# Qdrant's indexing threshold, restored after a bulk load if the collection
+# reports none
+DEFAULT_INDEXING_THRESHOLD = 10_000
+
+# Vectors this process indexed most recently, checked in memory before a
+# duplicate search goes to Qdrant
+RECENT_VECTORS_MAX_ENTRIES = 2048
+
+
+def _normalize(embedding: np.ndarray | list[float]) -> np.ndarray:
+    """Unit-length float32 copy of an embedding, so a dot product is cosine."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _build_points(
+    items: list[tuple[str, str, dict[str, Any] | None]],
+    embeddings: list[np.ndarray],
+) -> list[PointStruct]:
+    """Build Qdrant points for (id, text, metadata) items and their embeddings.
+
+    Point models only accept lists, so this is where embeddings leave numpy.
+    """
+    indexed_at = datetime.now(timezone.utc).isoformat()
+    points = []
+    for (id, text, metadata), embedding in zip(items, embeddings):
+        # Prepare payload with metadata
+        payload: dict[str, Any] = {
+            "text": text,
+            "indexed_at": indexed_at,
+        }
+        if metadata:
+            payload.update(metadata)
+        points.append(PointStruct(id=id, vector=embedding.tolist(), payload=payload))
+    return points
+
 
 class VectorService:
     """Service for managing vector embeddings and semantic search in Qdrant."""
@@ -41,22 +125,75 @@ class VectorService:
         self._client = client
         self._collection_name = collection_name
         self._qdrant_url = settings.qdrant_url
-        self._qdrant_api_key = settings.qdrant_api_key
+        self._qdrant_api_key = settings.qdrant_api_key.get_secret_value() if settings.qdrant_api_key else None
+        self._http: httpx.AsyncClient | None = None
+        self._collection_ready = False
+        self._ensure_lock = asyncio.Lock()
+        # Ring buffer of recently indexed vectors (unit length) and their IDs
+        self._recent_vectors: np.ndarray | None = None
+        self._recent_ids: list[str | None] = [None] * RECENT_VECTORS_MAX_ENTRIES
+        self._recent_count = 0
+        self._recent_next = 0
+        # Larger approximate index of recent vectors, if enabled
+        self._recent_index: RecentVectorIndex | None = None
+        # Concurrent duplicate checks share one embedding call and one batched Qdrant query
+        self._search_batcher: AsyncBatcher[tuple[str, float, int], tuple[bool, str | None]] = AsyncBatcher(
+            self._search_batch,
+            max_batch=32,
+            max_delay_ms=20,
+        )
 
     async def _get_client(self) -> AsyncQdrantClient:
         """Get or create the Qdrant client."""
         if self._client is None:
             self._client = AsyncQdrantClient(
                 url=self._qdrant_url,
-                api_key=self._qdrant_api_key.get_secret_value() if self._qdrant_api_key else None,
+                api_key=self._qdrant_api_key,
+                prefer_grpc=settings.qdrant_prefer_grpc,
+                grpc_port=settings.qdrant_grpc_port,
+                # Keep an idle gRPC channel open between bursts
+                grpc_options={"grpc.keepalive_time_ms": 30_000},
             )
         return self._client
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP/2 client for embedding requests."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=40,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        return self._http
+
+    async def warmup(self) -> None:
+        """Open the Qdrant and embedding server connections before the first request.
+
+        Also runs the one-time collection check, so the first duplicate
+        check pays for none of this.
+        """
+        await self._get_client()
+        await self.ensure_collection()
+        if settings.embedding_backend == "tei":
+            response = await self._get_http_client().get(f"{settings.tei_url}/health")
+        else:
+            response = await self._get_http_client().get(f"{OLLAMA_URL}/api/version")
+        response.raise_for_status()
+        logger.info("Vector service warmed up", collection=self._collection_name)
+
     async def close(self) -> None:
-        """Close the Qdrant client."""
+        """Close the Qdrant and embedding clients."""
+        await self._search_batcher.close()
         if self._client is not None:
-            await self._client.aclose()
+            await self._client.close()
             self._client = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def __aenter__(self) -> "VectorService":
         return self
@@ -64,25 +201,41 @@ class VectorService:
     async def __aexit__(self, *args: Any) -> None:
         await self.close()
 
-    @observe(name="vector_service.ensure_collection")
     async def ensure_collection(self) -> bool:
         """Ensure the feedback collection exists with proper configuration.
 
+        Qdrant is only asked once per service; later calls return
+        immediately.
+
+        Returns:
+            True if collection exists or was created successfully
+        """
+        if self._collection_ready:
+            return True
+
+        async with self._ensure_lock:
+            # Another caller may have finished the check while we waited
+            if not self._collection_ready:
+                self._collection_ready = await self._create_collection_if_missing()
+                if self._collection_ready:
+                    await self._load_recent_vectors()
+        return self._collection_ready
+
+    async def _create_collection_if_missing(self) -> bool:
+        """Create the feedback collection unless it already exists.
+
         Returns:
             True if collection exists or was created successfully
         """
         client = await self._get_client()
 
         try:
-            # Check if collection exists
-            collections = await client.get_collections()
-            collection_names = [c.name for c in collections.collections]
-
-            if self._collection_name in collection_names:
+            if await client.collection_exists(self._collection_name):
                 logger.info(
                     "Collection already exists",
                     collection=self._collection_name,
                 )
+                await self._ensure_recency_index()
                 return True
 
             # Create collection with OpenAI-compatible vectors
@@ -97,6 +250,15 @@ class VectorService:
                 vectors_config=VectorParams(
                     size=EMBEDDING_SIZE,
                     distance=Distance.COSINE,
+                    datatype=Datatype.FLOAT16,
+                    on_disk=False,
+                ),
+                quantization_config=ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8,
+                        quantile=0.99,
+                        always_ram=True,
+                    ),
                 ),
             )
 
@@ -104,6 +266,7 @@ class VectorService:
                 "Collection created successfully",
                 collection=self._collection_name,
             )
+            await self._ensure_recency_index()
             return True
 
         except Exception as e:
@@ -123,6 +286,9 @@ class VectorService:
     ) -> tuple[bool, str | None]:
         """Search for semantically similar feedback.
 
+        Searches issued concurrently are embedded and sent to Qdrant
+        together as one batch.
+
         Args:
             text: The text to search for
             threshold: Minimum similarity score (0-1) to consider a match
@@ -133,45 +299,256 @@ class VectorService:
             - is_duplicate: True if a similar item was found
             - existing_id: The ID of the matching item if found
         """
-        client = await self._get_client()
-
         # First, ensure collection exists
         await self.ensure_collection()
 
         try:
-            # Generate embedding using OpenAI-compatible API
-            embedding = await self._get_embedding(text)
+            return await self._search_batcher.submit((text, threshold, limit))
 
-            # Search for similar vectors
-            results = await client.search(
-                collection_name=self._collection_name,
-                query_vector=embedding,
-                limit=limit,
-                score_threshold=threshold,
+        except Exception as e:
+            logger.error(
+                "Search failed",
+                error=str(e),
             )
+            # Return False on error to allow processing to continue
+            return False, None
 
-            if results and len(results) > 0:
-                best_match = results[0]
+    @observe(name="vector_service.search_similar_batch")
+    async def search_similar_batch(
+        self,
+        texts: list[str],
+        threshold: float = 0.85,
+        limit: int = 5,
+    ) -> list[tuple[bool, str | None]]:
+        """Check several texts for duplicates at once.
+
+        All texts are embedded in one request and scored against the recent
+        vectors with a single matrix product; only the misses are searched
+        in Qdrant, in one batched query.
+
+        Args:
+            texts: The texts to check
+            threshold: Minimum similarity score (0-1) to consider a match
+            limit: Maximum number of results per text
+
+        Returns:
+            One (is_duplicate, existing_id) tuple per text, in order
+        """
+        if not texts:
+            return []
+
+        await self.ensure_collection()
+        return await self._search_batch([(text, threshold, limit) for text in texts])
+
+    async def _search_batch(
+        self,
+        queries: list[tuple[str, float, int]],
+    ) -> list[tuple[bool, str | None]]:
+        """Embed and search a batch of queries with one call to each backend.
+
+        Args:
+            queries: (text, threshold, limit) tuples
+
+        Returns:
+            One (is_duplicate, existing_id) tuple per query, in order
+        """
+        client = await self._get_client()
+
+        # Generate all embeddings in a single request
+        embeddings = await self._get_embeddings([text for text, _, _ in queries])
+
+        # Items indexed recently are answered from memory
+        recent_ids = self._recent_matches(embeddings, [threshold for _, threshold, _ in queries])
+        matches: list[tuple[bool, str | None] | None] = [
+            (True, recent_id) if recent_id else None for recent_id in recent_ids
+        ]
+        pending = [i for i, match in enumerate(matches) if match is None]
+
+        # Then the approximate index of older recent vectors, if enabled
+        if pending and self._recent_index is not None and len(embeddings[0]) == self._recent_index.dim:
+            index_ids = self._recent_index.search(
+                np.stack([_normalize(embeddings[i]) for i in pending]),
+                [queries[i][1] for i in pending],
+            )
+            for i, index_id in zip(pending, index_ids):
+                if index_id:
+                    matches[i] = (True, index_id)
+            pending = [i for i, match in enumerate(matches) if match is None]
+
+        if not pending:
+            logger.debug("Duplicate checks answered from recent vectors", count=len(queries))
+            return matches
+
+        # Search for similar vectors; only IDs and scores are needed
+        batch_results = await client.query_batch_points(
+            collection_name=self._collection_name,
+            requests=[
+                QueryRequest(
+                    query=embeddings[i].tolist(),
+                    limit=queries[i][2],
+                    score_threshold=queries[i][1],
+                    params=_SEARCH_PARAMS,
+                    with_payload=False,
+                    with_vector=False,
+                )
+                for i in pending
+            ],
+        )
+
+        for i, response in zip(pending, batch_results):
+            if response.points:
+                best_match = response.points[0]
                 logger.info(
                     "Found similar feedback",
                     score=best_match.score,
                     id=best_match.id,
                 )
-                return True, str(best_match.id)
+                matches[i] = (True, str(best_match.id))
+            else:
+                matches[i] = (False, None)
+        return matches
 
-            logger.debug(
-                "No similar feedback found",
-                threshold=threshold,
-            )
-            return False, None
+    def _recent_matches(self, embeddings: list[np.ndarray], thresholds: list[float]) -> list[str | None]:
+        """Match a batch of embeddings against the recent vectors in one matrix product.
 
+        Args:
+            embeddings: Query embeddings
+            thresholds: Minimum cosine similarity per query
+
+        Returns:
+            Per query, the ID of the most similar recent item, or None if
+            none is close enough
+        """
+        misses: list[str | None] = [None] * len(embeddings)
+        if not self._recent_count or self._recent_vectors is None or not embeddings:
+            return misses
+
+        queries = np.asarray(embeddings, dtype=np.float32)
+        if queries.ndim != 2 or queries.shape[1] != self._recent_vectors.shape[1]:
+            return misses
+
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        # (recent, queries) cosine similarities
+        similarities = self._recent_vectors[: self._recent_count] @ (queries / norms).T
+        best = similarities.argmax(axis=0)
+        scores = similarities[best, np.arange(len(embeddings))]
+
+        matches: list[str | None] = []
+        for index, score, threshold in zip(best.tolist(), scores.tolist(), thresholds):
+            if score < threshold:
+                matches.append(None)
+                continue
+            logger.info("Found similar feedback in recent vectors", score=score, id=self._recent_ids[index])
+            matches.append(self._recent_ids[index])
+        return matches
+
+    async def _ensure_recency_index(self) -> None:
+        """Index indexed_at so the newest points can be scrolled in order.
+
+        Creating an index that already exists is a no-op. Failures only cost
+        the ordering of the warm start.
+        """
+        client = await self._get_client()
+        try:
+            await client.create_payload_index(
+                collection_name=self._collection_name,
+                field_name="indexed_at",
+                field_schema=PayloadSchemaType.DATETIME,
+            )
         except Exception as e:
-            logger.error(
-                "Search failed",
-                error=str(e),
+            logger.warning("Failed to index indexed_at", collection=self._collection_name, error=str(e))
+
+    async def _load_recent_vectors(self) -> None:
+        """Seed the recent vectors with the newest points in the collection.
+
+        Lets a fresh process answer duplicate checks in memory before it has
+        indexed anything itself. Failures only cost the warm start.
+        """
+        client = await self._get_client()
+        try:
+            points, _ = await client.scroll(
+                collection_name=self._collection_name,
+                limit=RECENT_VECTORS_MAX_ENTRIES,
+                order_by=OrderBy(key="indexed_at", direction=Direction.DESC),
+                with_payload=False,
+                with_vectors=True,
             )
-            # Return False on error to allow processing to continue
-            return False, None
+        except Exception as e:
+            logger.warning("Failed to load recent vectors", collection=self._collection_name, error=str(e))
+            return
+
+        # Newest first from Qdrant; remember oldest first so the newest are evicted last
+        loaded = [(str(point.id), point.vector) for point in reversed(points) if isinstance(point.vector, list)]
+        self._remember_indexed([id for id, _ in loaded], [vector for _, vector in loaded])
+        logger.info("Loaded recent vectors", collection=self._collection_name, count=len(loaded))
+
+        if settings.dedup_faiss_enabled:
+            await self._load_recent_index()
+
+    async def _load_recent_index(self) -> None:
+        """Build and train the approximate recent-vector index from the collection.
+
+        The index stays disabled until the collection holds enough vectors
+        to train it. Failures only cost the index, never the service.
+        """
+        client = await self._get_client()
+        ids: list[str] = []
+        vectors: list[np.ndarray] = []
+        offset = None
+        try:
+            while len(ids) < settings.dedup_faiss_max_entries:
+                points, offset = await client.scroll(
+                    collection_name=self._collection_name,
+                    limit=min(1000, settings.dedup_faiss_max_entries - len(ids)),
+                    offset=offset,
+                    with_payload=False,
+                    with_vectors=True,
+                )
+                for point in points:
+                    if isinstance(point.vector, list):
+                        ids.append(str(point.id))
+                        vectors.append(_normalize(point.vector))
+                if offset is None:
+                    break
+
+            if not vectors:
+                return
+            from src.services.vector_index import RecentVectorIndex
+
+            index = RecentVectorIndex(len(vectors[0]), max_entries=settings.dedup_faiss_max_entries)
+            matrix = np.stack(vectors)
+            if not index.train(matrix):
+                logger.info(
+                    "Too few vectors to train recent vector index",
+                    count=len(vectors),
+                    required=index.min_training_size,
+                )
+                return
+            index.add(ids, matrix)
+        except Exception as e:
+            logger.warning("Failed to build recent vector index", collection=self._collection_name, error=str(e))
+            return
+
+        self._recent_index = index
+        logger.info("Built recent vector index", collection=self._collection_name, count=len(index))
+
+    def _remember_indexed(self, ids: list[str], embeddings: list[np.ndarray] | list[list[float]]) -> None:
+        """Add indexed vectors to the recent ring buffer, overwriting the oldest."""
+        normalized = [_normalize(embedding) for embedding in embeddings]
+        if self._recent_index is not None and normalized and len(normalized[0]) == self._recent_index.dim:
+            self._recent_index.add(list(ids), np.stack(normalized))
+
+        for id, vector in zip(ids, normalized):
+            if self._recent_vectors is None or self._recent_vectors.shape[1] != len(vector):
+                self._recent_vectors = np.zeros((RECENT_VECTORS_MAX_ENTRIES, len(vector)), dtype=np.float32)
+                self._recent_count = 0
+                self._recent_next = 0
+
+            self._recent_vectors[self._recent_next] = vector
+            self._recent_ids[self._recent_next] = id
+            self._recent_next = (self._recent_next + 1) % RECENT_VECTORS_MAX_ENTRIES
+            self._recent_count = min(self._recent_count + 1, RECENT_VECTORS_MAX_ENTRIES)
 
     @observe(name="vector_service.index_item")
     async def index_item(
@@ -187,6 +564,21 @@ class VectorService:
             text: The feedback text to embed and store
             metadata: Optional metadata to store with the vector
 
+        Returns:
+            True if indexing was successful
+        """
+        return await self.index_items([(id, text, metadata)])
+
+    @observe(name="vector_service.index_items")
+    async def index_items(
+        self,
+        items: list[tuple[str, str, dict[str, Any] | None]],
+    ) -> bool:
+        """Index several feedback items with one embedding call and one upsert.
+
+        Args:
+            items: (id, text, metadata) tuples
+
         Returns:
             True if indexing was successful
         """
@@ -196,67 +588,198 @@ class VectorService:
         await self.ensure_collection()
 
         try:
-            # Generate embedding
-            embedding = await self._get_embedding(text)
-
-            # Prepare payload with metadata
-            payload: dict[str, Any] = {
-                "text": text,
-                "indexed_at": datetime.now(timezone.utc).isoformat(),
-            }
-            if metadata:
-                payload.update(metadata)
-
-            # Upsert the point
-            from qdrant_client.models import PointStruct
+            # Generate all embeddings in a single request
+            embeddings = await self._get_embeddings([text for _, text, _ in items])
 
+            # Upsert the points
             await client.upsert(
                 collection_name=self._collection_name,
-                points=[
-                    PointStruct(
-                        id=id,
-                        vector=embedding,
-                        payload=payload,
-                    )
-                ],
+                points=_build_points(items, embeddings),
             )
+            self._remember_indexed([id for id, _, _ in items], embeddings)
 
-            logger.info(
-                "Indexed feedback item",
-                id=id,
-                text_preview=text[:100],
-            )
+            # One event per batch rather than per item
+            logger.info("Indexed feedback items", ids=[id for id, _, _ in items])
             return True
 
         except Exception as e:
             logger.error(
-                "Failed to index item",
-                id=id,
+                "Failed to index items",
+                ids=[id for id, _, _ in items],
+                error=str(e),
+            )
+            raise
+
+    @observe(name="vector_service.index_items_bulk")
+    async def index_items_bulk(
+        self,
+        items: list[tuple[str, str, dict[str, Any] | None]],
+        batch_size: int = 64,
+        parallel: int | None = None,
+    ) -> int:
+        """Backfill many feedback items, upserting batches concurrently.
+
+        HNSW indexing is paused on the collection while the points load and
+        restored afterwards, so Qdrant builds the index once instead of
+        rebuilding it as every batch arrives.
+
+        Args:
+            items: (id, text, metadata) tuples
+            batch_size: Items embedded and upserted per request
+            parallel: Batches in flight at once (defaults to min(8, CPU count))
+
+        Returns:
+            Number of items indexed
+        """
+        client = await self._get_client()
+        await self.ensure_collection()
+
+        semaphore = asyncio.Semaphore(parallel or min(8, os.cpu_count() or 1))
+        batches = [items[start : start + batch_size] for start in range(0, len(items), batch_size)]
+
+        async def upload(batch: list[tuple[str, str, dict[str, Any] | None]]) -> None:
+            async with semaphore:
+                embeddings = await self._get_embeddings([text for _, text, _ in batch])
+                await client.upsert(
+                    collection_name=self._collection_name,
+                    points=_build_points(batch, embeddings),
+                    wait=False,
+                )
+                self._remember_indexed([id for id, _, _ in batch], embeddings)
+
+        collection = await client.get_collection(self._collection_name)
+        indexing_threshold = collection.config.optimizer_config.indexing_threshold
+        if indexing_threshold is None:
+            indexing_threshold = DEFAULT_INDEXING_THRESHOLD
+
+        await client.update_collection(
+            collection_name=self._collection_name,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
+        )
+        try:
+            await asyncio.gather(*(upload(batch) for batch in batches))
+        except Exception as e:
+            logger.error(
+                "Bulk indexing failed",
+                collection=self._collection_name,
+                count=len(items),
                 error=str(e),
             )
             raise
+        finally:
+            await client.update_collection(
+                collection_name=self._collection_name,
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=indexing_threshold),
+            )
+
+        logger.info(
+            "Bulk indexed feedback items",
+            collection=self._collection_name,
+            count=len(items),
+            batches=len(batches),
+        )
+        return len(items)
 
-    async def _get_embedding(self, text: str) -> list[float]:
+    async def _get_embedding(self, text: str) -> np.ndarray:
         """Get embedding for text using OpenAI-compatible API.
 
         Uses Ollama with nomic-embed-text for embeddings.
+
+        Returns:
+            float32 embedding vector
         """
-        import httpx
-
-        # Ollama embedding endpoint
-        embedding_url = "http://localhost:11434/api/embeddings"
-
-        async with httpx.AsyncClient(timeout=60.0) as http_client:
-            response = await http_client.post(
-                embedding_url,
-                json={
-                    "model": "nomic-embed-text:latest",
-                    "text": text,
-                },
-            )
+        embeddings = await self._get_embeddings([text])
+        return embeddings[0]
+
+    async def _get_embeddings(self, texts: list[str]) -> list[np.ndarray]:
+        """Get embeddings for several texts, reusing recently computed ones.
+
+        Embeddings are kept as float32 arrays, a quarter the size of a list
+        of Python floats, and only converted to lists where Qdrant's point
+        and query models require it.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One float32 embedding per text, in order
+        """
+        keys = [_embedding_key(text) for text in texts]
+        found: dict[bytes, np.ndarray] = {}
+        for key in keys:
+            if key in _embedding_cache:
+                _embedding_cache.move_to_end(key)
+                found[key] = _embedding_cache[key]
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        if missing:
+            embeddings = np.asarray(await self._request_embeddings(list(missing.values())), dtype=np.float32)
+            for key, embedding in zip(missing, embeddings):
+                found[key] = embedding
+                _embedding_cache[key] = embedding
+                if len(_embedding_cache) > EMBEDDING_CACHE_MAX_ENTRIES:
+                    _embedding_cache.popitem(last=False)
+
+        return [found[key] for key in keys]
+
+    async def _request_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in one request.
+
+        Uses Ollama's batch embed endpoint with nomic-embed-text, falling
+        back to concurrent calls to the legacy per-text endpoint on Ollama
+        versions without it. With EMBEDDING_BACKEND=tei the batch goes to
+        a text-embeddings-inference server instead.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per text, in order
+        """
+        if settings.embedding_backend == "tei":
+            return await self._request_tei_embeddings(texts)
+
+        http_client = self._get_http_client()
+
+        # Ollama batch embedding endpoint
+        response = await http_client.post(
+            f"{OLLAMA_URL}/api/embed",
+            json={
+                "model": EMBEDDING_MODEL,
+                "input": texts,
+            },
+        )
+        if response.status_code != 404:
             response.raise_for_status()
-            data = response.json()
-            return data["embedding"]
+            # A batch is thousands of floats per text; orjson parses them
+            # several times faster than the stdlib decoder behind .json()
+            data = orjson.loads(response.content)
+            if "embeddings" in data:
+                return data["embeddings"]
+
+        logger.warning("Batch embed endpoint unavailable, embedding texts one at a time", count=len(texts))
+        return list(await asyncio.gather(*(self._request_legacy_embedding(text) for text in texts)))
+
+    async def _request_legacy_embedding(self, text: str) -> list[float]:
+        """Embed one text with Ollama's legacy /api/embeddings endpoint."""
+        response = await self._get_http_client().post(
+            f"{OLLAMA_URL}/api/embeddings",
+            json={
+                "model": EMBEDDING_MODEL,
+                "prompt": text,
+            },
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)["embedding"]
+
+    async def _request_tei_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with a Hugging Face text-embeddings-inference server."""
+        response = await self._get_http_client().post(
+            f"{settings.tei_url}/embed",
+            json={"inputs": texts},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
 
 # Singleton for dependency injection
@@ -273,3 +796,31 @@ async def get_vector_service() -> VectorService:
     if _vector_service is None:
         _vector_service = VectorService()
     return _vector_service
+
+
+async def ingest_and_check(feedback: "FeedbackItem") -> tuple[bool, str | None]:
+    """Persist raw feedback while checking it for duplicates.
+
+    The Supabase insert and the Qdrant search do not depend on each other,
+    so both run concurrently; the duplicate flag is written afterwards.
+    save_raw_feedback skips a row that already exists, so a retried call is safe.
+
+    Args:
+        feedback: The incoming feedback item
+
+    Returns:
+        Tuple of (is_duplicate, existing_id)
+    """
+    from src.services.supabase import get_supabase_service
+
+    vector_service, supabase = await asyncio.gather(get_vector_service(), get_supabase_service())
+
+    (is_duplicate, existing_id), _ = await asyncio.gather(
+        vector_service.search_similar(feedback.raw_content),
+        supabase.save_raw_feedback(feedback),
+    )
+
+    if is_duplicate and existing_id:
+        await supabase.mark_as_duplicate(str(feedback.id), existing_id)
+
+    return is_duplicate, existing_id
@@ -0,0 +1,131 @@
+"""Semantic cache for triage results backed by Qdrant.
+
+Near-duplicate feedback ("login broken on Safari" / "login broken on Chrome")
+should classify identically. This service embeds incoming feedback and
+returns a stored triage result when a previous item is similar enough,
+turning a full LLM decode into an embedding lookup.
+"""
+
+from typing import Any
+from uuid import uuid4
+
+import numpy as np
+import structlog
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from src.core.config import settings
+from src.services.qdrant import VectorService
+
+logger = structlog.get_logger(__name__)
+
+
+class SemanticCache:
+    """Embedding-similarity cache for triage results."""
+
+    def __init__(
+        self,
+        vector_service: VectorService | None = None,
+        collection_name: str = "triage_cache",
+        threshold: float = 0.92,
+    ) -> None:
+        """Initialize the semantic cache.
+
+        Args:
+            vector_service: Vector service providing the Qdrant client and embedder
+            collection_name: Qdrant collection holding cached results
+            threshold: Minimum cosine similarity to treat as a hit
+        """
+        self._vector_service = vector_service or VectorService(collection_name=collection_name)
+        self._collection_name = collection_name
+        self._threshold = threshold
+        self._collection_ready = False
+
+    async def _ensure_collection(self, vector_size: int) -> None:
+        """Create the cache collection sized to the embedder's output."""
+        if self._collection_ready:
+            return
+
+        client = await self._vector_service._get_client()
+        collections = await client.get_collections()
+        if self._collection_name not in [c.name for c in collections.collections]:
+            await client.create_collection(
+                collection_name=self._collection_name,
+                vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
+            )
+            logger.info(
+                "Created semantic cache collection",
+                collection=self._collection_name,
+                vector_size=vector_size,
+            )
+        self._collection_ready = True
+
+    async def lookup(self, text: str) -> tuple[np.ndarray | None, dict[str, Any] | None]:
+        """Find a cached result for semantically similar text.
+
+        Errors are logged and treated as misses so triage can continue.
+
+        Args:
+            text: The feedback text
+
+        Returns:
+            Tuple of (embedding, cached_result)
+            - embedding: The text's embedding, reusable for store(), or None on error
+            - cached_result: The stored triage result if similarity >= threshold
+        """
+        try:
+            embedding = await self._vector_service._get_embedding(text)
+            await self._ensure_collection(len(embedding))
+
+            client = await self._vector_service._get_client()
+            response = await client.query_points(
+                collection_name=self._collection_name,
+                query=embedding,
+                limit=1,
+                score_threshold=self._threshold,
+                with_payload=True,
+            )
+            results = response.points
+        except Exception as e:
+            logger.warning("Semantic cache lookup failed", error=str(e))
+            return None, None
+
+        if results:
+            logger.info("Semantic cache hit", score=results[0].score)
+            return embedding, dict(results[0].payload or {})
+
+        return embedding, None
+
+    async def store(self, embedding: np.ndarray, result: dict[str, Any]) -> None:
+        """Store a triage result under its feedback embedding.
+
+        Args:
+            embedding: Embedding returned by lookup()
+            result: The triage result to cache
+        """
+        try:
+            await self._ensure_collection(len(embedding))
+            client = await self._vector_service._get_client()
+            await client.upsert(
+                collection_name=self._collection_name,
+                points=[PointStruct(id=str(uuid4()), vector=embedding.tolist(), payload=result)],
+            )
+        except Exception as e:
+            logger.warning("Semantic cache store failed", error=str(e))
+
+
+# Singleton for dependency injection
+_semantic_cache: SemanticCache | None = None
+
+
+def get_semantic_cache() -> SemanticCache | None:
+    """Get or create the triage semantic cache.
+
+    Returns:
+        Singleton SemanticCache instance, or None if disabled
+    """
+    global _semantic_cache
+    if not settings.triage_semantic_cache_enabled:
+        return None
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache(threshold=settings.triage_semantic_cache_threshold)
+    return _semantic_cache
@@ -0,0 +1,125 @@
+"""Structural template cache for the Spec Writer Agent.
+
+Specs for the same (classification, severity) bucket share most of their
+structure - affected components, acceptance criteria and labels repeat while
+only the title and reproduction steps vary. This service keeps the most
+recent spec per bucket plus the embedding of the feedback that produced it,
+so the spec writer can reuse the skeleton and only ask the LLM for the
+fields that actually differ. A spec is reused whole only for feedback that
+is near-identical to that exemplar.
+"""
+
+from typing import Any
+
+import numpy as np
+import structlog
+
+from src.core.config import settings
+from src.services.qdrant import VectorService
+
+logger = structlog.get_logger(__name__)
+
+
+def cosine_similarity(a: np.ndarray | list[float], b: np.ndarray | list[float]) -> float:
+    """Cosine similarity of two equal-length vectors."""
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    norm = float(np.linalg.norm(a) * np.linalg.norm(b))
+    return float(a @ b) / norm if norm else 0.0
+
+
+class SpecTemplateCache:
+    """Per-bucket cache of spec skeletons keyed by (classification, severity)."""
+
+    def __init__(
+        self,
+        vector_service: VectorService | None = None,
+        similarity_threshold: float = 0.95,
+    ) -> None:
+        """Initialize the template cache.
+
+        Args:
+            vector_service: Vector service providing the embedder
+            similarity_threshold: Similarity to the bucket's exemplar feedback
+                above which the template is reused without calling the LLM
+        """
+        self._vector_service = vector_service or VectorService()
+        self.similarity_threshold = similarity_threshold
+        self._buckets: dict[tuple[str, str], dict[str, Any]] = {}
+
+    async def embed(self, text: str) -> np.ndarray | None:
+        """Embed feedback text, returning None if the embedder is unavailable."""
+        try:
+            return await self._vector_service._get_embedding(text)
+        except Exception as e:
+            logger.warning("Spec template embedding failed", error=str(e))
+            return None
+
+    def match(
+        self,
+        classification: str,
+        severity: str,
+        embedding: np.ndarray | None,
+    ) -> tuple[dict[str, Any] | None, float]:
+        """Return the bucket's template and its exemplar's similarity to the feedback.
+
+        Args:
+            classification: Triage classification
+            severity: Triage severity
+            embedding: Feedback embedding, or None if unavailable
+
+        Returns:
+            Tuple of (template, similarity); template is None for an empty bucket
+        """
+        bucket = self._buckets.get((classification, severity))
+        if bucket is None:
+            return None, 0.0
+        if embedding is None:
+            return bucket["template"], 0.0
+        return bucket["template"], cosine_similarity(bucket["exemplar"], embedding)
+
+    def update(
+        self,
+        classification: str,
+        severity: str,
+        embedding: np.ndarray | None,
+        template: dict[str, Any],
+    ) -> None:
+        """Make a freshly generated spec the bucket template.
+
+        Args:
+            classification: Triage classification
+            severity: Triage severity
+            embedding: Embedding of the feedback the spec was written for
+            template: Freshly generated spec to use as the bucket template
+        """
+        if embedding is None:
+            return
+        self._buckets[(classification, severity)] = {
+            "template": template,
+            "exemplar": np.array(embedding, dtype=np.float32),
+        }
+
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        self._buckets.clear()
+
+
+# Singleton for dependency injection
+_spec_template_cache: SpecTemplateCache | None = None
+
+
+def get_spec_template_cache() -> SpecTemplateCache | None:
+    """Get or create the spec template cache.
+
+    Returns:
+        Singleton SpecTemplateCache instance, or None if disabled
+    """
+    global _spec_template_cache
+    if not settings.spec_template_cache_enabled:
+        return None
+    if _spec_template_cache is None:
+        _spec_template_cache = SpecTemplateCache(
+            similarity_threshold=settings.spec_template_similarity_threshold,
+        )
+    return _spec_template_cache
@@ -6,14 +6,13 @@ This service handles:
 - Status updates for the approval flow
 """
 
-import logging
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
+import httpx
+import orjson
 import structlog
-from supabase import AsyncClient, create_client
-from supabase.lib.client_options import SyncClientOptions
 
 from src.core.config import settings
 from src.schemas.ingestion import FeedbackItem
@@ -21,6 +20,11 @@ from src.schemas.ingestion import FeedbackItem
 logger = structlog.get_logger(__name__)
 
 
+# Issue columns shown in the draft list; the body and spec fields are only
+# needed on the detail view.
+DRAFT_LIST_COLUMNS = "id,feedback_id,title,status,labels,triage_classification,triage_severity,created_at"
+
+
 class SupabaseServiceError(Exception):
     """Base exception for Supabase service errors."""
 
@@ -30,12 +34,105 @@ class SupabaseServiceError(Exception):
         super().__init__(self.message)
 
 
+def _in(values: list[str]) -> str:
+    """PostgREST `in` filter for a list of values."""
+    return f"in.({','.join(values)})"
+
+
+class _PostgrestAsync:
+    """Minimal async PostgREST client for the Supabase REST API.
+
+    Requests go straight through one pooled HTTP/2 httpx client rather than
+    supabase-py's synchronous stack. Bodies are encoded with orjson, so rows
+    may carry datetime values directly; they are written as ISO 8601.
+    """
+
+    def __init__(self, base_url: str, api_key: str) -> None:
+        """Initialize the client.
+
+        Args:
+            base_url: Supabase project URL
+            api_key: Supabase service key
+        """
+        self._http = httpx.AsyncClient(
+            base_url=f"{base_url.rstrip('/')}/rest/v1",
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            headers={
+                "apikey": api_key,
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+        )
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self._http.aclose()
+
+    async def select(self, table: str, params: dict[str, str]) -> list[dict[str, Any]]:
+        """Fetch rows matching PostgREST query params."""
+        response = await self._http.get(f"/{table}", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def count(self, table: str, params: dict[str, str]) -> int:
+        """Count rows matching PostgREST query params without fetching them."""
+        response = await self._http.head(f"/{table}", params=params, headers={"Prefer": "count=exact"})
+        response.raise_for_status()
+        # Content-Range: 0-24/3573 (or */0 when empty)
+        total = response.headers.get("content-range", "*/0").rsplit("/", 1)[-1]
+        return int(total) if total.isdigit() else 0
+
+    async def insert(
+        self,
+        table: str,
+        rows: dict[str, Any] | list[dict[str, Any]],
+        ignore_duplicates: bool = False,
+        returning: str = "id",
+    ) -> list[dict[str, Any]]:
+        """Insert rows, optionally skipping ones whose primary key exists.
+
+        Args:
+            table: Table name
+            rows: One row or a list of rows with the same keys
+            ignore_duplicates: Leave existing rows with the same primary key
+                untouched instead of failing
+            returning: Columns to read back for each row
+
+        Returns:
+            The inserted rows, limited to the `returning` columns. Skipped
+            duplicates are not returned.
+        """
+        prefer = "return=representation"
+        if ignore_duplicates:
+            prefer += ",resolution=ignore-duplicates"
+        response = await self._http.post(
+            f"/{table}",
+            params={"select": returning},
+            content=orjson.dumps(rows),
+            headers={"Prefer": prefer},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def update(self, table: str, data: dict[str, Any], params: dict[str, str]) -> None:
+        """Update rows matching PostgREST query params without reading them back."""
+        response = await self._http.patch(
+            f"/{table}",
+            params=params,
+            content=orjson.dumps(data),
+            headers={"Prefer": "return=minimal"},
+        )
+        response.raise_for_status()
+
+
 class SupabaseService:
     """Service for interacting with Supabase database."""
 
     def __init__(
         self,
-        client: AsyncClient | None = None,
+        client: _PostgrestAsync | None = None,
     ) -> None:
         """Initialize the Supabase service.
 
@@ -46,20 +143,22 @@ class SupabaseService:
         self._supabase_url = settings.supabase_url
         self._supabase_key = settings.supabase_key.get_secret_value()
 
-    async def _get_client(self) -> AsyncClient:
+    async def _get_client(self) -> _PostgrestAsync:
         """Get or create the Supabase client."""
         if self._client is None:
-            options = SyncClientOptions()
-            self._client = create_client(
-                self._supabase_url,
-                self._supabase_key,
-                options=options,
-            )
+            self._client = _PostgrestAsync(self._supabase_url, self._supabase_key)
         return self._client
 
+    async def warmup(self) -> None:
+        """Open a pooled connection to Supabase before the first request."""
+        client = await self._get_client()
+        await client.count("issues", {"select": "id", "limit": "1"})
+        logger.info("Supabase service warmed up")
+
     async def close(self) -> None:
         """Close the Supabase client."""
         if self._client is not None:
+            await self._client.aclose()
             self._client = None
 
     async def __aenter__(self) -> "SupabaseService":
@@ -83,29 +182,17 @@ class SupabaseService:
         client = await self._get_client()
 
         try:
-            data = {
-                "id": str(feedback.id),
-                "source": feedback.source.value if hasattr(feedback.source, "value") else feedback.source,
-                "raw_content": feedback.raw_content,
-                "processed_content": feedback.processed_content,
-                "metadata": feedback.metadata or {},
-                "status": "pending",
-                "created_at": feedback.timestamp.isoformat(),
-            }
+            data = _feedback_row(feedback)
 
-            result = await client.table("feedback_items").insert(data).execute()
+            # A retried ingestion leaves the existing row (and its status)
+            # as it is instead of failing or resetting it to pending
+            rows = await client.insert("feedback_items", data, ignore_duplicates=True)
 
-            if result.data:
-                logger.info(
-                    "Saved raw feedback",
-                    feedback_id=str(feedback.id),
-                )
-                return str(feedback.id)
-            else:
-                raise SupabaseServiceError(
-                    "Failed to save feedback",
-                    {"response": result},
-                )
+            logger.info(
+                "Saved raw feedback" if rows else "Raw feedback already saved",
+                feedback_id=str(feedback.id),
+            )
+            return str(feedback.id)
 
         except Exception as e:
             logger.error(
@@ -115,6 +202,44 @@ class SupabaseService:
             )
             raise SupabaseServiceError(f"Failed to save feedback: {e}") from e
 
+    async def save_raw_feedback_bulk(
+        self,
+        feedbacks: list[FeedbackItem],
+    ) -> list[str]:
+        """Save several raw feedback items in one request.
+
+        Args:
+            feedbacks: The feedback items to save
+
+        Returns:
+            UUIDs of the saved feedback items
+        """
+        if not feedbacks:
+            return []
+
+        client = await self._get_client()
+
+        try:
+            rows = [_feedback_row(feedback) for feedback in feedbacks]
+
+            # Rows saved by an earlier attempt are skipped, keeping their status
+            saved = await client.insert("feedback_items", rows, ignore_duplicates=True)
+
+            logger.info(
+                "Saved raw feedback batch",
+                count=len(saved),
+                skipped=len(rows) - len(saved),
+            )
+            return [row["id"] for row in rows]
+
+        except Exception as e:
+            logger.error(
+                "Failed to save raw feedback batch",
+                feedback_ids=[str(feedback.id) for feedback in feedbacks],
+                error=str(e),
+            )
+            raise SupabaseServiceError(f"Failed to save feedback batch: {e}") from e
+
     async def get_feedback_by_id(self, feedback_id: str) -> dict[str, Any] | None:
         """Get feedback item by ID.
 
@@ -127,10 +252,10 @@ class SupabaseService:
         client = await self._get_client()
 
         try:
-            result = await client.table("feedback_items").select("*").eq("id", feedback_id).execute()
+            rows = await client.select("feedback_items", {"select": "*", "id": f"eq.{feedback_id}"})
 
-            if result.data:
-                return result.data[0]
+            if rows:
+                return rows[0]
             return None
 
         except Exception as e:
@@ -162,10 +287,10 @@ class SupabaseService:
                 "is_duplicate": True,
                 "duplicate_of": existing_issue_id,
                 "status": "ignored",
-                "processed_at": datetime.now(timezone.utc).isoformat(),
+                "processed_at": datetime.now(timezone.utc),
             }
 
-            result = await client.table("feedback_items").update(data).eq("id", feedback_id).execute()
+            await client.update("feedback_items", data, {"id": f"eq.{feedback_id}"})
 
             logger.info(
                 "Marked feedback as duplicate",
@@ -223,10 +348,10 @@ class SupabaseService:
                 "spec_confidence": spec_data.get("spec_confidence"),
             }
 
-            result = await client.table("issues").insert(data).execute()
+            rows = await client.insert("issues", data)
 
-            if result.data:
-                issue_id = result.data[0]["id"]
+            if rows:
+                issue_id = rows[0]["id"]
                 logger.info(
                     "Saved issue draft",
                     issue_id=issue_id,
@@ -236,7 +361,7 @@ class SupabaseService:
             else:
                 raise SupabaseServiceError(
                     "Failed to save issue draft",
-                    {"response": result},
+                    {"response": rows},
                 )
 
         except Exception as e:
@@ -247,35 +372,118 @@ class SupabaseService:
             )
             raise SupabaseServiceError(f"Failed to save issue draft: {e}") from e
 
-    async def get_drafts(self) -> list[dict[str, Any]]:
-        """Get all issue drafts.
+    async def get_issues(
+        self,
+        status: str,
+        limit: int | None = None,
+        offset: int = 0,
+        columns: str = "*",
+        feedback_columns: str = "source,raw_content,classification,severity",
+    ) -> list[dict[str, Any]]:
+        """Get issues with a given status.
+
+        Issues and their feedback are fetched with two flat queries and
+        joined here; PostgREST embedded selects serialize a nested join
+        per row and are much slower on large pages.
+
+        Args:
+            status: Issue status (draft, approved, rejected, published)
+            limit: Maximum number of issues to return (all if None)
+            offset: Number of issues to skip, for pagination
+            columns: Issue columns to select; must include feedback_id for
+                the feedback join
+            feedback_columns: Feedback columns to attach to each issue
 
         Returns:
-            List of draft issues with feedback info
+            List of issues, newest first, with feedback info under "feedback_items"
         """
         client = await self._get_client()
 
+        params = {"select": columns, "status": f"eq.{status}", "order": "created_at.desc"}
+        if limit is not None:
+            params["limit"] = str(limit)
+        if offset:
+            params["offset"] = str(offset)
+
         try:
-            result = (
-                await client.table("issues")
-                .select("*, feedback_items(source, raw_content, classification, severity)")
-                .eq("status", "draft")
-                .order("created_at", desc=True)
-                .execute()
-            )
+            issues = await client.select("issues", params)
+
+            feedback_ids = list({i["feedback_id"] for i in issues if i.get("feedback_id")})
+            feedback_by_id: dict[str, dict[str, Any]] = {}
+            if feedback_ids:
+                feedback_rows = await client.select(
+                    "feedback_items",
+                    {"select": f"id,{feedback_columns}", "id": _in(feedback_ids)},
+                )
+                for feedback in feedback_rows:
+                    feedback_by_id[feedback.pop("id")] = feedback
+
+            for issue in issues:
+                issue["feedback_items"] = feedback_by_id.get(issue.get("feedback_id"))
 
             logger.debug(
-                "Retrieved drafts",
-                count=len(result.data or []),
+                "Retrieved issues",
+                status=status,
+                count=len(issues),
             )
-            return result.data or []
+            return issues
 
         except Exception as e:
             logger.error(
-                "Failed to get drafts",
+                "Failed to get issues",
+                status=status,
+                error=str(e),
+            )
+            raise SupabaseServiceError(f"Failed to get issues: {e}") from e
+
+    async def count_issues(self, status: str) -> int:
+        """Count issues with a given status without fetching rows.
+
+        Args:
+            status: Issue status (draft, approved, rejected, published)
+
+        Returns:
+            Number of matching issues
+        """
+        client = await self._get_client()
+
+        try:
+            return await client.count("issues", {"select": "id", "status": f"eq.{status}"})
+
+        except Exception as e:
+            logger.error(
+                "Failed to count issues",
+                status=status,
                 error=str(e),
             )
-            raise SupabaseServiceError(f"Failed to get drafts: {e}") from e
+            raise SupabaseServiceError(f"Failed to count issues: {e}") from e
+
+    async def get_drafts(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        columns: str = DRAFT_LIST_COLUMNS,
+    ) -> list[dict[str, Any]]:
+        """Get a page of issue drafts.
+
+        Only the columns the draft list shows are selected, and the
+        feedback text is left out; fetch a single issue for the full row.
+
+        Args:
+            limit: Maximum number of drafts to return
+            offset: Number of drafts to skip
+            columns: Issue columns to select
+
+        Returns:
+            List of draft issues, newest first, with feedback info
+        """
+        return await self.get_issues(
+            "draft",
+            limit=limit,
+            offset=offset,
+            columns=columns,
+            feedback_columns="source,classification,severity",
+        )
 
     async def get_issue_by_id(self, issue_id: str) -> dict[str, Any] | None:
         """Get issue by ID with feedback info.
@@ -289,15 +497,10 @@ class SupabaseService:
         client = await self._get_client()
 
         try:
-            result = (
-                await client.table("issues")
-                .select("*, feedback_items(*)")
-                .eq("id", issue_id)
-                .execute()
-            )
+            rows = await client.select("issues", {"select": "*,feedback_items(*)", "id": f"eq.{issue_id}"})
 
-            if result.data:
-                return result.data[0]
+            if rows:
+                return rows[0]
             return None
 
         except Exception as e:
@@ -330,7 +533,7 @@ class SupabaseService:
                 "github_url": github_url,
             }
 
-            result = await client.table("issues").update(data).eq("id", issue_id).execute()
+            await client.update("issues", data, {"id": f"eq.{issue_id}"})
 
             logger.info(
                 "Published issue",
@@ -367,7 +570,7 @@ class SupabaseService:
                 # Add rejection metadata to body
                 data["body"] = f"**Rejected**: {reason}\n\n---\n\n"
 
-            result = await client.table("issues").update(data).eq("id", issue_id).execute()
+            await client.update("issues", data, {"id": f"eq.{issue_id}"})
 
             logger.info(
                 "Rejected issue",
@@ -404,16 +607,9 @@ class SupabaseService:
         client = await self._get_client()
 
         try:
-            data: dict[str, Any] = {
-                "status": status,
-                "processed_at": datetime.now(timezone.utc).isoformat(),
-            }
-            if classification:
-                data["classification"] = classification
-            if severity:
-                data["severity"] = severity
+            data = _status_update(status, classification, severity)
 
-            await client.table("feedback_items").update(data).eq("id", feedback_id).execute()
+            await client.update("feedback_items", data, {"id": f"eq.{feedback_id}"})
 
             logger.info(
                 "Updated feedback status",
@@ -430,6 +626,79 @@ class SupabaseService:
             )
             raise SupabaseServiceError(f"Failed to update feedback status: {e}") from e
 
+    async def update_feedback_status_bulk(
+        self,
+        feedback_ids: list[str],
+        status: str,
+        classification: str | None = None,
+        severity: str | None = None,
+    ) -> bool:
+        """Apply the same status update to several feedback items in one request.
+
+        Args:
+            feedback_ids: UUIDs of the feedback items
+            status: New status (processing, processed)
+            classification: Optional classification
+            severity: Optional severity
+
+        Returns:
+            True if successful
+        """
+        if not feedback_ids:
+            return True
+
+        client = await self._get_client()
+
+        try:
+            data = _status_update(status, classification, severity)
+
+            await client.update("feedback_items", data, {"id": _in(feedback_ids)})
+
+            logger.info(
+                "Updated feedback status batch",
+                count=len(feedback_ids),
+                status=status,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Failed to update feedback status batch",
+                feedback_ids=feedback_ids,
+                error=str(e),
+            )
+            raise SupabaseServiceError(f"Failed to update feedback status: {e}") from e
+
+
+def _feedback_row(feedback: FeedbackItem) -> dict[str, Any]:
+    """Build the feedback_items row for a raw feedback item."""
+    return {
+        "id": str(feedback.id),
+        "source": feedback.source.value if hasattr(feedback.source, "value") else feedback.source,
+        "raw_content": feedback.raw_content,
+        "processed_content": feedback.raw_content,
+        "metadata": feedback.metadata or {},
+        "status": "pending",
+        "created_at": feedback.timestamp,
+    }
+
+
+def _status_update(
+    status: str,
+    classification: str | None = None,
+    severity: str | None = None,
+) -> dict[str, Any]:
+    """Build the column changes for a feedback status update."""
+    data: dict[str, Any] = {
+        "status": status,
+        "processed_at": datetime.now(timezone.utc),
+    }
+    if classification:
+        data["classification"] = classification
+    if severity:
+        data["severity"] = severity
+    return data
+
 
 # Singleton for dependency injection
 _supabase_service: SupabaseService | None = None
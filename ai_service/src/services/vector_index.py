@@ -0,0 +1,133 @@
+"""In-process approximate index of recent feedback vectors.
+
+An optional first check in front of Qdrant for duplicate detection: a FAISS
+IVF index with int8 scalar-quantized codes mirroring the most recent
+vectors in the collection. A hit at or above the duplicate threshold is
+answered without a network hop; misses still go to Qdrant for the
+authoritative check.
+
+Requires the faiss-cpu package.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# FAISS warns below ~39 training points per inverted list
+TRAINING_POINTS_PER_LIST = 39
+
+
+class RecentVectorIndex:
+    """IVF index with int8 codes over unit-length vectors, capped in size."""
+
+    def __init__(
+        self,
+        dim: int,
+        max_entries: int = 100_000,
+        nlist: int = 256,
+        nprobe: int = 8,
+    ) -> None:
+        """Initialize an untrained index.
+
+        Args:
+            dim: Vector dimension
+            max_entries: Vectors kept before the oldest are evicted
+            nlist: Number of inverted lists (coarse clusters)
+            nprobe: Lists searched per query
+        """
+        import faiss
+
+        # Inner product on unit vectors is cosine similarity, so scores
+        # compare directly against the duplicate threshold
+        self._quantizer = faiss.IndexFlatIP(dim)
+        self._index = faiss.IndexIVFScalarQuantizer(
+            self._quantizer,
+            dim,
+            nlist,
+            faiss.ScalarQuantizer.QT_8bit,
+            faiss.METRIC_INNER_PRODUCT,
+        )
+        self._index.nprobe = nprobe
+        self.dim = dim
+        self._max_entries = max_entries
+        # FAISS ID -> Qdrant point ID, oldest first
+        self._point_ids: OrderedDict[int, str] = OrderedDict()
+        self._next_id = 0
+
+    @property
+    def min_training_size(self) -> int:
+        """Vectors needed before the index can be trained."""
+        return self._index.nlist * TRAINING_POINTS_PER_LIST
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the index has been trained and accepts vectors."""
+        return self._index.is_trained
+
+    def __len__(self) -> int:
+        return len(self._point_ids)
+
+    def train(self, vectors: np.ndarray) -> bool:
+        """Train the coarse clusters and int8 ranges on a sample.
+
+        Args:
+            vectors: (n, dim) float32 unit vectors
+
+        Returns:
+            True if trained; False if the sample is too small
+        """
+        if len(vectors) < self.min_training_size:
+            return False
+        self._index.train(np.ascontiguousarray(vectors, dtype=np.float32))
+        return True
+
+    def add(self, point_ids: list[str], vectors: np.ndarray) -> None:
+        """Add vectors, evicting the oldest past the size cap.
+
+        Ignored until the index is trained.
+
+        Args:
+            point_ids: Qdrant point ID per vector
+            vectors: (n, dim) float32 unit vectors
+        """
+        if not self.is_trained or not point_ids:
+            return
+
+        ids = np.arange(self._next_id, self._next_id + len(point_ids), dtype=np.int64)
+        self._next_id += len(point_ids)
+        self._index.add_with_ids(np.ascontiguousarray(vectors, dtype=np.float32), ids)
+        self._point_ids.update(zip(ids.tolist(), point_ids))
+
+        overflow = len(self._point_ids) - self._max_entries
+        if overflow > 0:
+            # Removal scans every list, so evict an extra 1% per pass
+            overflow += self._max_entries // 100
+            evicted = [self._point_ids.popitem(last=False)[0] for _ in range(min(overflow, len(self._point_ids)))]
+            self._index.remove_ids(np.asarray(evicted, dtype=np.int64))
+
+    def search(self, vectors: np.ndarray, thresholds: list[float]) -> list[str | None]:
+        """Find the nearest indexed vector for each query.
+
+        Args:
+            vectors: (n, dim) float32 unit query vectors
+            thresholds: Minimum cosine similarity per query
+
+        Returns:
+            Per query, the matching point ID, or None if none is close enough
+        """
+        if not self._point_ids or not len(vectors):
+            return [None] * len(vectors)
+
+        scores, ids = self._index.search(np.ascontiguousarray(vectors, dtype=np.float32), 1)
+        matches: list[str | None] = []
+        for score, faiss_id, threshold in zip(scores[:, 0].tolist(), ids[:, 0].tolist(), thresholds):
+            point_id = self._point_ids.get(faiss_id)
+            if point_id is None or score < threshold:
+                matches.append(None)
+                continue
+            logger.info("Found similar feedback in recent vector index", score=score, id=point_id)
+            matches.append(point_id)
+        return matches
@@ -5,15 +5,54 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-import asyncio
 
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(autouse=True)
+def reset_llm_cache():
+    """Give every test a fresh LLM response cache."""
+    from src.services import llm_cache
+
+    llm_cache._llm_cache = None
+    yield
+    llm_cache._llm_cache = None
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_client():
+    """Keep the shared LLM client singleton from leaking between tests."""
+    from src.services import llm_client
+
+    llm_client._llm_client = None
+    yield
+    llm_client._llm_client = None
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_dispatcher():
+    """Give every test (and its event loop) a fresh LLM dispatcher."""
+    from src.services import llm_dispatcher
+
+    llm_dispatcher._llm_dispatcher = None
+    yield
+    llm_dispatcher._llm_dispatcher = None
+
+
+@pytest.fixture(autouse=True)
+def disable_semantic_cache(monkeypatch):
+    """Keep unit tests off the Qdrant-backed semantic cache."""
+    from src.core.config import settings
+
+    monkeypatch.setattr(settings, "triage_semantic_cache_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def disable_spec_template_cache(monkeypatch):
+    """Keep unit tests off the spec template cache and its embedder."""
+    from src.core.config import settings
+    from src.services import spec_templates
+
+    monkeypatch.setattr(settings, "spec_template_cache_enabled", False)
+    spec_templates._spec_template_cache = None
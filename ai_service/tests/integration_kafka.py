@@ -3,59 +3,112 @@
 
 import asyncio
 import sys
+import time
 from datetime import datetime, timezone
 from uuid import uuid4
 
+import orjson
+import pytest
+
 sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 
+aiokafka = pytest.importorskip("aiokafka")
+
 from src.core.config import settings
-from src.services.kafka import StandardKafkaService
 from src.schemas.ingestion import FeedbackItem, FeedbackSource
 
+# Needs a running broker; deselected by default, run with `-m integration`
+pytestmark = pytest.mark.integration
+
+
+BATCH_SIZE = 100
+
+# Encoded wall-clock time, re-read only when the second changes
+_last_second = 0
+_last_timestamp = b""
+
+
+def _now_cached() -> bytes:
+    """Current UTC time as a JSON string, refreshed at most once per second."""
+    global _last_second, _last_timestamp
+    second = int(time.time())
+    if second != _last_second:
+        _last_second = second
+        _last_timestamp = f'"{datetime.now(timezone.utc).isoformat()}"'.encode()
+    return _last_timestamp
+
 
 async def test_kafka_producer():
-    """Test sending a message to local Kafka."""
+    """Test sending a batch of messages to local Kafka."""
+    from src.services.kafka import StandardKafkaService
+
     print("Testing Kafka producer with local Kafka...")
     print(f"  Kafka URL: {settings.kafka_rest_url}")
     print(f"  Topic: {settings.kafka_topic_feedback}")
 
     async with StandardKafkaService() as kafka:
-        # Create a test feedback item
-        feedback = FeedbackItem(
-            id=uuid4(),
+        # Validate and encode one template, then splice each message's ID
+        # and timestamp into its bytes instead of re-serializing the item
+        template = FeedbackItem(
             source=FeedbackSource.MANUAL,
             raw_content="Integration test: The login button is broken",
-            timestamp=datetime.now(timezone.utc),
             metadata={"test": True},
         )
+        template_bytes = template.model_copy(update={"id": "<ID>", "timestamp": "<TS>"}).encoded_message()
+        messages = []
+        for _ in range(BATCH_SIZE):
+            message_id = str(uuid4())
+            payload = template_bytes.replace(b'"<ID>"', f'"{message_id}"'.encode(), 1).replace(
+                b'"<TS>"', _now_cached(), 1
+            )
+            messages.append((orjson.Fragment(payload), message_id))
+
+        print(f"  Sending {len(messages)} feedback items...")
+
+        # One batch; acks are awaited together rather than per message
+        results = await kafka.publish_many(messages, topic=settings.kafka_topic_feedback)
+
+        print(f"  Result: {len(results)} messages, last offset {results[-1]['offset']}")
+        print("  ✅ Messages sent successfully!")
+        return True
+
 
-        print(f"  Sending feedback: {feedback.raw_content[:50]}...")
+# Started on first read and reused, so repeated reads skip the metadata
+# and group-join handshake
+_CONSUMER = None
 
-        result = await kafka.publish(
-            topic=settings.kafka_topic_feedback,
-            data=feedback.to_kafka_message(),
-            message_id=str(feedback.id),
+
+async def _get_consumer():
+    """Get or start the shared consumer."""
+    global _CONSUMER
+    if _CONSUMER is None:
+        consumer = aiokafka.AIOKafkaConsumer(
+            settings.kafka_topic_feedback,
+            bootstrap_servers="localhost:9093",
+            auto_offset_reset="earliest",
+            group_id="test-consumer",
+            # Reads only verify delivery; skip the commit RPC per message
+            enable_auto_commit=False,
+            fetch_min_bytes=1,
         )
+        await consumer.start()
+        _CONSUMER = consumer
+        print("  Consumer started. Waiting for messages...")
+    return _CONSUMER
 
-        print(f"  Result: {result}")
-        print("  ✅ Message sent successfully!")
-        return True
+
+async def close_consumer():
+    """Stop the shared consumer, if one was started."""
+    global _CONSUMER
+    if _CONSUMER is not None:
+        await _CONSUMER.stop()
+        _CONSUMER = None
 
 
 async def read_from_kafka():
     """Read messages from Kafka to verify."""
     print("\nReading messages from Kafka...")
-    from aiokafka import AIOKafkaConsumer
-
-    consumer = AIOKafkaConsumer(
-        settings.kafka_topic_feedback,
-        bootstrap_servers="localhost:9093",
-        auto_offset_reset="earliest",
-        group_id="test-consumer",
-    )
-
-    await consumer.start()
-    print("  Consumer started. Waiting for messages...")
+    consumer = await _get_consumer()
 
     try:
         # Wait up to 5 seconds for a message
@@ -66,15 +119,22 @@ async def read_from_kafka():
     except asyncio.TimeoutError:
         print("  ⚠️  No messages received (timeout)")
         return False
+
+
+async def main() -> bool:
+    """Send a message, then read it back, on one event loop."""
+    try:
+        success = await test_kafka_producer()
+        if success:
+            await read_from_kafka()
+        return success
     finally:
-        await consumer.stop()
+        await close_consumer()
 
 
 if __name__ == "__main__":
     try:
-        success = asyncio.run(test_kafka_producer())
-        if success:
-            asyncio.run(read_from_kafka())
+        success = asyncio.run(main())
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"  ❌ Error: {e}")
@@ -7,11 +7,68 @@ making actual LLM calls.
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from uuid import uuid4
+from pydantic import ValidationError
 
 from src.agents.triage import TriageState, TriageResult
 from src.agents.spec import SpecState, SpecResult
 
 
+# ========================
+# Canonical Valid Results
+# ========================
+
+# Built once at import; positive-path tests only read their attributes
+_VALID_BUG_RESULT = TriageResult(
+    classification="bug",
+    severity="high",
+    reasoning="The user reports the login button is broken",
+    confidence=0.9,
+)
+_VALID_FEATURE_RESULT = TriageResult(
+    classification="feature",
+    severity="medium",
+    reasoning="The user wants dark mode support",
+    confidence=0.85,
+)
+_VALID_QUESTION_RESULT = TriageResult(
+    classification="question",
+    severity="low",
+    reasoning="The user is asking how to reset their password",
+    confidence=0.95,
+)
+_VALID_BUG_SPEC = SpecResult(
+    title="Fix file upload crash for large files",
+    reproduction_steps=[
+        "Open the app",
+        "Navigate to upload page",
+        "Select a file larger than 100MB",
+    ],
+    affected_components=["upload-service", "file-handler"],
+    acceptance_criteria=[
+        "Files under 100MB upload successfully",
+        "Large files show progress indicator",
+        "No crashes during upload",
+    ],
+    suggested_labels=["bug", "high", "frontend"],
+    spec_confidence=0.85,
+)
+_VALID_FEATURE_SPEC = SpecResult(
+    title="Add dark mode support",
+    reproduction_steps=[],  # Features don't need reproduction steps
+    affected_components=["frontend", "theme"],
+    acceptance_criteria=[
+        "Dark mode toggle visible in settings",
+        "All pages support dark mode",
+    ],
+    suggested_labels=["feature", "enhancement", "frontend"],
+    spec_confidence=0.9,
+)
+
+# Triage outputs as they are spread into a SpecState
+_TRIAGE_PIPELINE_DUMP = _VALID_BUG_RESULT.model_dump()
+_FEATURE_PIPELINE_DUMP = _VALID_FEATURE_RESULT.model_dump()
+
+
 # ========================
 # Triage Agent Tests
 # ========================
@@ -71,93 +128,51 @@ class TestTriageResult:
 
     def test_valid_bug_classification(self):
         """Test creating a valid bug classification result."""
-        result = TriageResult(
-            classification="bug",
-            severity="high",
-            reasoning="The user reports the login button is broken",
-            confidence=0.9,
-        )
+        result = _VALID_BUG_RESULT
         assert result.classification == "bug"
         assert result.severity == "high"
         assert result.confidence == 0.9
 
     def test_valid_feature_classification(self):
         """Test creating a valid feature classification result."""
-        result = TriageResult(
-            classification="feature",
-            severity="medium",
-            reasoning="The user wants dark mode support",
-            confidence=0.85,
-        )
+        result = _VALID_FEATURE_RESULT
         assert result.classification == "feature"
 
     def test_valid_question_classification(self):
         """Test creating a valid question classification result."""
-        result = TriageResult(
-            classification="question",
-            severity="low",
-            reasoning="The user is asking how to reset their password",
-            confidence=0.95,
-        )
+        result = _VALID_QUESTION_RESULT
         assert result.classification == "question"
 
-    def test_classification_rejects_invalid_value(self):
-        """Test that invalid classification is rejected."""
-        from pydantic import ValidationError
-
-        with pytest.raises(ValidationError):
-            TriageResult(
-                classification="invalid",
-                severity="low",
-                reasoning="This should fail",
-                confidence=0.5,
-            )
-
-    def test_severity_rejects_invalid_value(self):
-        """Test that invalid severity is rejected."""
-        from pydantic import ValidationError
-
-        with pytest.raises(ValidationError):
-            TriageResult(
-                classification="bug",
-                severity="invalid",
-                reasoning="This should fail",
-                confidence=0.5,
-            )
-
-    def test_confidence_bounds_enforced(self):
-        """Test that confidence must be between 0 and 1."""
-        from pydantic import ValidationError
-
-        # Confidence too high
-        with pytest.raises(ValidationError):
-            TriageResult(
-                classification="bug",
-                severity="low",
-                reasoning="test",
-                confidence=1.5,
-            )
-
-        # Confidence negative
-        with pytest.raises(ValidationError):
-            TriageResult(
-                classification="bug",
-                severity="low",
-                reasoning="test",
-                confidence=-0.1,
-            )
-
-    def test_reasoning_min_length(self):
-        """Test that reasoning has minimum length."""
-        from pydantic import ValidationError
-
-        with pytest.raises(ValidationError):
-            TriageResult(
-                classification="bug",
-                severity="low",
-                reasoning="short",
-                confidence=0.5,
-            )
+    @pytest.mark.parametrize(
+        ("kwargs", "error_type"),
+        [
+            (
+                {"classification": "invalid", "severity": "low", "reasoning": "x" * 20, "confidence": 0.5},
+                "string_pattern_mismatch",
+            ),
+            (
+                {"classification": "bug", "severity": "invalid", "reasoning": "x" * 20, "confidence": 0.5},
+                "string_pattern_mismatch",
+            ),
+            (
+                {"classification": "bug", "severity": "low", "reasoning": "x" * 20, "confidence": 1.5},
+                "less_than_equal",
+            ),
+            (
+                {"classification": "bug", "severity": "low", "reasoning": "x" * 20, "confidence": -0.1},
+                "greater_than_equal",
+            ),
+            (
+                {"classification": "bug", "severity": "low", "reasoning": "short", "confidence": 0.5},
+                "string_too_short",
+            ),
+        ],
+        ids=["classification", "severity", "confidence_too_high", "confidence_negative", "reasoning_too_short"],
+    )
+    def test_rejects_invalid_values(self, kwargs, error_type):
+        """Test that each out-of-range field is rejected on its own."""
+        with pytest.raises(ValidationError, match=error_type):
+            TriageResult(**kwargs)
 
 
 # ========================
@@ -197,22 +212,7 @@ class TestSpecResult:
 
     def test_valid_spec_result(self):
         """Test creating a valid spec result."""
-        result = SpecResult(
-            title="Fix file upload crash for large files",
-            reproduction_steps=[
-                "Open the app",
-                "Navigate to upload page",
-                "Select a file larger than 100MB",
-            ],
-            affected_components=["upload-service", "file-handler"],
-            acceptance_criteria=[
-                "Files under 100MB upload successfully",
-                "Large files show progress indicator",
-                "No crashes during upload",
-            ],
-            suggested_labels=["bug", "high", "frontend"],
-            spec_confidence=0.85,
-        )
+        result = _VALID_BUG_SPEC
 
         assert result.title == "Fix file upload crash for large files"
         assert len(result.reproduction_steps) == 3
@@ -221,64 +221,34 @@ class TestSpecResult:
 
     def test_feature_spec_without_reproduction_steps(self):
         """Test that feature specs can have empty reproduction steps."""
-        result = SpecResult(
-            title="Add dark mode support",
-            reproduction_steps=[],  # Features don't need reproduction steps
-            affected_components=["frontend", "theme"],
-            acceptance_criteria=[
-                "Dark mode toggle visible in settings",
-                "All pages support dark mode",
-            ],
-            suggested_labels=["feature", "enhancement", "frontend"],
-            spec_confidence=0.9,
-        )
+        result = _VALID_FEATURE_SPEC
 
         assert len(result.reproduction_steps) == 0
         assert len(result.acceptance_criteria) == 2
         assert "feature" in result.suggested_labels
 
-    def test_title_length_constraints(self):
-        """Test title min/max length constraints."""
-        from pydantic import ValidationError
-
-        # Too short
-        with pytest.raises(ValidationError):
-            SpecResult(
-                title="Hi",
-                reproduction_steps=[],
-                affected_components=["test"],
-                acceptance_criteria=["test"],
-                suggested_labels=["test"],
-                spec_confidence=0.5,
-            )
-
-    def test_affected_components_require_at_least_one(self):
-        """Test that at least one affected component is required."""
-        from pydantic import ValidationError
-
-        with pytest.raises(ValidationError):
-            SpecResult(
-                title="Test feature",
-                reproduction_steps=[],
-                affected_components=[],  # Empty not allowed
-                acceptance_criteria=["test"],
-                suggested_labels=["test"],
-                spec_confidence=0.5,
-            )
-
-    def test_acceptence_criteria_require_at_least_one(self):
-        """Test that at least one acceptance criterion is required."""
-        from pydantic import ValidationError
-
-        with pytest.raises(ValidationError):
-            SpecResult(
-                title="Test feature",
-                reproduction_steps=[],
-                affected_components=["test"],
-                acceptance_criteria=[],  # Empty not allowed
-                suggested_labels=["test"],
-                spec_confidence=0.5,
-            )
+    @pytest.mark.parametrize(
+        ("overrides", "error_type"),
+        [
+            ({"title": "Hi"}, "string_too_short"),
+            ({"affected_components": []}, "too_short"),
+            ({"acceptance_criteria": []}, "too_short"),
+        ],
+        ids=["title_too_short", "no_affected_components", "no_acceptance_criteria"],
+    )
+    def test_rejects_invalid_values(self, overrides, error_type):
+        """Test title length and the one-item minimum on component and criteria lists."""
+        kwargs = {
+            "title": "Test feature",
+            "reproduction_steps": [],
+            "affected_components": ["test"],
+            "acceptance_criteria": ["test"],
+            "suggested_labels": ["test"],
+            "spec_confidence": 0.5,
+            **overrides,
+        }
+        with pytest.raises(ValidationError, match=error_type):
+            SpecResult(**kwargs)
 
 
 # ========================
@@ -291,20 +261,12 @@ class TestTriageToSpecPipeline:
 
     def test_triage_to_spec_data_passing(self):
         """Test that triage output can flow into spec input."""
-        # Simulate triage output
-        triage_output = TriageResult(
-            classification="bug",
-            severity="high",
-            reasoning="User reports login failure with error message",
-            confidence=0.92,
-        )
-
         # Create spec state from triage output
         spec_state: SpecState = {
             "feedback_id": "test-pipeline-001",
             "content": "When I try to login, I get an error and cannot access my account",
             "source": "discord",
-            **triage_output.model_dump(),
+            **_TRIAGE_PIPELINE_DUMP,
             "title": "",
             "reproduction_steps": [],
             "affected_components": [],
@@ -316,17 +278,12 @@ class TestTriageToSpecPipeline:
         # Verify data flows correctly
         assert spec_state["classification"] == "bug"
         assert spec_state["severity"] == "high"
-        assert spec_state["reasoning"] == "User reports login failure with error message"
-        assert spec_state["confidence"] == 0.92
+        assert spec_state["reasoning"] == "The user reports the login button is broken"
+        assert spec_state["confidence"] == 0.9
 
     def test_feature_flow_skip_reproduction_steps(self):
         """Test that feature requests don't need reproduction steps."""
-        triage_output = TriageResult(
-            classification="feature",
-            severity="medium",
-            reasoning="User wants to export data to CSV",
-            confidence=0.88,
-        )
+        assert _FEATURE_PIPELINE_DUMP["classification"] == "feature"
 
         # Feature specs can have empty reproduction steps
         spec_result = SpecResult(
@@ -381,7 +338,6 @@ class TestTriageToSpecPipeline:
 # ========================
 
 
-@pytest.mark.asyncio
 class TestTriageAgentMocked:
     """Test triage agent with mocked LLM calls."""
 
@@ -431,7 +387,6 @@ class TestTriageAgentMocked:
         assert result["confidence"] == 0.0
 
 
-@pytest.mark.asyncio
 class TestSpecAgentMocked:
     """Test spec agent with mocked LLM calls."""
 
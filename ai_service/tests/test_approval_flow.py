@@ -7,7 +7,6 @@ These tests verify:
 - Rejecting issues
 """
 
-import pytest
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -118,7 +117,6 @@ class MockGitHubService:
 # ========================
 
 
-@pytest.mark.asyncio
 class TestListIssuesAsync:
     """Tests for listing issues (async)."""
 
@@ -155,7 +153,6 @@ class TestListIssuesAsync:
         assert result is None
 
 
-@pytest.mark.asyncio
 class TestPublishIssueAsync:
     """Tests for publishing issues to GitHub (async)."""
 
@@ -205,7 +202,6 @@ class TestPublishIssueAsync:
         assert mock_github.created_issues[2]["url"] == "https://github.com/test-owner/test-repo/issues/3"
 
 
-@pytest.mark.asyncio
 class TestRejectIssueAsync:
     """Tests for rejecting issues (async)."""
 
@@ -287,7 +283,6 @@ class TestGitHubServiceFormatting:
         assert "Acceptance Criteria" not in body
 
 
-@pytest.mark.asyncio
 class TestSupabaseServiceValidationAsync:
     """Tests for SupabaseService validation logic (async)."""
 
@@ -319,7 +314,6 @@ class TestSupabaseServiceValidationAsync:
 # ========================
 
 
-@pytest.mark.asyncio
 class TestFullApprovalFlowAsync:
     """Tests for the complete approval flow (async)."""
 
@@ -372,7 +366,6 @@ class TestFullApprovalFlowAsync:
 # ========================
 
 
-@pytest.mark.asyncio
 class TestIssueStatusTransitionsAsync:
     """Tests for valid/invalid status transitions (async)."""
 
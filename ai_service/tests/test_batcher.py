@@ -0,0 +1,41 @@
+"""Tests for the outbound micro-batcher."""
+
+import asyncio
+
+from src.client.batcher import AsyncBatcher
+
+
+async def double_all(items: list[int]) -> list[int]:
+    """Batch handler that doubles each item."""
+    return [item * 2 for item in items]
+
+
+class TestAsyncBatcher:
+    """Tests for batching and shutdown."""
+
+    async def test_items_within_window_share_a_batch(self):
+        """Test concurrent submissions are handled in one call."""
+        batches: list[list[int]] = []
+
+        async def record(items: list[int]) -> list[int]:
+            batches.append(items)
+            return await double_all(items)
+
+        batcher = AsyncBatcher(record, max_batch=8, max_delay_ms=10)
+
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+        assert results == [0, 2, 4]
+        assert batches == [[0, 1, 2]]
+        await batcher.close()
+
+    async def test_close_flushes_a_partly_collected_batch(self):
+        """Test items the worker is still collecting are dispatched on close."""
+        batcher = AsyncBatcher(double_all, max_batch=8, max_delay_ms=10_000)
+
+        pending = asyncio.ensure_future(batcher.submit(21))
+        # Let the worker take the item off the queue and start its window
+        await asyncio.sleep(0.01)
+        await batcher.close()
+
+        assert await asyncio.wait_for(pending, timeout=1) == 42
@@ -4,6 +4,10 @@ These tests verify that the callback client correctly sends issue data
 to the web app's internal API.
 """
 
+import asyncio
+import gzip
+
+import orjson
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
@@ -30,13 +34,15 @@ class TestCallbackClient:
             client._client = mock_client
             return client
 
-    @pytest.mark.asyncio
     async def test_save_issue_success(self, callback_client, mock_client):
         """Test successful issue saving."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"issueId": "issue-123"}
+        mock_response.json.return_value = {
+            "success": True,
+            "results": [{"success": True, "issueId": "issue-123", "feedbackId": "fb-123"}],
+        }
         mock_client.post.return_value = mock_response
 
         # Call the method
@@ -61,18 +67,18 @@ class TestCallbackClient:
 
         # Verify the call arguments
         call_args = mock_client.post.call_args
-        assert call_args.args[0] == "http://localhost:3000/api/internal/save-issue"
+        assert call_args.args[0] == "http://localhost:3000/api/internal/save-issues"
         assert "Authorization" in call_args.kwargs["headers"]
         assert call_args.kwargs["headers"]["Authorization"] == "Bearer test-api-key"
+        assert "Content-Encoding" not in call_args.kwargs["headers"]
 
         # Verify payload
-        payload = call_args.kwargs["json"]
+        payload = orjson.loads(call_args.kwargs["content"])["issues"][0]
         assert payload["feedbackId"] == "fb-123"
         assert payload["title"] == "Test Issue"
         assert payload["classification"] == "bug"
         assert payload["severity"] == "high"
 
-    @pytest.mark.asyncio
     async def test_save_issue_http_error(self, callback_client, mock_client):
         """Test handling of HTTP errors."""
         mock_response = MagicMock()
@@ -97,7 +103,6 @@ class TestCallbackClient:
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_save_issue_request_error(self, callback_client, mock_client):
         """Test handling of request errors (connection failures)."""
         import httpx
@@ -121,14 +126,50 @@ class TestCallbackClient:
 
         assert result is False
 
-    @pytest.mark.asyncio
+    async def test_save_issue_batches_concurrent_calls(self, callback_client, mock_client):
+        """Test concurrent saves are coalesced into one gzipped bulk request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "success": True,
+            "results": [
+                {"success": True, "issueId": "issue-1", "feedbackId": "fb-1"},
+                {"success": False, "error": "Missing required fields", "feedbackId": "fb-2"},
+            ],
+        }
+        mock_client.post.return_value = mock_response
+
+        results = await asyncio.gather(*(
+            callback_client.save_issue(
+                feedback_id=f"fb-{i}",
+                content="Test feedback " * 50,
+                title="Test Issue",
+                body="Test body",
+                classification="bug",
+                severity="high",
+                reasoning="Test reasoning",
+                confidence=0.9,
+                reproduction_steps=[],
+                affected_components=[],
+                acceptance_criteria=[],
+                suggested_labels=[],
+            )
+            for i in (1, 2)
+        ))
+
+        assert results == [True, False]
+        mock_client.post.assert_called_once()
+        call_args = mock_client.post.call_args
+        assert call_args.kwargs["headers"]["Content-Encoding"] == "gzip"
+        issues = orjson.loads(gzip.decompress(call_args.kwargs["content"]))["issues"]
+        assert [issue["feedbackId"] for issue in issues] == ["fb-1", "fb-2"]
+
     async def test_close_client(self, callback_client, mock_client):
         """Test closing the httpx client."""
         await callback_client.close()
         mock_client.aclose.assert_called_once()
         assert callback_client._client is None
 
-    @pytest.mark.asyncio
     async def test_context_manager(self, callback_client, mock_client):
         """Test using the client as a context manager."""
         async with callback_client as client:
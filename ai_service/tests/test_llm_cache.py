@@ -0,0 +1,50 @@
+"""Tests for the LLM response cache."""
+
+from src.services.llm_cache import InMemoryLRUBackend, LLMCache, make_cache_key
+
+
+class TestMakeCacheKey:
+    """Tests for cache key construction."""
+
+    def test_key_is_deterministic(self):
+        """Test identical requests produce identical keys."""
+        key_a = make_cache_key("qwen2.5-coder:3b", 0.1, ["system", "user"])
+        key_b = make_cache_key("qwen2.5-coder:3b", 0.1, ["system", "user"])
+        assert key_a == key_b
+
+    def test_key_varies_with_request(self):
+        """Test model, temperature and messages all affect the key."""
+        base = make_cache_key("qwen2.5-coder:3b", 0.1, ["system", "user"])
+        assert make_cache_key("other-model", 0.1, ["system", "user"]) != base
+        assert make_cache_key("qwen2.5-coder:3b", 0.2, ["system", "user"]) != base
+        assert make_cache_key("qwen2.5-coder:3b", 0.1, ["system", "other"]) != base
+
+
+class TestInMemoryLRUBackend:
+    """Tests for the in-memory LRU backend."""
+
+    async def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted when full."""
+        backend = InMemoryLRUBackend(maxsize=2)
+        await backend.set("a", "1")
+        await backend.set("b", "2")
+        await backend.get("a")
+        await backend.set("c", "3")
+
+        assert await backend.get("a") == "1"
+        assert await backend.get("b") is None
+        assert await backend.get("c") == "3"
+
+
+class TestLLMCache:
+    """Tests for the LLMCache wrapper."""
+
+    async def test_tracks_hits_and_misses(self):
+        """Test stats reflect lookups."""
+        cache = LLMCache(InMemoryLRUBackend())
+
+        assert await cache.get("key") is None
+        await cache.set("key", "value")
+        assert await cache.get("key") == "value"
+
+        assert cache.stats == {"hits": 1, "misses": 1}
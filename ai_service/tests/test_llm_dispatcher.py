@@ -0,0 +1,121 @@
+"""Tests for the LLM request dispatcher."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.llm_dispatcher import LLMDispatcher
+
+
+def make_client() -> MagicMock:
+    """Build a mock client whose create() echoes its messages."""
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(side_effect=lambda **kwargs: kwargs["messages"])
+    return client
+
+
+class TestLLMDispatcher:
+    """Tests for request batching."""
+
+    async def test_tight_budget_bypasses_batching(self):
+        """Test requests within the sync budget go straight to the client."""
+        dispatcher = LLMDispatcher(batch_size=8, batch_window_ms=10_000, sync_budget_ms=1000)
+        client = make_client()
+
+        result = await asyncio.wait_for(
+            dispatcher.submit(client, latency_budget_ms=500, messages=["hi"]),
+            timeout=1,
+        )
+
+        assert result == ["hi"]
+        client.chat.completions.create.assert_called_once()
+
+    async def test_full_batch_flushes_immediately(self):
+        """Test a full batch is dispatched without waiting for the window."""
+        dispatcher = LLMDispatcher(batch_size=3, batch_window_ms=10_000)
+        client = make_client()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(dispatcher.submit(client, messages=[str(i)]) for i in range(3))),
+            timeout=1,
+        )
+
+        assert results == [["0"], ["1"], ["2"]]
+        assert client.chat.completions.create.call_count == 3
+
+    async def test_window_flushes_partial_batch(self):
+        """Test a partial batch is dispatched once the window elapses."""
+        dispatcher = LLMDispatcher(batch_size=8, batch_window_ms=10)
+        client = make_client()
+
+        results = await asyncio.gather(
+            dispatcher.submit(client, messages=["a"]),
+            dispatcher.submit(client, messages=["b"]),
+        )
+
+        assert results == [["a"], ["b"]]
+
+    async def test_errors_propagate_to_their_caller(self):
+        """Test a failed request does not affect the rest of its batch."""
+        dispatcher = LLMDispatcher(batch_size=2, batch_window_ms=10_000)
+        client = make_client()
+        failing = MagicMock()
+        failing.chat.completions.create = AsyncMock(side_effect=RuntimeError("boom"))
+
+        results = await asyncio.gather(
+            dispatcher.submit(client, messages=["ok"]),
+            dispatcher.submit(failing, messages=["bad"]),
+            return_exceptions=True,
+        )
+
+        assert results[0] == ["ok"]
+        assert isinstance(results[1], RuntimeError)
+
+    async def test_concurrency_limit_caps_requests_in_flight(self):
+        """Test a full batch flushes even when it exceeds the concurrency limit."""
+        dispatcher = LLMDispatcher(batch_size=4, batch_window_ms=10_000, max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return kwargs["messages"]
+
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(side_effect=create)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(dispatcher.submit(client, messages=[str(i)]) for i in range(4))),
+            timeout=1,
+        )
+
+        assert results == [["0"], ["1"], ["2"], ["3"]]
+        assert peak == 2
+
+    async def test_consumer_runs_inside_the_concurrency_slot(self):
+        """Test a streamed response is read before its slot is released."""
+        dispatcher = LLMDispatcher(batch_size=8, batch_window_ms=10_000, sync_budget_ms=1000, max_concurrency=1)
+        client = make_client()
+        reading = 0
+        peak = 0
+
+        async def consume(response):
+            nonlocal reading, peak
+            reading += 1
+            peak = max(peak, reading)
+            await asyncio.sleep(0.01)
+            reading -= 1
+            return response[0].upper()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(dispatcher.submit(client, latency_budget_ms=500, consume=consume, messages=[m]) for m in "ab")
+            ),
+            timeout=1,
+        )
+
+        assert results == ["A", "B"]
+        assert peak == 1
@@ -0,0 +1,277 @@
+"""Tests for the Qdrant vector service."""
+
+import asyncio
+
+import numpy as np
+import orjson
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services import qdrant
+from src.services.qdrant import VectorService
+
+
+@pytest.fixture(autouse=True)
+def reset_embedding_cache():
+    """Give every test an empty embedding cache."""
+    qdrant._embedding_cache.clear()
+    yield
+    qdrant._embedding_cache.clear()
+
+
+class TestEmbeddingCache:
+    """Tests for embedding reuse across calls."""
+
+    async def test_repeated_text_is_embedded_once(self):
+        """Test the duplicate check and indexing of one item share an embedding."""
+        service = VectorService(client=AsyncMock())
+
+        with patch.object(
+            VectorService, "_request_embeddings", AsyncMock(return_value=[[0.5, 0.25]])
+        ) as mock_request:
+            first = await service._get_embedding("Login button is broken")
+            second = await VectorService(client=AsyncMock())._get_embedding("Login button is broken")
+
+        assert first is second
+        assert first.dtype == np.float32
+        assert first.tolist() == [0.5, 0.25]
+        mock_request.assert_called_once_with(["Login button is broken"])
+
+    async def test_batch_requests_only_missing_texts(self):
+        """Test cached texts are left out of the embedding request."""
+        service = VectorService(client=AsyncMock())
+
+        with patch.object(VectorService, "_request_embeddings", AsyncMock()) as mock_request:
+            mock_request.return_value = [[1.0]]
+            await service._get_embeddings(["cached"])
+
+            mock_request.return_value = [[2.0]]
+            embeddings = await service._get_embeddings(["cached", "new", "cached"])
+
+        assert [embedding.tolist() for embedding in embeddings] == [[1.0], [2.0], [1.0]]
+        assert mock_request.call_args.args[0] == ["new"]
+
+
+class TestBatchEmbedding:
+    """Tests for batched embedding requests and indexing."""
+
+    async def test_falls_back_to_legacy_endpoint(self):
+        """Test texts are embedded one at a time when /api/embed is missing."""
+        not_found = MagicMock(status_code=404)
+        legacy = [
+            MagicMock(status_code=200, content=orjson.dumps({"embedding": [1.0]})),
+            MagicMock(status_code=200, content=orjson.dumps({"embedding": [2.0]})),
+        ]
+        http_client = MagicMock()
+        http_client.post = AsyncMock(side_effect=[not_found, *legacy])
+
+        with patch("httpx.AsyncClient", return_value=http_client):
+            embeddings = await VectorService(client=AsyncMock())._request_embeddings(["first", "second"])
+
+        assert embeddings == [[1.0], [2.0]]
+        assert http_client.post.call_args_list[0].args[0].endswith("/api/embed")
+        assert http_client.post.call_args_list[1].args[0].endswith("/api/embeddings")
+
+    async def test_embedding_requests_share_one_http_client(self):
+        """Test the pooled client is created once and closed with the service."""
+        http_client = MagicMock()
+        http_client.post = AsyncMock(
+            return_value=MagicMock(status_code=200, content=orjson.dumps({"embeddings": [[1.0]]}))
+        )
+        http_client.aclose = AsyncMock()
+        service = VectorService(client=AsyncMock())
+
+        with patch("httpx.AsyncClient", return_value=http_client) as mock_client_cls:
+            await service._request_embeddings(["first"])
+            await service._request_embeddings(["second"])
+            await service.close()
+
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.call_args.kwargs["http2"] is True
+        http_client.aclose.assert_called_once()
+
+    async def test_tei_backend(self):
+        """Test texts go to the text-embeddings-inference server when selected."""
+        http_client = MagicMock()
+        http_client.post = AsyncMock(return_value=MagicMock(content=orjson.dumps([[1.0], [2.0]])))
+
+        with (
+            patch("httpx.AsyncClient", return_value=http_client),
+            patch.object(qdrant.settings, "embedding_backend", "tei"),
+        ):
+            embeddings = await VectorService(client=AsyncMock())._request_embeddings(["first", "second"])
+
+        assert embeddings == [[1.0], [2.0]]
+        assert http_client.post.call_args.args[0].endswith("/embed")
+        assert http_client.post.call_args.kwargs["json"] == {"inputs": ["first", "second"]}
+
+    async def test_index_items_upserts_once(self):
+        """Test several items share one embedding request and one upsert."""
+        qdrant_client = AsyncMock()
+        service = VectorService(client=qdrant_client)
+
+        with (
+            patch.object(VectorService, "ensure_collection", AsyncMock(return_value=True)),
+            patch.object(
+                VectorService, "_request_embeddings", AsyncMock(return_value=[[0.5], [0.25]])
+            ) as mock_request,
+        ):
+            result = await service.index_items(
+                [
+                    ("11111111-1111-1111-1111-111111111111", "Crash on login", {"source": "discord"}),
+                    ("22222222-2222-2222-2222-222222222222", "Dark mode please", None),
+                ]
+            )
+
+        assert result is True
+        mock_request.assert_called_once_with(["Crash on login", "Dark mode please"])
+        qdrant_client.upsert.assert_called_once()
+        points = qdrant_client.upsert.call_args.kwargs["points"]
+        assert [point.vector for point in points] == [[0.5], [0.25]]
+        assert points[0].payload["source"] == "discord"
+
+
+class TestRecentVectors:
+    """Tests for the in-memory check of recently indexed vectors."""
+
+    async def test_recently_indexed_item_skips_qdrant_search(self):
+        """Test a near-duplicate of a just-indexed item is found without searching Qdrant."""
+        qdrant_client = AsyncMock()
+        service = VectorService(client=qdrant_client)
+        item_id = "11111111-1111-1111-1111-111111111111"
+
+        with (
+            patch.object(VectorService, "ensure_collection", AsyncMock(return_value=True)),
+            patch.object(VectorService, "_request_embeddings", AsyncMock(side_effect=[[[1.0, 0.0]], [[0.99, 0.05]]])),
+        ):
+            await service.index_items([(item_id, "App crashes on login", None)])
+            result = await service._search_batch([("Login crashes the app", 0.9, 5)])
+
+        assert result == [(True, item_id)]
+        qdrant_client.query_batch_points.assert_not_called()
+
+    async def test_dissimilar_query_falls_through_to_qdrant(self):
+        """Test queries below the threshold are still searched in Qdrant."""
+        qdrant_client = AsyncMock()
+        qdrant_client.query_batch_points.return_value = [MagicMock(points=[])]
+        service = VectorService(client=qdrant_client)
+
+        with (
+            patch.object(VectorService, "ensure_collection", AsyncMock(return_value=True)),
+            patch.object(VectorService, "_request_embeddings", AsyncMock(side_effect=[[[1.0, 0.0]], [[0.0, 1.0]]])),
+        ):
+            await service.index_items([("11111111-1111-1111-1111-111111111111", "App crashes on login", None)])
+            result = await service._search_batch([("Add dark mode", 0.9, 5)])
+
+        assert result == [(False, None)]
+        qdrant_client.query_batch_points.assert_called_once()
+
+    async def test_recent_index_hit_skips_qdrant_search(self):
+        """Test a hit in the approximate recent-vector index is answered without Qdrant."""
+        qdrant_client = AsyncMock()
+        service = VectorService(client=qdrant_client)
+        service._recent_index = MagicMock(dim=2)
+        service._recent_index.search.return_value = ["11111111-1111-1111-1111-111111111111"]
+
+        with patch.object(VectorService, "_request_embeddings", AsyncMock(return_value=[[3.0, 4.0]])):
+            result = await service._search_batch([("Login crashes the app", 0.9, 5)])
+
+        assert result == [(True, "11111111-1111-1111-1111-111111111111")]
+        queries, thresholds = service._recent_index.search.call_args.args
+        np.testing.assert_allclose(queries, [[0.6, 0.8]], rtol=1e-6)
+        assert thresholds == [0.9]
+        qdrant_client.query_batch_points.assert_not_called()
+
+
+class TestBatchDuplicateCheck:
+    """Tests for checking several texts for duplicates at once."""
+
+    async def test_only_misses_are_searched_in_qdrant(self):
+        """Test recent-vector hits are answered in memory and misses share one query."""
+        qdrant_client = AsyncMock()
+        qdrant_client.query_batch_points.return_value = [MagicMock(points=[])]
+        service = VectorService(client=qdrant_client)
+        item_id = "11111111-1111-1111-1111-111111111111"
+
+        with (
+            patch.object(VectorService, "ensure_collection", AsyncMock(return_value=True)),
+            patch.object(
+                VectorService,
+                "_request_embeddings",
+                AsyncMock(side_effect=[[[1.0, 0.0]], [[0.98, 0.1], [0.0, 1.0]]]),
+            ),
+        ):
+            await service.index_items([(item_id, "App crashes on login", None)])
+            results = await service.search_similar_batch(["Login crashes the app", "Add dark mode"], threshold=0.9)
+
+        assert results == [(True, item_id), (False, None)]
+        requests = qdrant_client.query_batch_points.call_args.kwargs["requests"]
+        assert [request.query for request in requests] == [[0.0, 1.0]]
+
+
+class TestBulkIndexing:
+    """Tests for backfilling many items."""
+
+    async def test_bulk_index_batches_and_restores_indexing(self):
+        """Test items are upserted in batches with indexing paused during the load."""
+        qdrant_client = AsyncMock()
+        qdrant_client.get_collection.return_value.config.optimizer_config.indexing_threshold = 20000
+        service = VectorService(client=qdrant_client)
+        items = [(f"00000000-0000-0000-0000-{i:012d}", f"feedback {i}", None) for i in range(5)]
+
+        with (
+            patch.object(VectorService, "ensure_collection", AsyncMock(return_value=True)),
+            patch.object(
+                VectorService, "_request_embeddings", AsyncMock(side_effect=lambda texts: [[1.0]] * len(texts))
+            ),
+        ):
+            count = await service.index_items_bulk(items, batch_size=2, parallel=2)
+
+        assert count == 5
+        assert qdrant_client.upsert.call_count == 3
+        assert sorted(service._recent_ids[: service._recent_count]) == [id for id, _, _ in items]
+        thresholds = [
+            call.kwargs["optimizers_config"].indexing_threshold for call in qdrant_client.update_collection.call_args_list
+        ]
+        assert thresholds == [0, 20000]
+
+
+class TestEnsureCollection:
+    """Tests for the one-time collection check."""
+
+    async def test_collection_checked_once(self):
+        """Test concurrent and repeated calls query Qdrant only once."""
+        qdrant_client = AsyncMock()
+        qdrant_client.collection_exists.return_value = True
+        qdrant_client.scroll.return_value = ([], None)
+        service = VectorService(client=qdrant_client)
+
+        results = await asyncio.gather(*(service.ensure_collection() for _ in range(5)))
+        await service.ensure_collection()
+
+        assert all(results)
+        qdrant_client.collection_exists.assert_called_once_with("feedback_items")
+        qdrant_client.create_collection.assert_not_called()
+        qdrant_client.create_payload_index.assert_called_once()
+        assert qdrant_client.scroll.call_args_list[0].kwargs["order_by"].key == "indexed_at"
+
+
+class TestIngestAndCheck:
+    """Tests for the combined persist and duplicate check."""
+
+    async def test_duplicate_is_saved_and_marked(self):
+        """Test the feedback is saved and then linked to the matching item."""
+        feedback = MagicMock(id="feedback-1", raw_content="App crashes on login")
+        vector_service = MagicMock(search_similar=AsyncMock(return_value=(True, "existing-1")))
+        supabase = MagicMock(save_raw_feedback=AsyncMock(return_value="feedback-1"), mark_as_duplicate=AsyncMock())
+
+        with (
+            patch("src.services.qdrant.get_vector_service", AsyncMock(return_value=vector_service)),
+            patch("src.services.supabase.get_supabase_service", AsyncMock(return_value=supabase)),
+        ):
+            result = await qdrant.ingest_and_check(feedback)
+
+        assert result == (True, "existing-1")
+        vector_service.search_similar.assert_called_once_with("App crashes on login")
+        supabase.save_raw_feedback.assert_called_once_with(feedback)
+        supabase.mark_as_duplicate.assert_called_once_with("feedback-1", "existing-1")
@@ -15,6 +15,18 @@ from src.agents.spec import (
     write_spec,
     get_llm_client,
 )
+from src.services.spec_templates import SpecTemplateCache
+
+
+def make_stream(content: str, chunk_size: int = 16) -> MagicMock:
+    """Build a mock streaming completion that yields content in chunks."""
+    stream = MagicMock()
+    stream.__aiter__.return_value = [
+        MagicMock(choices=[MagicMock(delta=MagicMock(content=content[i : i + chunk_size]))])
+        for i in range(0, len(content), chunk_size)
+    ]
+    stream.close = AsyncMock()
+    return stream
 
 
 class TestSpecResult:
@@ -144,17 +156,11 @@ class TestSpecState:
 class TestSpecWriterNode:
     """Tests for the spec writer node function."""
 
-    @pytest.mark.asyncio
     async def test_write_bug_spec(self):
         """Test spec writer creates a proper bug report."""
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(
-                message=MagicMock(
-                    content='{"title": "Fix login timeout on mobile Safari", "reproduction_steps": ["Open app on mobile Safari", "Tap login", "Wait"], "affected_components": ["auth", "frontend"], "acceptance_criteria": ["Login completes within 5 seconds"], "suggested_labels": ["bug", "high", "mobile"], "spec_confidence": 0.9}'
-                )
-            )
-        ]
+        mock_response = make_stream(
+            '{"title": "Fix login timeout on mobile Safari", "reproduction_steps": ["Open app on mobile Safari", "Tap login", "Wait"], "affected_components": ["auth", "frontend"], "acceptance_criteria": ["Login completes within 5 seconds"], "suggested_labels": ["bug", "high", "mobile"], "spec_confidence": 0.9}'
+        )
 
         with patch("src.agents.spec.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
@@ -184,17 +190,11 @@ class TestSpecWriterNode:
             assert len(result["affected_components"]) >= 1
             assert "bug" in result["suggested_labels"]
 
-    @pytest.mark.asyncio
     async def test_write_feature_spec(self):
         """Test spec writer creates a proper feature request."""
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(
-                message=MagicMock(
-                    content='{"title": "Add dark mode support", "reproduction_steps": [], "affected_components": ["frontend", "ui"], "acceptance_criteria": ["Dark mode toggle in settings", "Theme persists"], "suggested_labels": ["feature", "ui", "enhancement"], "spec_confidence": 0.85}'
-                )
-            )
-        ]
+        mock_response = make_stream(
+            '{"title": "Add dark mode support", "reproduction_steps": [], "affected_components": ["frontend", "ui"], "acceptance_criteria": ["Dark mode toggle in settings", "Theme persists"], "suggested_labels": ["feature", "ui", "enhancement"], "spec_confidence": 0.85}'
+        )
 
         with patch("src.agents.spec.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
@@ -223,7 +223,6 @@ class TestSpecWriterNode:
             assert len(result["reproduction_steps"]) == 0  # Features don't have repro steps
             assert len(result["acceptance_criteria"]) >= 1
 
-    @pytest.mark.asyncio
     async def test_spec_writer_fallback_on_error(self):
         """Test spec writer returns safe defaults on error."""
         with patch("src.agents.spec.get_llm_client") as mock_get_client:
@@ -253,21 +252,83 @@ class TestSpecWriterNode:
             assert "bug" in result["suggested_labels"]
             assert result["spec_confidence"] == 0.0
 
+    async def test_spec_template_reuse(self):
+        """Test bucket templates skip or shrink the LLM call."""
+        template_cache = SpecTemplateCache(vector_service=MagicMock(), similarity_threshold=0.95)
+        template_cache.update(
+            "bug",
+            "high",
+            [1.0, 0.0],
+            {
+                "title": "Fix login timeout on mobile Safari",
+                "reproduction_steps": ["Open app", "Tap login"],
+                "affected_components": ["auth"],
+                "acceptance_criteria": ["Login completes within 5 seconds"],
+                "suggested_labels": ["bug", "high"],
+                "spec_confidence": 0.9,
+            },
+        )
+        mock_response = make_stream(
+            '{"title": "Fix checkout crash on Android", "reproduction_steps": ["Open cart", "Tap pay"]}'
+        )
+        state = SpecState(
+            feedback_id="fb-321",
+            content="Checkout crashes on Android",
+            source="discord",
+            classification="bug",
+            severity="high",
+            reasoning="Crash in payment flow",
+            confidence=0.9,
+            title="",
+            reproduction_steps=[],
+            affected_components=[],
+            acceptance_criteria=[],
+            suggested_labels=[],
+            spec_confidence=0.0,
+        )
+
+        with patch("src.agents.spec.get_spec_template_cache", return_value=template_cache), patch(
+            "src.agents.spec.get_llm_client"
+        ) as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+            mock_get_client.return_value = mock_client
+
+            # Near-identical content: template returned without an LLM call
+            template_cache.embed = AsyncMock(return_value=[1.0, 0.0])
+            result = await spec_writer_node(state)
+
+            assert result["title"] == "[BUG] Checkout crashes on Android"
+            assert result["acceptance_criteria"] == ["Login completes within 5 seconds"]
+            mock_client.chat.completions.create.assert_not_called()
+
+            # Related but not near-identical content still gets its own steps
+            template_cache.embed = AsyncMock(return_value=[0.9, 0.44])
+            result = await spec_writer_node(state)
+
+            assert result["reproduction_steps"] == ["Open cart", "Tap pay"]
+            mock_client.chat.completions.create.assert_called_once()
+            mock_client.chat.completions.create.reset_mock()
+
+            # Dissimilar content: reduced prompt, template fields merged in.
+            # Different text so the LLM cache cannot answer the draft prompt.
+            template_cache.embed = AsyncMock(return_value=[0.0, 1.0])
+            result = await spec_writer_node({**state, "content": "Payment page freezes on tablets"})
+
+            assert result["title"] == "Fix checkout crash on Android"
+            assert result["affected_components"] == ["auth"]
+            assert result["suggested_labels"] == ["bug", "high"]
+            mock_client.chat.completions.create.assert_called_once()
+
 
 class TestWriteSpec:
     """Tests for the write_spec convenience function."""
 
-    @pytest.mark.asyncio
     async def test_write_spec_success(self):
         """Test writing a spec returns SpecResult."""
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(
-                message=MagicMock(
-                    content='{"title": "Test Issue", "reproduction_steps": [], "affected_components": ["api"], "acceptance_criteria": ["Done"], "suggested_labels": ["bug"], "spec_confidence": 0.9}'
-                )
-            )
-        ]
+        mock_response = make_stream(
+            '{"title": "Test Issue", "reproduction_steps": [], "affected_components": ["api"], "acceptance_criteria": ["Done"], "suggested_labels": ["bug"], "spec_confidence": 0.9}'
+        )
 
         with patch("src.agents.spec.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
@@ -293,21 +354,23 @@ class TestGetLLMClient:
 
     def test_returns_openai_client(self):
         """Test get_llm_client returns an AsyncOpenAI client."""
-        with patch("src.agents.spec.settings") as mock_settings:
-            mock_settings.openai_api_key.get_secret_value.return_value = "test-key"
-            mock_settings.local_llm_url = "http://localhost:11434/v1"
-            mock_settings.local_llm_model = "qwen2.5-coder:3b"
-
-            # Mock the AsyncOpenAI to avoid actual connection
-            with patch("src.agents.spec.AsyncOpenAI") as mock_openai:
-                mock_client = MagicMock()
-                mock_openai.return_value = mock_client
-
-                client = get_llm_client()
-
-                # Verify it was called with correct parameters
-                mock_openai.assert_called_once()
-                call_kwargs = mock_openai.call_args.kwargs
-                assert "http://localhost:11434/v1" in call_kwargs["base_url"]
-                assert call_kwargs["api_key"] == "ollama"
-                assert call_kwargs["model"] == "qwen2.5-coder:3b"
+        # Mock the AsyncOpenAI to avoid actual connection
+        with patch("src.services.llm_client.AsyncOpenAI") as mock_openai:
+            mock_client = MagicMock()
+            mock_openai.return_value = mock_client
+
+            client = get_llm_client()
+
+            # Verify it was called with correct parameters
+            mock_openai.assert_called_once()
+            call_kwargs = mock_openai.call_args.kwargs
+            assert "http://localhost:11434/v1" in call_kwargs["base_url"]
+            assert call_kwargs["api_key"] == "ollama"
+            assert call_kwargs["http_client"] is not None
+            assert client is mock_client
+
+    def test_client_is_reused(self):
+        """Test repeated calls share one client and connection pool."""
+        with patch("src.services.llm_client.AsyncOpenAI") as mock_openai:
+            assert get_llm_client() is get_llm_client()
+            mock_openai.assert_called_once()
@@ -0,0 +1,105 @@
+"""Tests for the Supabase persistence service."""
+
+import httpx
+import orjson
+
+from src.schemas.ingestion import FeedbackItem, FeedbackSource
+from src.services.supabase import SupabaseService, _PostgrestAsync
+
+
+def _postgrest(handler) -> _PostgrestAsync:
+    """PostgREST client whose requests are answered by `handler`."""
+    client = _PostgrestAsync("https://example.supabase.co", "service-key")
+    client._http = httpx.AsyncClient(
+        base_url="https://example.supabase.co/rest/v1",
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestPostgrestQueries:
+    """Tests for requests sent to the Supabase REST API."""
+
+    async def test_get_issue_by_id_filters_on_id(self):
+        """Test the issue lookup sends an eq filter and returns the first row."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=orjson.dumps([{"id": "issue-1", "status": "draft"}]))
+
+        service = SupabaseService(client=_postgrest(handler))
+
+        issue = await service.get_issue_by_id("issue-1")
+
+        assert issue == {"id": "issue-1", "status": "draft"}
+        assert requests[0].url.path == "/rest/v1/issues"
+        assert requests[0].url.params["id"] == "eq.issue-1"
+
+    async def test_count_issues_reads_content_range(self):
+        """Test counts come from the Content-Range header of a HEAD request."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "HEAD"
+            assert request.headers["prefer"] == "count=exact"
+            return httpx.Response(200, headers={"Content-Range": "0-24/42"})
+
+        service = SupabaseService(client=_postgrest(handler))
+
+        assert await service.count_issues("draft") == 42
+
+    async def test_writes_read_back_only_what_is_used(self):
+        """Test inserts return only IDs and updates return nothing."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.method == "POST":
+                return httpx.Response(201, content=orjson.dumps([{"id": "issue-1"}]))
+            return httpx.Response(204)
+
+        service = SupabaseService(client=_postgrest(handler))
+
+        issue_id = await service.save_issue_draft("feedback-1", "Title", "Body", {}, {}, [])
+        await service.publish_issue(issue_id, "https://github.com/o/r/issues/1")
+
+        insert, update = requests
+        assert insert.url.params["select"] == "id"
+        assert update.headers["prefer"] == "return=minimal"
+        assert update.url.params["id"] == "eq.issue-1"
+
+    async def test_retried_feedback_save_leaves_existing_row(self):
+        """Test re-saving feedback skips the existing row instead of resetting its status."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            # PostgREST returns no rows for a skipped duplicate
+            return httpx.Response(201, content=b"[]")
+
+        service = SupabaseService(client=_postgrest(handler))
+        feedback = FeedbackItem(source=FeedbackSource.MANUAL, raw_content="Login is broken")
+
+        assert await service.save_raw_feedback(feedback) == str(feedback.id)
+        assert "resolution=ignore-duplicates" in requests[0].headers["prefer"]
+
+    async def test_get_drafts_fetches_one_projected_page(self):
+        """Test drafts are paginated and skip the body and feedback text."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.endswith("/issues"):
+                return httpx.Response(200, content=orjson.dumps([{"id": "issue-1", "feedback_id": "feedback-1"}]))
+            return httpx.Response(200, content=orjson.dumps([{"id": "feedback-1", "source": "slack"}]))
+
+        service = SupabaseService(client=_postgrest(handler))
+
+        drafts = await service.get_drafts(limit=20, offset=40)
+
+        issues, feedback = requests
+        assert issues.url.params["limit"] == "20"
+        assert issues.url.params["offset"] == "40"
+        assert "body" not in issues.url.params["select"].split(",")
+        assert feedback.url.params["select"] == "id,source,classification,severity"
+        assert drafts[0]["feedback_items"] == {"source": "slack"}
@@ -13,8 +13,23 @@ from src.agents.triage import (
     TriageResult,
     triage_node,
     classify_feedback,
+    batch_classify_feedback,
     get_llm_client,
+    _fast_classify,
 )
+from src.agents import triage
+
+
+# One client for the module; tests set the completion on it
+_CANNED_CLIENT = AsyncMock()
+
+
+@pytest.fixture
+def llm_client(monkeypatch):
+    """Point triage at the canned LLM client with a fresh create() mock."""
+    _CANNED_CLIENT.chat.completions.create = AsyncMock()
+    monkeypatch.setattr(triage, "get_llm_client", lambda: _CANNED_CLIENT)
+    return _CANNED_CLIENT
 
 
 class TestTriageResult:
@@ -131,8 +146,7 @@ class TestTriageState:
 class TestTriageNode:
     """Tests for the triage node function."""
 
-    @pytest.mark.asyncio
-    async def test_triage_bug_classification(self):
+    async def test_triage_bug_classification(self, llm_client):
         """Test triage node correctly identifies a bug."""
         # Mock the LLM client
         mock_response = MagicMock()
@@ -144,29 +158,25 @@ class TestTriageNode:
             )
         ]
 
-        with patch("src.agents.triage.get_llm_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
+        llm_client.chat.completions.create.return_value = mock_response
 
-            result = await triage_node(
-                TriageState(
-                    feedback_id="fb-123",
-                    content="The app crashes when I click submit button",
-                    source="discord",
-                    classification="question",
-                    severity="low",
-                    reasoning="",
-                    confidence=0.0,
-                )
+        result = await triage_node(
+            TriageState(
+                feedback_id="fb-123",
+                content="The app crashes when I click submit button",
+                source="discord",
+                classification="question",
+                severity="low",
+                reasoning="",
+                confidence=0.0,
             )
+        )
 
-            assert result["classification"] == "bug"
-            assert result["severity"] == "high"
-            assert result["confidence"] == 0.95
+        assert result["classification"] == "bug"
+        assert result["severity"] == "high"
+        assert result["confidence"] == 0.95
 
-    @pytest.mark.asyncio
-    async def test_triage_question_classification(self):
+    async def test_triage_question_classification(self, llm_client):
         """Test triage node correctly identifies a question."""
         mock_response = MagicMock()
         mock_response.choices = [
@@ -177,35 +187,63 @@ class TestTriageNode:
             )
         ]
 
-        with patch("src.agents.triage.get_llm_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
+        llm_client.chat.completions.create.return_value = mock_response
 
-            result = await triage_node(
-                TriageState(
-                    feedback_id="fb-456",
-                    content="How do I reset my password?",
-                    source="slack",
-                    classification="question",
-                    severity="low",
-                    reasoning="",
-                    confidence=0.0,
-                )
+        result = await triage_node(
+            TriageState(
+                feedback_id="fb-456",
+                content="How do I reset my password?",
+                source="slack",
+                classification="question",
+                severity="low",
+                reasoning="",
+                confidence=0.0,
             )
+        )
 
-            assert result["classification"] == "question"
+        assert result["classification"] == "question"
 
-    @pytest.mark.asyncio
-    async def test_triage_fallback_on_error(self):
+    async def test_triage_fallback_on_error(self, monkeypatch):
         """Test triage returns safe defaults on error."""
-        with patch("src.agents.triage.get_llm_client") as mock_get_client:
-            mock_get_client.side_effect = Exception("LLM connection failed")
+        monkeypatch.setattr(triage, "get_llm_client", MagicMock(side_effect=Exception("LLM connection failed")))
+
+        result = await triage_node(
+            TriageState(
+                feedback_id="fb-789",
+                content="Test content",
+                source="discord",
+                classification="question",
+                severity="low",
+                reasoning="",
+                confidence=0.0,
+            )
+        )
+
+        # Should return safe defaults
+        assert result["classification"] == "question"
+        assert result["severity"] == "low"
+        assert result["confidence"] == 0.0
+        assert "Classification failed" in result["reasoning"]
+
 
+    async def test_triage_serves_repeat_content_from_cache(self, llm_client):
+        """Test identical feedback only calls the LLM once."""
+        mock_response = MagicMock()
+        mock_response.choices = [
+            MagicMock(
+                message=MagicMock(
+                    content='{"classification": "bug", "severity": "high", "reasoning": "User reports crash on submit", "confidence": 0.95}'
+                )
+            )
+        ]
+
+        llm_client.chat.completions.create.return_value = mock_response
+
+        for feedback_id in ("fb-1", "fb-2"):
             result = await triage_node(
                 TriageState(
-                    feedback_id="fb-789",
-                    content="Test content",
+                    feedback_id=feedback_id,
+                    content="The app crashes when I click submit button",
                     source="discord",
                     classification="question",
                     severity="low",
@@ -213,19 +251,111 @@ class TestTriageNode:
                     confidence=0.0,
                 )
             )
+            assert result["classification"] == "bug"
 
-            # Should return safe defaults
-            assert result["classification"] == "question"
-            assert result["severity"] == "low"
-            assert result["confidence"] == 0.0
-            assert "Classification failed" in result["reasoning"]
+        llm_client.chat.completions.create.assert_called_once()
+
+
+    async def test_triage_semantic_cache_hit_skips_llm(self, llm_client, monkeypatch):
+        """Test a semantic cache hit returns the cached result without the LLM."""
+        cached = {
+            "classification": "bug",
+            "severity": "high",
+            "reasoning": "Login broken on another browser",
+            "confidence": 0.9,
+        }
+        mock_cache = MagicMock()
+        mock_cache.lookup = AsyncMock(return_value=([0.1, 0.2], cached))
+
+        monkeypatch.setattr(triage, "get_semantic_cache", lambda: mock_cache)
+
+        result = await triage_node(
+            TriageState(
+                feedback_id="fb-semantic",
+                content="Login broken on Chrome",
+                source="discord",
+                classification="question",
+                severity="low",
+                reasoning="",
+                confidence=0.0,
+            )
+        )
+
+        assert result == cached
+        llm_client.chat.completions.create.assert_not_called()
+
+    async def test_triage_retries_invalid_output(self, llm_client):
+        """Test malformed output is re-prompted at temperature 0 instead of falling back."""
+        invalid = MagicMock()
+        invalid.choices = [MagicMock(message=MagicMock(content='{"classification": "bug"}'))]
+        valid = MagicMock()
+        valid.choices = [
+            MagicMock(
+                message=MagicMock(
+                    content='{"classification": "bug", "severity": "high", "reasoning": "User reports crash on submit", "confidence": 0.95}'
+                )
+            )
+        ]
+
+        llm_client.chat.completions.create.side_effect = [invalid, valid]
+
+        result = await triage_node(
+            TriageState(
+                feedback_id="fb-retry",
+                content="The app crashes when I click submit button",
+                source="discord",
+                classification="question",
+                severity="low",
+                reasoning="",
+                confidence=0.0,
+            )
+        )
+
+        assert result["classification"] == "bug"
+        assert result["confidence"] == 0.95
+        assert llm_client.chat.completions.create.call_count == 2
+        retry_kwargs = llm_client.chat.completions.create.call_args.kwargs
+        assert retry_kwargs["temperature"] == 0.0
+        assert retry_kwargs["messages"][0]["role"] == "system"
+        assert "invalid" in retry_kwargs["messages"][-1]["content"]
+
+
+class TestFastClassify:
+    """Tests for the keyword pre-classifier."""
+
+    def test_exclusive_signals_classify_without_llm(self):
+        """Test feedback with one class and one severity signal is classified by rules."""
+        result = _fast_classify("Production is down, every request returns a 500 error")
+        assert (result.classification, result.severity) == ("bug", "critical")
+        result = _fast_classify("Minor: please add support for keyboard shortcuts")
+        assert (result.classification, result.severity) == ("feature", "low")
+
+    def test_bug_keywords_match_inflections(self):
+        """Test inflected bug keywords still count as bug signals."""
+        result = _fast_classify("Saving failed with errors and the app crashes after the outage")
+        assert (result.classification, result.severity) == ("bug", "critical")
+
+    def test_missing_severity_signal_defers_to_llm(self):
+        """Test a clear class without a severity signal falls through."""
+        assert _fast_classify("Login broken on Chrome") is None
+        assert _fast_classify("How do I export my data?") is None
+        assert _fast_classify("Hello how are you?") is None
+
+    def test_critical_signal_is_never_a_rule_based_question(self):
+        """Test outage reports phrased as questions fall through to the LLM."""
+        assert _fast_classify("Is the site down?") is None
+        assert _fast_classify("Production is down for everyone?") is None
+
+    def test_ambiguous_or_unmatched_defers_to_llm(self):
+        """Test mixed or missing signals fall through to the LLM."""
+        assert _fast_classify("Why is the export broken?") is None
+        assert _fast_classify("The dashboard looks different today") is None
 
 
 class TestClassifyFeedback:
     """Tests for the classify_feedback convenience function."""
 
-    @pytest.mark.asyncio
-    async def test_classify_feedback_success(self):
+    async def test_classify_feedback_success(self, llm_client):
         """Test classifying feedback returns TriageResult."""
         mock_response = MagicMock()
         mock_response.choices = [
@@ -236,20 +366,45 @@ class TestClassifyFeedback:
             )
         ]
 
-        with patch("src.agents.triage.get_llm_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
+        llm_client.chat.completions.create.return_value = mock_response
 
-            result = await classify_feedback(
-                feedback_id="fb-test",
-                content="Please add dark mode",
-                source="discord",
+        result = await classify_feedback(
+            feedback_id="fb-test",
+            content="Please add dark mode",
+            source="discord",
+        )
+
+        assert isinstance(result, TriageResult)
+        assert result.classification == "feature"
+        assert result.severity == "medium"
+
+
+class TestBatchClassifyFeedback:
+    """Tests for the batch_classify_feedback convenience function."""
+
+    async def test_batch_preserves_order_and_isolates_failures(self):
+        """Test results come back in input order and one failure does not sink the batch."""
+        ok = TriageResult(
+            classification="bug",
+            severity="high",
+            reasoning="User reports crash on submit",
+            confidence=0.95,
+        )
+
+        async def fake_classify(feedback_id, content, source):
+            if feedback_id == "fb-bad":
+                raise RuntimeError("boom")
+            return ok
+
+        with patch("src.agents.triage.classify_feedback", side_effect=fake_classify):
+            results = await batch_classify_feedback(
+                [("fb-1", "a", "discord"), ("fb-bad", "b", "slack"), ("fb-3", "c", "discord")],
+                concurrency=2,
             )
 
-            assert isinstance(result, TriageResult)
-            assert result.classification == "feature"
-            assert result.severity == "medium"
+        assert results[0] == ok
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == ok
 
 
 class TestGetLLMClient:
@@ -257,21 +412,23 @@ class TestGetLLMClient:
 
     def test_returns_openai_client(self):
         """Test get_llm_client returns an AsyncOpenAI client."""
-        with patch("src.agents.triage.settings") as mock_settings:
-            mock_settings.openai_api_key.get_secret_value.return_value = "test-key"
-            mock_settings.local_llm_url = "http://localhost:11434/v1"
-            mock_settings.local_llm_model = "qwen2.5-coder:3b"
-
-            # Mock the AsyncOpenAI to avoid actual connection
-            with patch("src.agents.triage.AsyncOpenAI") as mock_openai:
-                mock_client = MagicMock()
-                mock_openai.return_value = mock_client
-
-                client = get_llm_client()
-
-                # Verify it was called with correct parameters
-                mock_openai.assert_called_once()
-                call_kwargs = mock_openai.call_args.kwargs
-                assert "http://localhost:11434/v1" in call_kwargs["base_url"]
-                assert call_kwargs["api_key"] == "ollama"
-                assert call_kwargs["model"] == "qwen2.5-coder:3b"
+        # Mock the AsyncOpenAI to avoid actual connection
+        with patch("src.services.llm_client.AsyncOpenAI") as mock_openai:
+            mock_client = MagicMock()
+            mock_openai.return_value = mock_client
+
+            client = get_llm_client()
+
+            # Verify it was called with correct parameters
+            mock_openai.assert_called_once()
+            call_kwargs = mock_openai.call_args.kwargs
+            assert "http://localhost:11434/v1" in call_kwargs["base_url"]
+            assert call_kwargs["api_key"] == "ollama"
+            assert call_kwargs["http_client"] is not None
+            assert client is mock_client
+
+    def test_client_is_reused(self):
+        """Test repeated calls share one client and connection pool."""
+        with patch("src.services.llm_client.AsyncOpenAI") as mock_openai:
+            assert get_llm_client() is get_llm_client()
+            mock_openai.assert_called_once()
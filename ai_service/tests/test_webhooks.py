@@ -6,12 +6,14 @@ Uses unittest.mock.AsyncMock to mock KafkaService for isolated testing.
 from typing import Any, AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
+from src.api import webhooks
 from src.main import app
-from src.schemas.ingestion import DiscordWebhookPayload, SlackWebhookPayload
-from src.services.kafka import KafkaService, get_kafka_service
+from src.schemas.ingestion import DiscordWebhookPayload, FeedbackItem, SlackWebhookPayload
+from src.services.kafka import KafkaService, KafkaServiceError, get_kafka_service
 
 
 # ========================
@@ -19,6 +21,14 @@ from src.services.kafka import KafkaService, get_kafka_service
 # ========================
 
 
+@pytest.fixture(autouse=True)
+def reset_recent_deliveries() -> Generator[None, None, None]:
+    """Keep redelivery dedup state from leaking between tests."""
+    webhooks._RECENT_DELIVERIES.clear()
+    yield
+    webhooks._RECENT_DELIVERIES.clear()
+
+
 @pytest.fixture
 def mock_kafka_service() -> MagicMock:
     """Create a mocked KafkaService with AsyncMock for publish."""
@@ -84,9 +94,70 @@ class TestDiscordWebhook:
         mock_kafka_service.publish.assert_called_once()
         call_args = mock_kafka_service.publish.call_args
         assert call_args.kwargs["topic"] == "feedback.raw"
-        message_data = call_args.kwargs["data"]
+        message_data = orjson.loads(orjson.dumps(call_args.kwargs["data"]))
         assert message_data["source"] == "discord"
         assert "raw_content" in message_data
+        assert message_data["raw_payload"] == payload
+
+    def test_discord_webhook_accepts_when_kafka_fails(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
+        """Test the webhook is acknowledged even if the background publish fails."""
+        mock_kafka_service.publish.side_effect = KafkaServiceError("broker unavailable")
+        payload = {
+            "id": "123456789",
+            "channel_id": "987654321",
+            "content": "The login button is broken on mobile",
+        }
+
+        response = client_with_mocks.post("/webhooks/discord", json=payload)
+
+        assert response.status_code == 202
+        mock_kafka_service.publish.assert_called_once()
+
+    def test_discord_webhook_dead_letters_unexpected_publish_errors(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
+        """Test errors other than KafkaServiceError are dead-lettered instead of escaping."""
+        mock_kafka_service.publish.side_effect = RuntimeError("producer failed to start")
+        payload = {
+            "id": "123456789",
+            "channel_id": "987654321",
+            "content": "Exports time out",
+        }
+
+        response = client_with_mocks.post("/webhooks/discord", json=payload)
+
+        assert response.status_code == 202
+        mock_kafka_service.publish.assert_called_once()
+
+    def test_discord_webhook_redelivery_is_deduplicated(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
+        """Test a retried delivery is acknowledged with the original ID and not republished."""
+        payload = {
+            "id": "123456789",
+            "channel_id": "987654321",
+            "content": "Search returns no results",
+        }
+
+        first = client_with_mocks.post("/webhooks/discord", json=payload)
+        second = client_with_mocks.post("/webhooks/discord", json=payload)
+
+        assert first.status_code == second.status_code == 202
+        assert second.json()["id"] == first.json()["id"]
+        mock_kafka_service.publish.assert_called_once()
+        assert orjson.loads(orjson.dumps(mock_kafka_service.publish.call_args.kwargs["data"]))["dedup_hash"]
+
+    def test_discord_webhook_redelivery_after_failed_publish_is_published(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
+        """Test a failed publish releases the dedup entry so the sender's retry goes through."""
+        mock_kafka_service.publish.side_effect = [RuntimeError("producer failed to start"), {"status": "success"}]
+        payload = {
+            "id": "123456789",
+            "channel_id": "987654321",
+            "content": "Search returns no results",
+        }
+
+        first = client_with_mocks.post("/webhooks/discord", json=payload)
+        second = client_with_mocks.post("/webhooks/discord", json=payload)
+
+        assert first.status_code == second.status_code == 202
+        assert second.json()["id"] != first.json()["id"]
+        assert mock_kafka_service.publish.call_count == 2
 
     def test_discord_webhook_with_embed(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
         """Test Discord webhook with embed content."""
@@ -106,7 +177,7 @@ class TestDiscordWebhook:
 
         assert response.status_code == 202
         call_args = mock_kafka_service.publish.call_args
-        message_data = call_args.kwargs["data"]
+        message_data = orjson.loads(orjson.dumps(call_args.kwargs["data"]))
         assert "App crashes on upload" in message_data["raw_content"]
 
     def test_discord_webhook_empty_content(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
@@ -123,6 +194,32 @@ class TestDiscordWebhook:
         assert "No extractable content" in response.json()["detail"]
         mock_kafka_service.publish.assert_not_called()
 
+    def test_discord_webhook_without_content_fields(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
+        """Test payloads without any content fields are rejected before parsing."""
+        payload = {
+            "id": "123456789",
+            "channel_id": "987654321",
+            "type": 3,
+        }
+
+        response = client_with_mocks.post("/webhooks/discord", json=payload)
+
+        assert response.status_code == 400
+        assert "No extractable content" in response.json()["detail"]
+        mock_kafka_service.publish.assert_not_called()
+
+    def test_discord_webhook_invalid_json(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
+        """Test a malformed body is rejected with 422 before publishing."""
+        response = client_with_mocks.post(
+            "/webhooks/discord",
+            content=b'{"content": "unterminated',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][0] == "body"
+        mock_kafka_service.publish.assert_not_called()
+
     def test_discord_webhook_strips_content(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
         """Test that whitespace is stripped from content."""
         payload = {
@@ -134,7 +231,7 @@ class TestDiscordWebhook:
 
         assert response.status_code == 202
         call_args = mock_kafka_service.publish.call_args
-        message_data = call_args.kwargs["data"]
+        message_data = orjson.loads(orjson.dumps(call_args.kwargs["data"]))
         assert message_data["raw_content"] == "Bug report here"
 
 
@@ -165,7 +262,7 @@ class TestSlackWebhook:
         mock_kafka_service.publish.assert_called_once()
         call_args = mock_kafka_service.publish.call_args
         assert call_args.kwargs["topic"] == "feedback.raw"
-        message_data = call_args.kwargs["data"]
+        message_data = orjson.loads(orjson.dumps(call_args.kwargs["data"]))
         assert message_data["source"] == "slack"
         assert message_data["raw_content"] == "The checkout flow is confusing"
 
@@ -188,7 +285,7 @@ class TestSlackWebhook:
 
         assert response.status_code == 202
         call_args = mock_kafka_service.publish.call_args
-        message_data = call_args.kwargs["data"]
+        message_data = orjson.loads(orjson.dumps(call_args.kwargs["data"]))
         assert "*Feature Request:* Dark mode support" in message_data["raw_content"]
 
     def test_slack_webhook_with_attachments(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
@@ -207,7 +304,7 @@ class TestSlackWebhook:
 
         assert response.status_code == 202
         call_args = mock_kafka_service.publish.call_args
-        message_data = call_args.kwargs["data"]
+        message_data = orjson.loads(orjson.dumps(call_args.kwargs["data"]))
         assert message_data["raw_content"] == "Error in dashboard widget"
 
     def test_slack_webhook_empty_content(self, client_with_mocks: TestClient, mock_kafka_service: MagicMock) -> None:
@@ -287,6 +384,29 @@ class TestDiscordSchema:
 
         assert model.content == "spaced out"
 
+    def test_feedback_item_keeps_raw_body_undecoded(self) -> None:
+        """Test the raw body is stored as bytes and only decoded on demand."""
+        raw_body = b'{"id": "123", "content": "Bug report", "guild_id": "456"}'
+        model = DiscordWebhookPayload.model_validate_json(raw_body)
+
+        feedback = FeedbackItem.from_discord(model, raw_body=raw_body)
+
+        assert feedback.raw_payload == {}
+        assert feedback.get_raw_payload() == {"id": "123", "content": "Bug report", "guild_id": "456"}
+
+    def test_feedback_item_encoded_message_reflects_copies(self) -> None:
+        """Test the encoded message follows the item's current fields, including on copies."""
+        raw_body = b'{"id": "123", "content": "Bug report"}'
+        feedback = FeedbackItem.from_discord(DiscordWebhookPayload.model_validate_json(raw_body), raw_body=raw_body)
+
+        message = orjson.loads(feedback.encoded_message())
+        copied = orjson.loads(feedback.model_copy(update={"raw_content": "Edited"}).encoded_message())
+
+        assert message["id"] == str(feedback.id)
+        assert message["raw_payload"] == {"id": "123", "content": "Bug report"}
+        assert message["raw_content"] == "Bug report"
+        assert copied["raw_content"] == "Edited"
+
 
 class TestSlackSchema:
     """Unit tests for Slack schema validation."""
@@ -0,0 +1,137 @@
+// Internal API: Save Issues (bulk)
+// Called by AI Service with batches of processed feedback
+// Protected by INTERNAL_API_KEY
+
+import { NextRequest, NextResponse } from 'next/server';
+import crypto from 'crypto';
+import { gunzipSync } from 'zlib';
+import prisma from '@/server/db';
+
+const INTERNAL_API_KEY = process.env.INTERNAL_API_KEY;
+
+type SaveIssueResult =
+  | { success: true; issueId: string; feedbackId: string }
+  | { success: false; error: string; feedbackId?: string };
+
+export async function POST(request: NextRequest) {
+  // Verify API key is configured
+  if (!INTERNAL_API_KEY) {
+    console.error('INTERNAL_API_KEY not configured');
+    return NextResponse.json(
+      { success: false, error: 'Server misconfiguration' },
+      { status: 500 }
+    );
+  }
+
+  // Verify API key using constant-time comparison
+  const authHeader = request.headers.get('authorization');
+  if (!authHeader || !authHeader.startsWith('Bearer ')) {
+    return NextResponse.json(
+      { success: false, error: 'Unauthorized' },
+      { status: 401 }
+    );
+  }
+
+  const providedKey = authHeader.slice(7);
+  const keyBuffer = Buffer.from(INTERNAL_API_KEY);
+  const providedBuffer = Buffer.from(providedKey);
+
+  if (keyBuffer.length !== providedBuffer.length || !crypto.timingSafeEqual(keyBuffer, providedBuffer)) {
+    return NextResponse.json(
+      { success: false, error: 'Unauthorized' },
+      { status: 401 }
+    );
+  }
+
+  let issues: any[];
+  try {
+    // Large batches arrive gzip-compressed
+    let raw = Buffer.from(await request.arrayBuffer());
+    if (request.headers.get('content-encoding') === 'gzip') {
+      raw = gunzipSync(raw);
+    }
+    issues = JSON.parse(raw.toString('utf-8')).issues;
+  } catch (error) {
+    console.error('Error parsing save-issues body:', error);
+    return NextResponse.json(
+      { success: false, error: 'Invalid request body' },
+      { status: 400 }
+    );
+  }
+
+  if (!Array.isArray(issues)) {
+    return NextResponse.json(
+      { success: false, error: 'Missing issues array' },
+      { status: 400 }
+    );
+  }
+
+  // Validate each item; invalid items are reported without failing the batch
+  const isValid = (body: any) =>
+    Boolean(body?.feedbackId && body.title && body.classification && body.severity);
+  const results: SaveIssueResult[] = issues.map((body) => ({
+    success: false,
+    error: 'Missing required fields',
+    feedbackId: body?.feedbackId,
+  }));
+  const valid = issues
+    .map((body, index) => ({ body, index }))
+    .filter(({ body }) => isValid(body));
+
+  try {
+    // Save every valid item in a single transaction
+    const saved = await prisma.$transaction(async (tx) => {
+      const created = [];
+      for (const { body } of valid) {
+        const feedback = await tx.feedbackItem.upsert({
+          where: { id: body.feedbackId },
+          update: {
+            status: 'completed',
+            classification: body.classification,
+            severity: body.severity,
+            processedAt: new Date(),
+          },
+          create: {
+            id: body.feedbackId,
+            content: body.content || '',
+            source: 'unknown',
+            status: 'completed',
+            classification: body.classification,
+            severity: body.severity,
+            processedAt: new Date(),
+          },
+        });
+
+        const issue = await tx.issue.create({
+          data: {
+            feedbackId: body.feedbackId,
+            title: body.title,
+            body: body.body,
+            classification: body.classification,
+            severity: body.severity,
+            reproductionSteps: body.reproductionSteps || [],
+            affectedComponents: body.affectedComponents || [],
+            acceptanceCriteria: body.acceptanceCriteria || [],
+            labels: body.labels || [body.classification, body.severity],
+            status: 'draft',
+          },
+        });
+
+        created.push({ feedback, issue });
+      }
+      return created;
+    });
+
+    saved.forEach(({ feedback, issue }, i) => {
+      results[valid[i].index] = { success: true, issueId: issue.id, feedbackId: feedback.id };
+    });
+  } catch (error) {
+    console.error('Error saving issues:', error);
+    return NextResponse.json(
+      { success: false, error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+
+  return NextResponse.json({ success: true, results });
+}
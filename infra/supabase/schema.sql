@@ -53,6 +53,8 @@ CREATE INDEX IF NOT EXISTS idx_feedback_items_created_at ON feedback_items(creat
 CREATE INDEX IF NOT EXISTS idx_feedback_items_embedding ON feedback_items USING ivfflat (embedding_vector vector_cosine_ops) WITH (lists = 100);
 
 CREATE INDEX IF NOT EXISTS idx_issues_status ON issues(status);
+-- Draft list: filter by status, newest first, paginated
+CREATE INDEX IF NOT EXISTS idx_issues_status_created ON issues(status, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_issues_severity ON issues(severity);
 CREATE INDEX IF NOT EXISTS idx_issues_created_at ON issues(created_at);
 CREATE INDEX IF NOT EXISTS idx_issues_feedback_id ON issues(feedback_id);